@@ -16,11 +16,35 @@ The arbitrator considers:
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+import asyncio
 import json
 import logging
+import numpy as np
 
 from .behavioral_voices import VoiceArgument, VoiceStrength
 from .deliberation_engine import DeliberationOption, DeliberationResult
+from .llm_cache import LLMResponseCache, cached_chat_completion
+
+
+def _weighted_arbitrate(weights: np.ndarray) -> Tuple[int, float]:
+    """
+    Find the strongest voice and how far ahead it is.
+    
+    Args:
+        weights: Final weight per voice
+        
+    Returns:
+        (index of the top voice, ratio of top weight to runner-up weight)
+    """
+    top = int(np.argmax(weights))
+    if weights.size < 2:
+        return top, float('inf')
+    
+    second = float(np.partition(weights, -2)[-2])
+    if second <= 0:
+        return top, float('inf') if weights[top] > 0 else 0.0
+    
+    return top, float(weights[top]) / second
 
 
 @dataclass
@@ -66,9 +90,10 @@ class DecisionArbitrator:
     and chooses the best course of action.
     """
     
-    def __init__(self, llm_client, persona: Dict[str, Any]):
+    def __init__(self, llm_client, persona: Dict[str, Any], llm_cache: Optional[LLMResponseCache] = None):
         self.llm_client = llm_client
         self.persona = persona
+        self.llm_cache = llm_cache
         self.logger = logging.getLogger(__name__)
         
         # Extract core decision-making principles from persona
@@ -202,30 +227,34 @@ class DecisionArbitrator:
                                  context: ArbitrationContext = None) -> List[Tuple[VoiceArgument, float]]:
         """Apply contextual weights to voice arguments"""
         
-        weighted_voices = []
+        # Base weight from decision principles
+        base_weights = np.array([
+            self.decision_principles.get(f"{arg.voice_name.lower()}_weight", 0.5)
+            for arg in voice_arguments
+        ])
         
-        for arg in voice_arguments:
-            # Base weight from decision principles
-            base_weight = self.decision_principles.get(f"{arg.voice_name.lower()}_weight", 0.5)
-            
-            # Urgency multiplier
-            urgency_multiplier = arg.urgency.value * self.decision_principles["urgency_sensitivity"]
-            
-            # Context adjustments
-            context_multiplier = 1.0
-            if context:
-                context_multiplier = self._calculate_context_multiplier(arg, context)
-            
-            # Final weight
-            final_weight = base_weight * (1 + urgency_multiplier) * context_multiplier
-            
-            weighted_voices.append((arg, final_weight))
-            
-            self.logger.debug(f"Voice '{arg.voice_name}': base={base_weight:.2f}, "
-                            f"urgency={urgency_multiplier:.2f}, context={context_multiplier:.2f}, "
-                            f"final={final_weight:.2f}")
+        # Urgency multiplier
+        urgency_multipliers = np.array([arg.urgency.value for arg in voice_arguments], dtype=float)
+        urgency_multipliers *= self.decision_principles["urgency_sensitivity"]
         
-        return weighted_voices
+        # Context adjustments
+        if context:
+            context_multipliers = np.array([
+                self._calculate_context_multiplier(arg, context) for arg in voice_arguments
+            ])
+        else:
+            context_multipliers = np.ones(len(voice_arguments))
+        
+        # Final weights for all voices at once
+        final_weights = base_weights * (1 + urgency_multipliers) * context_multipliers
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for i, arg in enumerate(voice_arguments):
+                self.logger.debug(f"Voice '{arg.voice_name}': base={base_weights[i]:.2f}, "
+                                f"urgency={urgency_multipliers[i]:.2f}, context={context_multipliers[i]:.2f}, "
+                                f"final={final_weights[i]:.2f}")
+        
+        return list(zip(voice_arguments, final_weights.tolist()))
     
     def _calculate_context_multiplier(self, 
                                     voice_arg: VoiceArgument,
@@ -270,16 +299,13 @@ class DecisionArbitrator:
         if not weighted_voices:
             return False
         
-        # Sort by weight
-        sorted_voices = sorted(weighted_voices, key=lambda x: x[1], reverse=True)
-        
         # Check if top voice is significantly stronger
-        top_weight = sorted_voices[0][1]
-        if len(sorted_voices) > 1:
-            second_weight = sorted_voices[1][1]
+        if len(weighted_voices) > 1:
+            weights = np.array([weight for _, weight in weighted_voices])
+            _, margin = _weighted_arbitrate(weights)
             
             # Clear consensus if top voice has >50% more weight
-            if top_weight > second_weight * 1.5:
+            if margin > 1.5:
                 return True
         
         # Check if multiple voices agree on similar action
@@ -339,17 +365,20 @@ class DecisionArbitrator:
         )
         
         try:
-            response = self.llm_client.chat.completions.create(
+            # The client is synchronous; run it in a worker thread so other
+            # coroutines (concurrent decisions, memory retrieval) keep running
+            content = await asyncio.to_thread(
+                cached_chat_completion,
+                self.llm_client,
                 model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are the executive decision-maker resolving conflicts between different aspects of personality. Be thoughtful and consider trade-offs."},
-                    {"role": "user", "content": arbitration_prompt}
-                ],
+                system="You are the executive decision-maker resolving conflicts between different aspects of personality. Be thoughtful and consider trade-offs.",
+                user=arbitration_prompt,
                 temperature=0.4,
+                cache=self.llm_cache,
                 response_format={"type": "json_object"}
             )
             
-            data = json.loads(response.choices[0].message.content)
+            data = json.loads(content)
             
             # Extract decision components
             final_decision = data.get("final_decision", "Unable to reach decision")
@@ -382,8 +411,8 @@ class DecisionArbitrator:
             self.logger.error(f"Failed to resolve conflicts: {e}")
             
             # Fallback to highest weighted voice
-            sorted_voices = sorted(weighted_voices, key=lambda x: x[1], reverse=True)
-            top_voice_arg, _ = sorted_voices[0]
+            top_index, _ = _weighted_arbitrate(np.array([weight for _, weight in weighted_voices]))
+            top_voice_arg, _ = weighted_voices[top_index]
             
             return ArbitrationResult(
                 final_decision=top_voice_arg.position,
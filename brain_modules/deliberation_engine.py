@@ -11,10 +11,13 @@ This makes the twin's reasoning more transparent and human-like.
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
+import asyncio
 import json
 import logging
 from enum import Enum
 
+from .llm_cache import LLMResponseCache, cached_chat_completion
+
 
 class DeliberationCriteria(Enum):
     """Criteria for evaluating options"""
@@ -99,9 +102,10 @@ class DeliberationEngine:
     4. Chooses the best option with clear reasoning
     """
     
-    def __init__(self, llm_client, persona: Dict[str, Any]):
+    def __init__(self, llm_client, persona: Dict[str, Any], llm_cache: Optional[LLMResponseCache] = None):
         self.llm_client = llm_client
         self.persona = persona
+        self.llm_cache = llm_cache
         self.logger = logging.getLogger(__name__)
         
         # Extract key decision weights from persona
@@ -176,17 +180,17 @@ class DeliberationEngine:
         prompt = self._build_option_generation_prompt(situation, context)
         
         try:
-            response = self.llm_client.chat.completions.create(
+            content = await asyncio.to_thread(
+                cached_chat_completion,
+                self.llm_client,
                 model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are generating multiple possible actions for a decision-making process. Be creative but realistic."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.8,  # Higher temperature for creativity
+                system="You are generating multiple possible actions for a decision-making process. Be creative but realistic.",
+                user=prompt,
+                temperature=0.8,  # Higher temperature for creativity; not cached, so repeats get fresh options
                 response_format={"type": "json_object"}
             )
             
-            data = json.loads(response.choices[0].message.content)
+            data = json.loads(content)
             
             # Convert to DeliberationOption objects
             options = []
@@ -273,17 +277,18 @@ Respond in JSON format:
             eval_prompt = self._build_evaluation_prompt(option, situation, context, current_state)
             
             try:
-                response = self.llm_client.chat.completions.create(
+                content = await asyncio.to_thread(
+                    cached_chat_completion,
+                    self.llm_client,
                     model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": "You are evaluating a decision option against multiple criteria. Be objective and consider trade-offs."},
-                        {"role": "user", "content": eval_prompt}
-                    ],
+                    system="You are evaluating a decision option against multiple criteria. Be objective and consider trade-offs.",
+                    user=eval_prompt,
                     temperature=0.3,  # Lower temperature for consistent evaluation
+                    cache=self.llm_cache,
                     response_format={"type": "json_object"}
                 )
                 
-                data = json.loads(response.choices[0].message.content)
+                data = json.loads(content)
                 
                 # Extract scores
                 scores = data.get('scores', {})
@@ -416,17 +421,16 @@ Respond in JSON:
         )
         
         try:
-            response = self.llm_client.chat.completions.create(
+            deliberation_reasoning = await asyncio.to_thread(
+                cached_chat_completion,
+                self.llm_client,
                 model="gpt-4o",
-                messages=[
-                    {"role": "system", "content": "You are explaining why a specific decision was made, considering all alternatives."},
-                    {"role": "user", "content": reasoning_prompt}
-                ],
-                temperature=0.4
+                system="You are explaining why a specific decision was made, considering all alternatives.",
+                user=reasoning_prompt,
+                temperature=0.4,
+                cache=self.llm_cache
             )
             
-            deliberation_reasoning = response.choices[0].message.content
-            
         except Exception as e:
             self.logger.error(f"Failed to generate decision reasoning: {e}")
             deliberation_reasoning = f"Chose {chosen_option.action} based on highest overall score of {chosen_option.total_score:.2f}"
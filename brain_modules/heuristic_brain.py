@@ -21,6 +21,10 @@ import re
 from enum import Enum
 
 
+# Situations mentioning these are routine enough for heuristic decisions
+ROUTINE_KEYWORDS_PATTERN = re.compile(r"email|meeting|call|task|reminder", re.IGNORECASE)
+
+
 class HeuristicType(Enum):
     """Types of heuristics"""
     TIME_BASED = "time_based"           # Based on time of day/week
@@ -294,14 +298,21 @@ class HeuristicBrain:
             return True
         
         # Use heuristics for routine patterns
-        routine_keywords = ["email", "meeting", "call", "task", "reminder"]
-        if any(keyword in situation.lower() for keyword in routine_keywords):
+        if ROUTINE_KEYWORDS_PATTERN.search(situation):
             return True
         
-        # Use heuristics if we have high-confidence patterns
-        matching_heuristics = self._find_matching_heuristics(situation, context)
-        if any(h.confidence > 0.8 and h.success_rate > 0.7 for h in matching_heuristics):
-            return True
+        # Use heuristics if we have high-confidence patterns. Only trusted
+        # rules can qualify, so skip condition matching when there are none.
+        trusted_heuristics = [
+            h for h in self.heuristics.values()
+            if h.confidence > 0.8 and h.success_rate > 0.7
+        ]
+        if trusted_heuristics:
+            situation_lower = situation.lower()
+            current_time = datetime.now()
+            if any(self._heuristic_matches(h, situation_lower, context, current_time)
+                   for h in trusted_heuristics):
+                return True
         
         # Don't use heuristics for complex or high-stakes situations
         complex_keywords = ["conflict", "important decision", "major", "strategic"]
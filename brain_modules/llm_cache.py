@@ -0,0 +1,391 @@
+"""
+LLM Response Cache for Digital Twin
+
+This module provides a small disk-backed cache for chat completions so that
+repeated prompts (introspection questions, recurring voice/arbitration
+situations) are replayed from disk instead of paying a network round-trip.
+
+Entries are keyed by SHA256(model | system_prompt | user_prompt | params), where
+params are the sampling temperature and any extra request options, and stored
+as gzipped JSON files under ~/.cache/digital_twin/ by default. Caching is
+opt-in per call site: only calls given a cache are replayed.
+
+All calls go through an exponential-backoff retry wrapper so transient rate
+limit and server errors do not fail a whole decision.
+
+It also provides an in-memory semantic cache that matches paraphrased
+situations by embedding similarity, so near-duplicate situations can reuse
+a previous response without running any reasoning path.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime, timedelta
+import gzip
+import hashlib
+import asyncio
+import json
+import logging
+import time
+import numpy as np
+
+try:
+    import openai
+    RETRYABLE_LLM_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+except ImportError:
+    RETRYABLE_LLM_ERRORS = ()
+
+logger = logging.getLogger(__name__)
+
+
+class EmptyLLMResponseError(Exception):
+    """Raised when the LLM returns no content"""
+    pass
+
+
+def call_with_retry(func: Callable[..., Any],
+                    *args,
+                    max_attempts: int = 6,
+                    min_wait: float = 1.0,
+                    max_wait: float = 60.0,
+                    **kwargs) -> Any:
+    """
+    Call an LLM client function, retrying transient failures with exponential backoff.
+
+    Rate limits, connection errors, 5xx responses and empty responses are
+    retried up to max_attempts times, waiting 1s, 2s, 4s, ... capped at
+    max_wait. Any other exception is raised immediately.
+
+    The waits block the calling thread; from a coroutine use
+    async_call_with_retry or run this via asyncio.to_thread.
+    """
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return func(*args, **kwargs)
+        except RETRYABLE_LLM_ERRORS + (EmptyLLMResponseError,) as e:
+            if attempt == max_attempts:
+                logger.error(f"LLM call failed after {max_attempts} attempts: {e}")
+                raise
+
+            wait = _backoff_wait(attempt, min_wait, max_wait)
+            logger.warning(f"LLM call failed ({e}), retrying in {wait:.0f}s "
+                           f"(attempt {attempt}/{max_attempts})")
+            time.sleep(wait)
+
+
+async def async_call_with_retry(func: Callable[..., Any],
+                                *args,
+                                max_attempts: int = 6,
+                                min_wait: float = 1.0,
+                                max_wait: float = 60.0,
+                                **kwargs) -> Any:
+    """Async version of call_with_retry for coroutine functions (e.g. AsyncOpenAI)"""
+
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await func(*args, **kwargs)
+        except RETRYABLE_LLM_ERRORS + (EmptyLLMResponseError,) as e:
+            if attempt == max_attempts:
+                logger.error(f"LLM call failed after {max_attempts} attempts: {e}")
+                raise
+
+            wait = _backoff_wait(attempt, min_wait, max_wait)
+            logger.warning(f"LLM call failed ({e}), retrying in {wait:.0f}s "
+                           f"(attempt {attempt}/{max_attempts})")
+            await asyncio.sleep(wait)
+
+
+def _backoff_wait(attempt: int, min_wait: float, max_wait: float) -> float:
+    """Exponential backoff delay before the next attempt"""
+    return min(max(min_wait * 2 ** (attempt - 1), min_wait), max_wait)
+
+
+class LLMResponseCache:
+    """
+    Disk cache for LLM chat completion text.
+
+    Each cached response lives in its own gzipped JSON file named after the
+    hash of the prompt, so concurrent twins can share one cache directory.
+    """
+
+    def __init__(self, cache_dir: str = "~/.cache/digital_twin"):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.logger = logging.getLogger(__name__)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.enabled = True
+        except OSError as e:
+            self.logger.warning(f"LLM cache disabled, cannot create {self.cache_dir}: {e}")
+            self.enabled = False
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, system: str, user: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a prompt and its request params (temperature, response_format, ...)"""
+        params_text = json.dumps(params or {}, sort_keys=True, default=str)
+        return hashlib.sha256(f"{model}|{system}|{user}|{params_text}".encode("utf-8")).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json.gz"
+
+    def get(self, model: str, system: str, user: str, params: Optional[Dict[str, Any]] = None) -> Optional[str]:
+        """Return the cached response text, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        path = self._path_for(self.make_key(model, system, user, params))
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable LLM cache entry {path.name}: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry.get('content')
+
+    def put(self, model: str, system: str, user: str, content: str, params: Optional[Dict[str, Any]] = None):
+        """Store response text for a prompt"""
+        if not self.enabled or content is None:
+            return
+
+        path = self._path_for(self.make_key(model, system, user, params))
+        entry = {
+            'model': model,
+            'content': content,
+            'cached_at': datetime.now().isoformat()
+        }
+
+        # Write to a temp file first so readers never see a partial entry
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                json.dump(entry, f)
+            tmp_path.replace(path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write LLM cache entry: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics"""
+        total = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'cache_dir': str(self.cache_dir),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total > 0 else 0.0
+        }
+
+
+def cached_chat_completion(llm_client,
+                           model: str,
+                           system: str,
+                           user: str,
+                           temperature: float,
+                           cache: Optional[LLMResponseCache] = None,
+                           **kwargs) -> str:
+    """
+    Run a chat completion, replaying it from the cache when possible.
+
+    Cache misses are sent with exponential-backoff retries; if every attempt
+    fails the last error is raised so callers can use their own fallback.
+
+    Args:
+        llm_client: OpenAI-compatible client
+        model: Model name
+        system: System prompt
+        user: User prompt
+        temperature: Sampling temperature
+        cache: Optional response cache; when None the call is made directly.
+            Leave it out for calls meant to sample varied output
+        **kwargs: Extra arguments for chat.completions.create (e.g. response_format)
+
+    Returns:
+        The response message content
+    """
+
+    params = {"temperature": temperature, **kwargs}
+    if cache is not None:
+        cached = cache.get(model, system, user, params)
+        if cached is not None:
+            return cached
+
+    def _complete() -> str:
+        response = llm_client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ],
+            temperature=temperature,
+            **kwargs
+        )
+        content = response.choices[0].message.content
+        if not content:
+            raise EmptyLLMResponseError(f"Empty response from {model}")
+        return content
+
+    content = call_with_retry(_complete)
+
+    if cache is not None:
+        cache.put(model, system, user, content, params)
+
+    return content
+
+
+def stream_chat_completion(llm_client,
+                           model: str,
+                           system: str,
+                           user: str,
+                           temperature: float,
+                           cache: Optional[LLMResponseCache] = None,
+                           **kwargs) -> Iterator[str]:
+    """
+    Stream a chat completion as text deltas, replaying it from the cache when possible.
+
+    A cached response is yielded as a single chunk. Otherwise the request is
+    opened with retries and deltas are yielded as they arrive; the complete
+    text is written to the cache once the stream finishes.
+
+    Args:
+        Same as cached_chat_completion
+
+    Yields:
+        Pieces of the response message content
+    """
+
+    params = {"temperature": temperature, **kwargs}
+    if cache is not None:
+        cached = cache.get(model, system, user, params)
+        if cached is not None:
+            yield cached
+            return
+
+    stream = call_with_retry(
+        llm_client.chat.completions.create,
+        model=model,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": user}
+        ],
+        temperature=temperature,
+        stream=True,
+        **kwargs
+    )
+
+    parts = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            yield delta
+
+    if cache is not None and parts:
+        cache.put(model, system, user, "".join(parts), params)
+
+
+class SemanticResponseCache:
+    """
+    In-memory similarity cache for twin responses.
+
+    Embeddings are L2-normalized and kept in one contiguous matrix, so a
+    lookup is a single inner-product scan (the same exact search a flat IP
+    index performs) followed by a category and age check on the best hit.
+    """
+
+    def __init__(self,
+                 similarity_threshold: float = 0.92,
+                 max_age: timedelta = timedelta(hours=24),
+                 max_entries: int = 1000):
+        self.similarity_threshold = similarity_threshold
+        self.max_age = max_age
+        self.max_entries = max_entries
+
+        self._vectors: Optional[np.ndarray] = None  # (N, d) float32, normalized
+        self._entries: List[Tuple[str, datetime, Any]] = []  # (category, created_at, value)
+
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _normalize(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _evict_expired(self, now: datetime):
+        """Drop entries older than max_age (entries are kept in insertion order)"""
+        cutoff = now - self.max_age
+        expired = 0
+        while expired < len(self._entries) and self._entries[expired][1] < cutoff:
+            expired += 1
+
+        if expired:
+            self._entries = self._entries[expired:]
+            self._vectors = self._vectors[expired:] if self._entries else None
+
+    def lookup(self, embedding, category: str) -> Optional[Any]:
+        """Return the cached value for the most similar same-category entry, if close enough"""
+        self._evict_expired(datetime.now())
+
+        query = self._normalize(embedding)
+        if self._vectors is None or self._vectors.shape[1] != query.shape[0]:
+            self.misses += 1
+            return None
+
+        scores = self._vectors @ query
+
+        # Only consider entries from the same situation category
+        category_mask = np.fromiter(
+            (entry[0] == category for entry in self._entries),
+            dtype=bool,
+            count=len(self._entries)
+        )
+        scores = np.where(category_mask, scores, -1.0)
+
+        best = int(np.argmax(scores))
+        if scores[best] > self.similarity_threshold:
+            self.hits += 1
+            return self._entries[best][2]
+
+        self.misses += 1
+        return None
+
+    def add(self, embedding, category: str, value: Any):
+        """Cache a value for a situation embedding"""
+        vector = self._normalize(embedding)[np.newaxis, :]
+
+        if self._vectors is None or self._vectors.shape[1] != vector.shape[1]:
+            self._vectors = vector
+            self._entries = []
+        else:
+            self._vectors = np.vstack([self._vectors, vector])
+
+        self._entries.append((category, datetime.now(), value))
+
+        # Bound memory by dropping the oldest entries
+        if len(self._entries) > self.max_entries:
+            overflow = len(self._entries) - self.max_entries
+            self._entries = self._entries[overflow:]
+            self._vectors = self._vectors[overflow:]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total > 0 else 0.0
+        }
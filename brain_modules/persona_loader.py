@@ -0,0 +1,72 @@
+"""
+Persona Loading for Digital Twin
+
+Parses persona files (YAML or JSON) once per file version. Twins are often
+constructed many times in one process (tests, request-scoped servers), so
+parsed personas are cached by (absolute path, mtime) and each caller gets
+its own copy.
+
+The fallback persona is a single read-only mapping shared by every twin.
+"""
+
+from typing import Any, Dict, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+import copy
+import json
+import os
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as PersonaYAMLLoader
+except ImportError:
+    from yaml import SafeLoader as PersonaYAMLLoader
+
+
+# Fallback persona when no persona file is found; read-only so twins can share it
+DEFAULT_PERSONA: Mapping[str, Any] = MappingProxyType({
+    "name": "Digital Twin",
+    "traits": ("analytical", "efficient", "friendly"),
+    "values": ("honesty", "growth", "connection"),
+    "communication_style": MappingProxyType({
+        "tone": "professional yet warm",
+        "brevity": "concise but thorough",
+        "formality": "adapts to context"
+    }),
+    "preferences": MappingProxyType({}),
+    "routines": MappingProxyType({})
+})
+
+
+def persona_json_default(obj: Any) -> Any:
+    """JSON `default` hook that serializes read-only mappings as objects and anything else as str"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+
+@lru_cache(maxsize=32)
+def _parse_persona(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a persona file; mtime is part of the cache key so edits are picked up"""
+    with open(path, 'r') as f:
+        if path.endswith('.json'):
+            return json.load(f)
+        return yaml.load(f, Loader=PersonaYAMLLoader)
+
+
+def load_persona(persona_path: str) -> Dict[str, Any]:
+    """
+    Load a persona configuration file.
+    
+    Args:
+        persona_path: Path to a .yaml/.yml or .json persona file
+        
+    Returns:
+        A private copy of the parsed persona
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    path = os.path.abspath(persona_path)
+    return copy.deepcopy(_parse_persona(path, os.path.getmtime(path)))
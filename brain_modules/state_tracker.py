@@ -140,6 +140,10 @@ class StateTracker:
         # Historical states
         self.state_history: List[StateSnapshot] = []
         
+        # Bumped on every state change so derived views can be cached
+        self.version = 0
+        self._decision_context_cache: Optional[Tuple[int, int, Dict[str, Any]]] = None
+        
         # Load previous states
         self._load_state_history()
     
@@ -227,6 +231,7 @@ class StateTracker:
             state_data['focus_level'] = FocusLevel(state_data['focus_level'])
         
         self.current_state = StateSnapshot(timestamp=current_time, **state_data)
+        self.version += 1
         
         # Save to storage
         self._save_state_history()
@@ -357,9 +362,20 @@ class StateTracker:
         return recommendations
     
     def get_decision_context(self) -> Dict[str, Any]:
-        """Get current state as context for decision-making"""
+        """
+        Get current state as context for decision-making.
         
-        return {
+        The context only changes when the state is updated or the hour rolls
+        over, so it is rebuilt at most once per (version, hour).
+        """
+        
+        hour = datetime.now().hour
+        if self._decision_context_cache is not None:
+            version, cached_hour, context = self._decision_context_cache
+            if version == self.version and cached_hour == hour:
+                return dict(context)
+        
+        context = {
             'current_energy': self.current_state.energy_level.value,
             'current_stress': self.current_state.stress_level.value,
             'current_mood': self.current_state.mood.value,
@@ -367,9 +383,12 @@ class StateTracker:
             'workload': self.current_state.workload,
             'deadline_pressure': self.current_state.deadline_pressure,
             'location': self.current_state.location,
-            'time_of_day': datetime.now().hour,
+            'time_of_day': hour,
             'recommendations': self.get_state_recommendations()
         }
+        self._decision_context_cache = (self.version, hour, context)
+        
+        return dict(context)
     
     def analyze_state_patterns(self, days: int = 7) -> Dict[str, Any]:
         """Analyze state patterns over recent days"""
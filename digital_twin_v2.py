@@ -13,21 +13,74 @@ This is the upgraded version of the digital twin with advanced reasoning capabil
 This creates a more human-like, adaptive reasoning system.
 """
 
-import yaml
+import asyncio
 import json
-from typing import Dict, List, Optional, Any, Union
+import random
+import re
+from collections import Counter, deque
+from functools import cached_property
+from itertools import islice
+from typing import Awaitable, Dict, Iterator, List, Optional, Any, Set, Union
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import openai
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
 # Import the brain modules
 from brain_modules.deliberation_engine import DeliberationEngine, DeliberationResult
 from brain_modules.behavioral_voices import VoiceOrchestrator, VoiceArgument
 from brain_modules.arbitrator import DecisionArbitrator, ArbitrationContext, ArbitrationResult
 from brain_modules.state_tracker import StateTracker, StateSnapshot
 from brain_modules.heuristic_brain import HeuristicBrain, HeuristicDecision
+from brain_modules.persona_loader import DEFAULT_PERSONA, load_persona, persona_json_default
+from brain_modules.llm_cache import (
+    LLMResponseCache, SemanticResponseCache, cached_chat_completion, stream_chat_completion
+)
+
+# Phrases that signal a situation needs multi-path deliberation, compiled once
+# into a single alternation so each situation is scanned in one pass
+COMPLEX_KEYWORDS = ["multiple options", "trade-off", "complex", "strategic", "important decision"]
+COMPLEX_KEYWORDS_PATTERN = re.compile("|".join(re.escape(k) for k in COMPLEX_KEYWORDS), re.IGNORECASE)
+
+# Number of decisions kept in memory for learning and insights
+DECISION_HISTORY_SIZE = 10000
+
+# Every MEMENTO_BLOCK_SIZE decisions are compressed into one memento; introspection
+# sees the mementos plus full detail for only the most recent decisions
+MEMENTO_BLOCK_SIZE = 100
+INTROSPECTION_RECENT_DECISIONS = 50
+
+# Token budget for the shuffled pattern/memento section of introspection prompts
+INTROSPECTION_CONTEXT_TOKENS = 4000
+
+INTROSPECTION_SYSTEM_PROMPT = "You are providing self-introspection for a digital twin, analyzing its own decision patterns and behaviors."
+
+
+def _serialize_decision(decision_log: Dict[str, Any]) -> bytes:
+    """Serialize a decision log entry to compact bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(decision_log, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(decision_log, default=str).encode('utf-8')
+
+
+def _deserialize_decision(data: bytes) -> Dict[str, Any]:
+    """Deserialize a decision log entry"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 @dataclass
@@ -93,58 +146,97 @@ class DigitalTwinV2:
     1. Heuristic: Fast decisions using learned patterns
     2. Deliberation: Multi-path thinking for complex decisions
     3. Arbitration: Voice-based conflict resolution
+    
+    The twin logs through the "digital_twin_v2" logger and does not configure
+    logging itself; call logging.basicConfig() at application entry to see it.
     """
     
     def __init__(self, persona_path: str = "persona.yaml", api_key: str = None):
         # Load identity layer
         self.persona = self._load_persona(persona_path)
         
+        # Persona is fixed after load, so serialize it once for introspection prompts
+        self._persona_json = json.dumps(self.persona, indent=2, default=persona_json_default)
+        
         # Initialize LLM client
         self.llm_client = openai.OpenAI(api_key=api_key)
         self.model = "gpt-4o"
         
-        # Initialize brain modules
+        # Shared on-disk response cache for all LLM reasoning paths
+        self.llm_cache = LLMResponseCache()
+        
+        # Similarity cache so paraphrased situations reuse a recent response
+        self.embedding_model = "text-embedding-3-small"
+        self.semantic_cache = SemanticResponseCache()
+        
+        # Initialize brain modules needed on every decision; the voice,
+        # arbitration and deliberation modules are built on first use
         self.state_tracker = StateTracker()
-        self.voice_orchestrator = VoiceOrchestrator(self.persona)
-        self.arbitrator = DecisionArbitrator(self.llm_client, self.persona)
-        self.deliberation_engine = DeliberationEngine(self.llm_client, self.persona)
         self.heuristic_brain = HeuristicBrain(self.persona)
         
         # Memory interface (will be injected)
         self.memory = None
         
-        # Decision history for learning
-        self.decision_history = []
+        # Decision history for learning, kept as serialized entries in a ring
+        # buffer. A parallel buffer of (mode, confidence, winning_voices)
+        # summaries feeds running counters so insights need no decoding.
+        self.decision_history = deque(maxlen=DECISION_HISTORY_SIZE)
+        self._decision_summaries = deque(maxlen=DECISION_HISTORY_SIZE)
+        self._mode_counts = Counter()
+        self._voice_counts = Counter()
+        self._confidence_sum = 0.0
+        
+        # Compressed summaries of older decision blocks for introspection
+        self._mementos = deque(maxlen=DECISION_HISTORY_SIZE // MEMENTO_BLOCK_SIZE)
+        self._decisions_since_memento = 0
+        self._memento_tasks: Set[asyncio.Task] = set()
         
-        # Logging
+        # Tokenizer for introspection budgets, loaded on first use
+        self._token_encoding = None
+        
+        # Logging (handlers and levels are configured by the application)
         self.logger = logging.getLogger(__name__)
-        logging.basicConfig(level=logging.INFO)
         
         self.logger.info("Enhanced Digital Twin V2 initialized")
     
+    @cached_property
+    def voice_orchestrator(self) -> VoiceOrchestrator:
+        """Behavioral voices, created on the first arbitration"""
+        return VoiceOrchestrator(self.persona)
+    
+    @cached_property
+    def arbitrator(self) -> DecisionArbitrator:
+        """Voice arbitrator, created on the first arbitration"""
+        return DecisionArbitrator(self.llm_client, self.persona, llm_cache=self.llm_cache)
+    
+    @cached_property
+    def deliberation_engine(self) -> DeliberationEngine:
+        """Deliberation engine, created on the first deliberation"""
+        return DeliberationEngine(self.llm_client, self.persona, llm_cache=self.llm_cache)
+    
     def _load_persona(self, persona_path: str) -> Dict[str, Any]:
         """Load persona configuration from YAML file"""
         try:
-            with open(persona_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_persona(persona_path)
         except FileNotFoundError:
             print(f"Warning: {persona_path} not found. Using default persona.")
             return self._default_persona()
     
     def _default_persona(self) -> Dict[str, Any]:
-        """Fallback persona if config not found"""
-        return {
-            "name": "Digital Twin",
-            "traits": ["analytical", "efficient", "friendly"],
-            "values": ["honesty", "growth", "connection"],
-            "communication_style": {
-                "tone": "professional yet warm",
-                "brevity": "concise but thorough",
-                "formality": "adapts to context"
-            },
-            "preferences": {},
-            "routines": {}
-        }
+        """Fallback persona if config not found (shared and read-only)"""
+        return DEFAULT_PERSONA
+    
+    def _cached_chat(self, system: str, user: str, temperature: float, **kwargs) -> str:
+        """Run a chat completion through the shared response cache"""
+        return cached_chat_completion(
+            self.llm_client,
+            model=self.model,
+            system=system,
+            user=user,
+            temperature=temperature,
+            cache=self.llm_cache,
+            **kwargs
+        )
     
     def set_memory_interface(self, memory_interface):
         """Inject memory system"""
@@ -175,18 +267,62 @@ class DigitalTwinV2:
         # Determine reasoning mode
         reasoning_mode = self._choose_reasoning_mode(situation, current_state)
         
-        self.logger.info(f"Using {reasoning_mode} reasoning for: {situation.context[:50]}...")
+        # Reuse a recent response if this situation is a near-duplicate. The
+        # heuristic path is cheaper than the embedding round-trip, so it skips
+        # the semantic cache; the embedding call runs off the event loop
+        situation_embedding = None
+        if reasoning_mode != "heuristic":
+            situation_embedding = await asyncio.to_thread(self._embed_situation, situation)
+        if situation_embedding is not None:
+            cached_response = self.semantic_cache.lookup(situation_embedding, situation.category)
+            if cached_response is not None:
+                self.logger.info(f"Using cached response for: {situation.context[:50]}...")
+                response = replace(cached_response, reasoning_mode="cache")
+                self._log_decision(situation, response)
+                return response
+        
+        # Start memory retrieval once per decision; it runs in a worker thread
+        # while the chosen reasoning path does its own work
+        memories = asyncio.ensure_future(self._retrieve_memories_async(situation))
         
-        # Route to appropriate reasoning system
-        if reasoning_mode == "heuristic":
-            return await self._reason_heuristic(situation, current_state)
-        elif reasoning_mode == "deliberation":
-            return await self._reason_deliberation(situation, current_state)
-        elif reasoning_mode == "arbitration":
-            return await self._reason_arbitration(situation, current_state)
-        else:
-            # Fallback to arbitration
-            return await self._reason_arbitration(situation, current_state)
+        try:
+            self.logger.info(f"Using {reasoning_mode} reasoning for: {situation.context[:50]}...")
+            
+            # Route to appropriate reasoning system
+            if reasoning_mode == "heuristic":
+                response = await self._reason_heuristic(situation, current_state, memories)
+            elif reasoning_mode == "deliberation":
+                response = await self._reason_deliberation(situation, current_state, memories)
+            elif reasoning_mode == "arbitration":
+                response = await self._reason_arbitration(situation, current_state, memories)
+            else:
+                # Fallback to arbitration
+                response = await self._reason_arbitration(situation, current_state, memories)
+        finally:
+            if not memories.done():
+                memories.cancel()
+        
+        if situation_embedding is not None:
+            self.semantic_cache.add(situation_embedding, situation.category, response)
+        
+        return response
+    
+    def _embed_situation(self, situation: Situation) -> Optional[List[float]]:
+        """
+        Embed the situation context for the semantic response cache.
+        
+        Best effort: a single attempt with no retries, since a failed lookup
+        only means reasoning runs uncached.
+        """
+        try:
+            response = self.llm_client.embeddings.create(
+                model=self.embedding_model,
+                input=situation.context
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            self.logger.debug(f"Skipping semantic cache, embedding failed: {e}")
+            return None
     
     def _choose_reasoning_mode(self, situation: Situation, current_state: Dict[str, Any]) -> str:
         """Choose the most appropriate reasoning mode"""
@@ -204,14 +340,16 @@ class DigitalTwinV2:
             return "heuristic"
         
         # Check for complex situations that need deliberation
-        complex_keywords = ["multiple options", "trade-off", "complex", "strategic", "important decision"]
-        if any(keyword in situation.context.lower() for keyword in complex_keywords):
+        if COMPLEX_KEYWORDS_PATTERN.search(situation.context):
             return "deliberation"
         
         # Default to voice arbitration for most situations
         return "arbitration"
     
-    async def _reason_heuristic(self, situation: Situation, current_state: Dict[str, Any]) -> TwinResponse:
+    async def _reason_heuristic(self,
+                                situation: Situation,
+                                current_state: Dict[str, Any],
+                                memories: Awaitable[List[Dict[str, Any]]]) -> TwinResponse:
         """Fast reasoning using learned heuristics"""
         
         heuristic_decision = self.heuristic_brain.make_heuristic_decision(
@@ -221,10 +359,10 @@ class DigitalTwinV2:
         
         if not heuristic_decision:
             # Fall back to arbitration if no heuristic matches
-            return await self._reason_arbitration(situation, current_state)
+            return await self._reason_arbitration(situation, current_state, memories)
         
-        # Retrieve relevant memories if available
-        memories = self._retrieve_memories(situation) if self.memory else []
+        # Memories retrieved in parallel by reason()
+        memories = await memories
         
         response = TwinResponse(
             action=heuristic_decision.action,
@@ -240,7 +378,10 @@ class DigitalTwinV2:
         self._log_decision(situation, response)
         return response
     
-    async def _reason_deliberation(self, situation: Situation, current_state: Dict[str, Any]) -> TwinResponse:
+    async def _reason_deliberation(self,
+                                   situation: Situation,
+                                   current_state: Dict[str, Any],
+                                   memories: Awaitable[List[Dict[str, Any]]]) -> TwinResponse:
         """Deep deliberation with multiple options"""
         
         # Convert current state to deliberation context
@@ -258,8 +399,8 @@ class DigitalTwinV2:
             current_state
         )
         
-        # Retrieve relevant memories
-        memories = self._retrieve_memories(situation) if self.memory else []
+        # Memories retrieved in parallel by reason()
+        memories = await memories
         
         response = TwinResponse(
             action=deliberation_result.chosen_option.action,
@@ -275,7 +416,10 @@ class DigitalTwinV2:
         self._log_decision(situation, response)
         return response
     
-    async def _reason_arbitration(self, situation: Situation, current_state: Dict[str, Any]) -> TwinResponse:
+    async def _reason_arbitration(self,
+                                  situation: Situation,
+                                  current_state: Dict[str, Any],
+                                  memories: Awaitable[List[Dict[str, Any]]]) -> TwinResponse:
         """Voice-based reasoning with conflict resolution"""
         
         # Get arguments from all behavioral voices
@@ -300,8 +444,8 @@ class DigitalTwinV2:
             arbitration_context
         )
         
-        # Retrieve relevant memories
-        memories = self._retrieve_memories(situation) if self.memory else []
+        # Memories retrieved in parallel by reason()
+        memories = await memories
         
         response = TwinResponse(
             action=arbitration_result.final_decision,
@@ -319,6 +463,12 @@ class DigitalTwinV2:
         self._log_decision(situation, response)
         return response
     
+    async def _retrieve_memories_async(self, situation: Situation) -> List[Dict[str, Any]]:
+        """Retrieve memories in a worker thread so the vector search does not block reasoning"""
+        if not self.memory:
+            return []
+        return await asyncio.to_thread(self._retrieve_memories, situation)
+    
     def _retrieve_memories(self, situation: Situation, k: int = 5) -> List[Dict[str, Any]]:
         """Retrieve relevant memories from vector DB"""
         if not self.memory:
@@ -344,6 +494,7 @@ class DigitalTwinV2:
         """Log decision for learning and analysis"""
         decision_log = {
             "timestamp": situation.timestamp.isoformat(),
+            "timestamp_epoch": situation.timestamp.timestamp(),
             "situation": {
                 "context": situation.context,
                 "category": situation.category,
@@ -351,7 +502,144 @@ class DigitalTwinV2:
             },
             "response": response.to_dict()
         }
-        self.decision_history.append(decision_log)
+        self.decision_history.append(_serialize_decision(decision_log))
+        
+        # Keep running stats in step with the ring buffer
+        if len(self._decision_summaries) == self._decision_summaries.maxlen:
+            old_mode, old_confidence, old_voices = self._decision_summaries.popleft()
+            self._mode_counts[old_mode] -= 1
+            self._confidence_sum -= old_confidence
+            self._voice_counts.subtract(old_voices)
+        
+        winning_voices = []
+        if response.reasoning_mode == 'arbitration' and response.arbitration_result:
+            winning_voices = list(response.arbitration_result.winning_voices)
+        
+        self._decision_summaries.append((response.reasoning_mode, response.confidence, winning_voices))
+        self._mode_counts[response.reasoning_mode] += 1
+        self._confidence_sum += response.confidence
+        self._voice_counts.update(winning_voices)
+        
+        self._decisions_since_memento += 1
+        if self._decisions_since_memento >= MEMENTO_BLOCK_SIZE:
+            self._schedule_memento()
+            self._decisions_since_memento = 0
+    
+    def _schedule_memento(self):
+        """
+        Summarize the latest block of decisions without blocking reasoning.
+        
+        The block is taken now; the summarization call runs in a worker
+        thread when an event loop is running, inline otherwise.
+        """
+        block = self._recent_decisions(MEMENTO_BLOCK_SIZE)
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._create_memento(block)
+            return
+        
+        task = loop.create_task(asyncio.to_thread(self._create_memento, block))
+        self._memento_tasks.add(task)
+        task.add_done_callback(self._memento_tasks.discard)
+    
+    def _recent_decisions(self, n: int) -> List[Dict[str, Any]]:
+        """Decode the last n decisions, oldest first"""
+        recent = [_deserialize_decision(entry) for entry in islice(reversed(self.decision_history), n)]
+        recent.reverse()
+        return recent
+    
+    @staticmethod
+    def _format_decision_line(decision: Dict[str, Any]) -> str:
+        """One-line summary of a logged decision"""
+        response = decision['response']
+        return (f"[{decision['timestamp']}] {decision['situation']['category']}: "
+                f"{decision['situation']['context'][:100]} -> {response['action'][:100]} "
+                f"({response['reasoning_mode']}, confidence {response['confidence']:.2f})")
+    
+    def _count_tokens(self, text: str) -> int:
+        """Count prompt tokens, estimating ~4 characters per token without tiktoken"""
+        if TIKTOKEN_AVAILABLE:
+            if self._token_encoding is None:
+                try:
+                    self._token_encoding = tiktoken.encoding_for_model(self.model)
+                except KeyError:
+                    self._token_encoding = tiktoken.get_encoding("cl100k_base")
+            return len(self._token_encoding.encode(text))
+        return len(text) // 4 + 1
+    
+    def _build_introspection_context(self, insights: Dict[str, Any], question: str) -> str:
+        """
+        Shuffle insight sections and mementos, then truncate them to the token budget.
+        
+        A fixed order makes the model over-weight whatever comes first, so the
+        chunks are shuffled. The seed depends on the question and history size,
+        which keeps repeated identical introspections cacheable.
+        """
+        
+        chunks = [f"{key}: {json.dumps(value, default=str)}" for key, value in insights.items()]
+        chunks.extend(f"memento: {memento}" for memento in self._mementos)
+        
+        random.Random(f"{question}|{len(self.decision_history)}").shuffle(chunks)
+        
+        selected = []
+        used_tokens = 0
+        for chunk in chunks:
+            chunk_tokens = self._count_tokens(chunk)
+            if used_tokens + chunk_tokens > INTROSPECTION_CONTEXT_TOKENS:
+                continue
+            selected.append(chunk)
+            used_tokens += chunk_tokens
+        
+        if len(selected) < len(chunks):
+            self.logger.debug(f"Introspection context truncated to {len(selected)}/{len(chunks)} chunks")
+        
+        return "\n".join(selected) or "None yet"
+    
+    def _create_memento(self, block: List[Dict[str, Any]]):
+        """Compress a block of decisions into a compact memento"""
+        
+        if not block:
+            return
+        
+        mode_counts = Counter(d['response']['reasoning_mode'] for d in block)
+        voice_counts = Counter(
+            voice
+            for d in block
+            for voice in ((d['response'].get('arbitration_result') or {}).get('winning_voices') or [])
+        )
+        
+        memento_prompt = f"""
+        Summarize this block of {len(block)} decisions made by a digital twin into a compact JSON memento.
+        Include: period, reasoning_mode_distribution, top_winning_voices, recurring_situations,
+        and notable_outliers (unusual actions or very low/high confidence). Keep it under 150 words.
+        
+        Mode counts: {dict(mode_counts)}
+        Winning voices: {dict(voice_counts)}
+        
+        DECISIONS:
+        {chr(10).join(self._format_decision_line(d) for d in block)}
+        """
+        
+        try:
+            memento = self._cached_chat(
+                system="You compress decision logs into short, factual JSON summaries.",
+                user=memento_prompt,
+                temperature=0.2,
+                response_format={"type": "json_object"}
+            )
+        except Exception as e:
+            # Keep the statistics even when the summarization call fails
+            self.logger.warning(f"Memento summarization failed, storing statistics only: {e}")
+            memento = json.dumps({
+                "period": f"{block[0]['timestamp']} to {block[-1]['timestamp']}",
+                "reasoning_mode_distribution": dict(mode_counts),
+                "top_winning_voices": dict(voice_counts.most_common(3)),
+                "average_confidence": round(sum(d['response']['confidence'] for d in block) / len(block), 3)
+            })
+        
+        self._mementos.append(memento)
     
     def learn_from_feedback(self, 
                            situation: Situation, 
@@ -370,9 +658,11 @@ class DigitalTwinV2:
         
         # Find the corresponding prediction in history
         recent_decision = None
-        for decision in reversed(self.decision_history):
+        situation_epoch = situation.timestamp.timestamp()
+        for entry in reversed(self.decision_history):
+            decision = _deserialize_decision(entry)
             if (decision['situation']['context'] == situation.context and
-                abs((datetime.fromisoformat(decision['timestamp']) - situation.timestamp).total_seconds()) < 300):
+                abs(decision['timestamp_epoch'] - situation_epoch) < 300):
                 recent_decision = decision
                 break
         
@@ -426,62 +716,45 @@ class DigitalTwinV2:
         if not self.decision_history:
             return {"message": "No decision history available"}
         
+        # Mode, confidence and voice stats come from the running counters
+        # maintained by _log_decision, so no history entry is decoded here
         insights = {
             "total_decisions": len(self.decision_history),
-            "reasoning_mode_distribution": {},
-            "average_confidence": 0.0,
+            "reasoning_mode_distribution": {mode: count for mode, count in self._mode_counts.items() if count > 0},
+            "average_confidence": self._confidence_sum / len(self._decision_summaries),
             "state_patterns": {},
-            "voice_influence": {},
+            "voice_influence": {voice: count for voice, count in self._voice_counts.most_common() if count > 0},
             "heuristic_stats": self.heuristic_brain.get_heuristic_stats(),
             "arbitration_patterns": self.arbitrator.get_decision_patterns()
         }
         
-        # Analyze reasoning modes
-        mode_counts = {}
-        confidence_sum = 0
-        
-        for decision in self.decision_history:
-            mode = decision['response']['reasoning_mode']
-            mode_counts[mode] = mode_counts.get(mode, 0) + 1
-            confidence_sum += decision['response']['confidence']
-        
-        insights["reasoning_mode_distribution"] = mode_counts
-        insights["average_confidence"] = confidence_sum / len(self.decision_history)
-        
-        # Analyze voice influence in arbitration decisions
-        voice_counts = {}
-        for decision in self.decision_history:
-            if decision['response']['reasoning_mode'] == 'arbitration':
-                arb_result = decision['response'].get('arbitration_result', {})
-                winning_voices = arb_result.get('winning_voices', [])
-                for voice in winning_voices:
-                    voice_counts[voice] = voice_counts.get(voice, 0) + 1
-        
-        insights["voice_influence"] = dict(sorted(voice_counts.items(), key=lambda x: x[1], reverse=True))
-        
         return insights
     
-    def introspect(self, question: str) -> str:
-        """
-        Allow the twin to introspect about its own decision-making.
-        
-        Examples:
-        - "Why do I usually prioritize efficiency over wellbeing?"
-        - "What patterns do you see in my decision making?"
-        - "How do I handle stress differently than normal situations?"
-        """
+    def _build_introspection_prompt(self, question: str) -> str:
+        """Build the introspection prompt from insights, mementos and current state"""
         
         insights = self.get_reasoning_insights()
         current_state = self.get_current_state()
         
+        # Older history is only seen through mementos, so the prompt size
+        # does not grow with the number of decisions
+        pattern_context = self._build_introspection_context(insights, question)
+        recent_decisions = "\n".join(
+            self._format_decision_line(d)
+            for d in self._recent_decisions(INTROSPECTION_RECENT_DECISIONS)
+        ) or "None yet"
+        
         introspection_prompt = f"""
         I am a digital twin analyzing my own decision-making patterns. Here's my data:
         
         PERSONA:
-        {json.dumps(self.persona, indent=2)}
+        {self._persona_json}
+        
+        DECISION PATTERNS AND EARLIER MEMENTOS (unordered):
+        {pattern_context}
         
-        RECENT DECISION PATTERNS:
-        {json.dumps(insights, indent=2)}
+        MOST RECENT DECISIONS:
+        {recent_decisions}
         
         CURRENT STATE:
         {json.dumps(current_state, indent=2)}
@@ -491,19 +764,50 @@ class DigitalTwinV2:
         Analyze this question about my decision-making patterns and provide insights as if you are me reflecting on my own behavior. Be thoughtful, specific, and reference the actual data when possible.
         """
         
+        return introspection_prompt
+    
+    def introspect(self, question: str) -> str:
+        """
+        Allow the twin to introspect about its own decision-making.
+        
+        Examples:
+        - "Why do I usually prioritize efficiency over wellbeing?"
+        - "What patterns do you see in my decision making?"
+        - "How do I handle stress differently than normal situations?"
+        """
+        
         try:
-            response = self.llm_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are providing self-introspection for a digital twin, analyzing its own decision patterns and behaviors."},
-                    {"role": "user", "content": introspection_prompt}
-                ],
+            return self._cached_chat(
+                system=INTROSPECTION_SYSTEM_PROMPT,
+                user=self._build_introspection_prompt(question),
                 temperature=0.6
             )
-            return response.choices[0].message.content
         except Exception as e:
+            self.logger.error(f"Introspection produced no output: {e}")
             return f"Unable to introspect: {str(e)}"
     
+    def introspect_stream(self, question: str) -> Iterator[str]:
+        """
+        Stream an introspection answer piece by piece.
+        
+        Same as introspect(), but yields text as the model generates it so a
+        UI can render the first words immediately. The full answer is cached
+        once the stream completes.
+        """
+        
+        try:
+            yield from stream_chat_completion(
+                self.llm_client,
+                model=self.model,
+                system=INTROSPECTION_SYSTEM_PROMPT,
+                user=self._build_introspection_prompt(question),
+                temperature=0.6,
+                cache=self.llm_cache
+            )
+        except Exception as e:
+            self.logger.error(f"Introspection stream produced no output: {e}")
+            yield f"Unable to introspect: {str(e)}"
+    
     def shadow_mode(self, enabled: bool = True):
         """Enable shadow mode where the twin observes but doesn't act"""
         self.is_shadow_mode = enabled
@@ -526,6 +830,8 @@ class DigitalTwinV2:
             "arbitrator": {
                 "total_arbitrations": len(self.arbitrator.decision_history)
             },
+            "llm_cache": self.llm_cache.get_stats(),
+            "semantic_cache": self.semantic_cache.get_stats(),
             "overall": {
                 "total_decisions": len(self.decision_history),
                 "memory_connected": self.memory is not None
@@ -11,28 +11,170 @@ This is the complete digital twin with:
 This creates a truly persistent, learning digital self.
 """
 
-import yaml
+import asyncio
+import heapq
 import json
 import os
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
-from dataclasses import dataclass
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, timezone
+from dataclasses import dataclass, field
+import numpy as np
 import openai
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Import the brain modules
 from brain_modules.deliberation_engine import DeliberationEngine, DeliberationResult
 from brain_modules.behavioral_voices import VoiceOrchestrator, VoiceArgument
 from brain_modules.arbitrator import DecisionArbitrator, ArbitrationContext, ArbitrationResult
 from brain_modules.state_tracker import StateTracker, StateSnapshot
 from brain_modules.heuristic_brain import HeuristicBrain, HeuristicDecision
+from brain_modules.persona_loader import DEFAULT_PERSONA, load_persona, persona_json_default
+from brain_modules.llm_cache import EmptyLLMResponseError, async_call_with_retry
 
 # Import the memory system
 from memory_system.episodic_memory import EpisodicMemorySystem
 from memory_system.vector_memory import EnhancedVectorMemory
 from memory_system.memory_updater import MemoryUpdater
-from memory_system.memory_retrieval import IntelligentMemoryRetrieval, RetrievalContext
+from memory_system.memory_retrieval import IntelligentMemoryRetrieval, RetrievalContext, MEMORY_KEYWORDS
+from memory_system.similarity_cache import SimLRUCache, hashed_text_embedding
+
+# Phrases that signal a situation needs multi-path deliberation, compiled once
+COMPLEX_KEYWORDS = ["multiple options", "trade-off", "complex", "strategic", "important decision"]
+COMPLEX_KEYWORDS_PATTERN = re.compile("|".join(re.escape(k) for k in COMPLEX_KEYWORDS), re.IGNORECASE)
+
+# With pyahocorasick installed the keywords are matched by a single automaton
+# pass over the text, independent of how many keywords there are
+if AHOCORASICK_AVAILABLE:
+    COMPLEX_KEYWORDS_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in COMPLEX_KEYWORDS:
+        COMPLEX_KEYWORDS_AUTOMATON.add_word(_keyword, _keyword)
+    COMPLEX_KEYWORDS_AUTOMATON.make_automaton()
+else:
+    COMPLEX_KEYWORDS_AUTOMATON = None
+
+
+def _mentions_complex_keyword(text: str) -> bool:
+    """Whether text contains any of COMPLEX_KEYWORDS (case-insensitive)"""
+    if COMPLEX_KEYWORDS_AUTOMATON is not None:
+        return next(COMPLEX_KEYWORDS_AUTOMATON.iter(text.lower()), None) is not None
+    return COMPLEX_KEYWORDS_PATTERN.search(text) is not None
+
+
+# Large collections in introspection data (people, months, ...) are cut to
+# this many entries before they are sent to the LLM
+INTROSPECTION_MAX_ITEMS = 20
+
+
+def _truncate_for_prompt(value: Any, max_items: int = INTROSPECTION_MAX_ITEMS) -> Any:
+    """
+    Recursively cap dicts and lists at max_items entries.
+    
+    Count dicts (all-numeric values) keep their largest entries; other
+    dicts and lists keep their first entries.
+    """
+    if isinstance(value, dict):
+        items = list(value.items())
+        if len(items) > max_items:
+            if all(isinstance(v, (int, float)) for _, v in items):
+                items = heapq.nlargest(max_items, items, key=lambda item: item[1])
+            else:
+                items = items[:max_items]
+        return {k: _truncate_for_prompt(v, max_items) for k, v in items}
+    if isinstance(value, (list, tuple)):
+        return [_truncate_for_prompt(v, max_items) for v in value[:max_items]]
+    return value
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib json fallback: datetimes as ISO strings (as orjson emits them), else persona_json_default"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return persona_json_default(obj)
+
+
+def _dumps_compact(data: Any) -> str:
+    """Serialize data to compact JSON text (no indentation, unknown types via str)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=persona_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode('utf-8')
+    return json.dumps(data, default=_json_default, separators=(',', ':'))
+
+
+def _dumps_bytes(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes, for writing straight to binary files"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=persona_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(data, default=_json_default, separators=(',', ':')).encode('utf-8')
+
+
+class _SerializedRecords(list):
+    """List of already-encoded JSON records, spliced into exports as raw bytes"""
+
+
+def _records_array_bytes(records: List[bytes]) -> bytes:
+    """JSON array of already-encoded records, one per line"""
+    if not records:
+        return b"[\n]"
+    return b"[\n  " + b",\n  ".join(records) + b"\n]"
+
+
+def load_sharded_export(manifest_path: str) -> Dict[str, Any]:
+    """
+    Read an export written with export_memories(shards=N).
+    
+    Returns:
+        The export in single-document form, with the shards concatenated
+        back into "episodic_memories"
+    """
+    
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    base_dir = os.path.dirname(manifest_path)
+    
+    with open(manifest_path, 'rb') as f:
+        export = loads(f.read())
+    
+    episodic = []
+    for shard in export.pop("episodic_shards", []):
+        with open(os.path.join(base_dir, shard["file"]), 'rb') as f:
+            episodic.extend(loads(f.read()))
+    
+    export["episodic_memories"] = episodic
+    return export
+
+
+def _episodic_export_record(memory) -> Any:
+    """
+    Export form of an episodic memory.
+    
+    orjson serializes the dataclass directly (enums as values, datetimes as
+    ISO strings), producing the same bytes as to_dict() without building an
+    intermediate dict per memory.
+    """
+    return memory if ORJSON_AVAILABLE else memory.to_dict()
 
 
 @dataclass
@@ -42,10 +184,14 @@ class Situation:
     category: str  # email, schedule_conflict, task, social, etc.
     metadata: Dict[str, Any] = None  # Additional context like sender, urgency, etc.
     timestamp: datetime = None
+    timestamp_us: int = field(init=False, repr=False)  # Epoch microseconds, for integer time comparisons
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now()
+            self.timestamp_us = time.time_ns() // 1000
+            self.timestamp = datetime.fromtimestamp(self.timestamp_us / 1_000_000)
+        else:
+            self.timestamp_us = int(self.timestamp.timestamp() * 1_000_000)
         if self.metadata is None:
             self.metadata = {}
 
@@ -76,8 +222,27 @@ class TwinResponse:
     # State considerations
     state_considerations: Dict[str, Any] = None
     
+    # Memoized to_dict() result, dropped whenever a field is reassigned
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name != '_dict_cache':
+            object.__setattr__(self, '_dict_cache', None)
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage/analysis"""
+        """
+        Convert to dictionary for storage/analysis.
+        
+        The nested conversion runs once per response state; later calls return
+        a shallow copy of the memoized result. In-place edits to list or dict
+        fields are not tracked, so reassign a field to change it.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return dict(self._dict_cache)
+    
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             'action': self.action,
             'reasoning': self.reasoning,
@@ -107,6 +272,9 @@ class DigitalTwinV3:
     4. Retrieves relevant memories for context-aware decisions
     5. Extracts patterns automatically from experience
     6. Provides introspection and self-analysis
+    
+    Logging is left to the embedding application: the twin only writes to
+    the "digital_twin_v3" logger and never installs handlers.
     """
     
     def __init__(self, 
@@ -117,63 +285,103 @@ class DigitalTwinV3:
         # Load identity layer
         self.persona = self._load_persona(persona_path)
         
-        # Initialize LLM client
+        # Initialize LLM clients: the brain modules use the sync client, while
+        # introspection awaits the async one so several questions can run at once
         self.llm_client = openai.OpenAI(api_key=api_key)
+        self.async_llm_client = openai.AsyncOpenAI(api_key=api_key)
         self.model = "gpt-4o"
         
-        # Initialize brain modules
+        # Caps concurrent introspection requests (e.g. from introspect_batch)
+        self.max_concurrent_llm_calls = 8
+        self._llm_semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
+        
+        # Initialize brain modules; the reasoning engines and memory system
+        # are created on first use (see the cached properties below)
         self.state_tracker = StateTracker()
-        self.voice_orchestrator = VoiceOrchestrator(self.persona)
-        self.arbitrator = DecisionArbitrator(self.llm_client, self.persona)
-        self.deliberation_engine = DeliberationEngine(self.llm_client, self.persona)
-        self.heuristic_brain = HeuristicBrain(self.persona)
-        
-        # Initialize memory system
-        self.episodic_memory = EpisodicMemorySystem(storage_dir=f"{memory_dir}/episodic")
-        self.vector_memory = EnhancedVectorMemory(
-            storage_dir=f"{memory_dir}/vector",
-            openai_api_key=api_key
-        )
+        self.api_key = api_key
+        self.memory_dir = memory_dir
         
-        # Initialize memory management
-        self.memory_updater = MemoryUpdater(self.episodic_memory, self.vector_memory)
-        self.memory_retrieval = IntelligentMemoryRetrieval(self.episodic_memory, self.vector_memory)
+        # Near-duplicate situations reuse the previous memory context
+        self.memory_context_cache = SimLRUCache(capacity=512, threshold=0.95)
         
-        # Decision history for this session
+        # Decision history for this session. Timestamps (epoch microseconds)
+        # and context hashes are mirrored into contiguous arrays so feedback
+        # lookup is a vectorized scan instead of a Python loop.
         self.session_decisions = []
+        self._sd_timestamps = np.empty(64, dtype=np.int64)
+        self._sd_ctx_hashes = np.empty(64, dtype=np.uint64)
+        
+        # (context hash, epoch minute) -> index of the newest decision whose
+        # feedback window covers that minute; minutes behind the window are
+        # pruned once a decision is recorded in a later minute
+        self._decision_index: Dict[Tuple[int, int], int] = {}
+        self._decision_index_minute = 0
+        
+        # Serialized export records per memory store, as (store version, records)
+        self._export_records: Dict[str, Tuple[int, List[bytes]]] = {}
         
         # Logging
         self.logger = logging.getLogger(__name__)
-        logging.basicConfig(level=logging.INFO)
         
         self.logger.info("Digital Twin V3 initialized with persistent memory")
         
-        # Load and apply any existing patterns
-        self._initialize_from_memory()
+        # Existing patterns are applied on the first reason() call
+        self._memory_initialized = False
+    
+    @cached_property
+    def voice_orchestrator(self) -> VoiceOrchestrator:
+        """Behavioral voices, created on the first arbitration"""
+        return VoiceOrchestrator(self.persona)
+    
+    @cached_property
+    def arbitrator(self) -> DecisionArbitrator:
+        """Voice arbitrator, created on the first arbitration"""
+        return DecisionArbitrator(self.llm_client, self.persona)
+    
+    @cached_property
+    def deliberation_engine(self) -> DeliberationEngine:
+        """Deliberation engine, created on the first deliberation"""
+        return DeliberationEngine(self.llm_client, self.persona)
+    
+    @cached_property
+    def heuristic_brain(self) -> HeuristicBrain:
+        """Heuristic rules, loaded on the first reasoning mode choice"""
+        return HeuristicBrain(self.persona)
+    
+    @cached_property
+    def episodic_memory(self) -> EpisodicMemorySystem:
+        """Episodic memory store, loaded from disk on first access"""
+        return EpisodicMemorySystem(storage_dir=f"{self.memory_dir}/episodic")
+    
+    @cached_property
+    def vector_memory(self) -> EnhancedVectorMemory:
+        """Semantic memory store, connected on first access"""
+        return EnhancedVectorMemory(
+            storage_dir=f"{self.memory_dir}/vector",
+            openai_api_key=self.api_key
+        )
+    
+    @cached_property
+    def memory_updater(self) -> MemoryUpdater:
+        """Memory capture and pattern extraction"""
+        return MemoryUpdater(self.episodic_memory, self.vector_memory)
+    
+    @cached_property
+    def memory_retrieval(self) -> IntelligentMemoryRetrieval:
+        """Context-aware retrieval over both memory stores"""
+        return IntelligentMemoryRetrieval(self.episodic_memory, self.vector_memory)
     
     def _load_persona(self, persona_path: str) -> Dict[str, Any]:
-        """Load persona configuration from YAML file"""
+        """Load persona configuration from a YAML or JSON file"""
         try:
-            with open(persona_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_persona(persona_path)
         except FileNotFoundError:
             print(f"Warning: {persona_path} not found. Using default persona.")
             return self._default_persona()
     
     def _default_persona(self) -> Dict[str, Any]:
-        """Fallback persona if config not found"""
-        return {
-            "name": "Digital Twin",
-            "traits": ["analytical", "efficient", "friendly"],
-            "values": ["honesty", "growth", "connection"],
-            "communication_style": {
-                "tone": "professional yet warm",
-                "brevity": "concise but thorough",
-                "formality": "adapts to context"
-            },
-            "preferences": {},
-            "routines": {}
-        }
+        """Fallback persona if config not found (shared and read-only)"""
+        return DEFAULT_PERSONA
     
     def _initialize_from_memory(self):
         """Initialize the twin with patterns and insights from memory"""
@@ -203,6 +411,12 @@ class DigitalTwinV3:
         4. Automatically stores the decision for future learning
         """
         
+        # Load and apply any existing patterns before the first decision;
+        # the pattern scan reads the memory stores, so keep it off the loop
+        if not self._memory_initialized:
+            self._memory_initialized = True
+            await asyncio.to_thread(self._initialize_from_memory)
+        
         # Get current state
         current_state = self.get_current_state()
         
@@ -212,7 +426,8 @@ class DigitalTwinV3:
         # Determine reasoning mode (enhanced with memory)
         reasoning_mode = self._choose_reasoning_mode_with_memory(situation, current_state, memory_context)
         
-        self.logger.info(f"Using {reasoning_mode} reasoning with {len(memory_context)} memory references")
+        # Logged on every decision, so let logging format it only when INFO is enabled
+        self.logger.info("Using %s reasoning with %d memory references", reasoning_mode, len(memory_context))
         
         # Route to appropriate reasoning system
         if reasoning_mode == "heuristic":
@@ -238,14 +453,82 @@ class DigitalTwinV3:
         )
         
         # Add to session history
+        self._record_session_decision(situation, response, memory_ids)
+        
+        return response
+    
+    @staticmethod
+    def _context_hash(context: str) -> int:
+        """64-bit hash of a situation context for the session arrays"""
+        return hash(context) & 0xFFFFFFFFFFFFFFFF
+    
+    def _record_session_decision(self, situation: Situation, response: TwinResponse, memory_ids: Dict[str, Any]):
+        """Append a decision to the session history and its lookup arrays"""
+        
+        timestamp_us = time.time_ns() // 1000
+        index = len(self.session_decisions)
+        
+        # Grow the arrays geometrically so appends stay amortized O(1)
+        if index == len(self._sd_timestamps):
+            self._sd_timestamps = np.resize(self._sd_timestamps, index * 2)
+            self._sd_ctx_hashes = np.resize(self._sd_ctx_hashes, index * 2)
+        
+        context_hash = self._context_hash(situation.context)
+        self._sd_timestamps[index] = timestamp_us
+        self._sd_ctx_hashes[index] = context_hash
+        
+        # Drop buckets behind the window; decisions that old are still
+        # found by the array scan in _find_session_decision
+        minute = timestamp_us // 60_000_000
+        if minute > self._decision_index_minute:
+            self._decision_index = {
+                key: i for key, i in self._decision_index.items() if key[1] >= minute - 10
+            }
+            self._decision_index_minute = minute
+        
+        # Index every minute within the default 10 minute feedback window
+        for bucket in range(minute - 10, minute + 11):
+            self._decision_index[(context_hash, bucket)] = index
+        
         self.session_decisions.append({
             'situation': situation,
             'response': response,
             'memory_ids': memory_ids,
-            'timestamp': datetime.now()
+            'timestamp_us': timestamp_us
         })
+    
+    def _find_session_decision(self, situation: Situation, window_seconds: float = 600) -> Optional[Dict[str, Any]]:
+        """Find the most recent session decision for this situation within the time window"""
+        
+        count = len(self.session_decisions)
+        if count == 0:
+            return None
+        
+        context_hash = self._context_hash(situation.context)
+        situation_us = situation.timestamp_us
+        window_us = int(window_seconds * 1_000_000)
+        
+        # Fast path: the newest decision indexed for this context and minute
+        index = self._decision_index.get((context_hash, situation_us // 60_000_000))
+        if index is not None:
+            decision = self.session_decisions[index]
+            if (abs(int(self._sd_timestamps[index]) - situation_us) < window_us and
+                    decision['situation'].context == situation.context):
+                return decision
+        
+        # Otherwise scan the session arrays
+        candidates = np.flatnonzero(
+            (self._sd_ctx_hashes[:count] == np.uint64(context_hash)) &
+            (np.abs(self._sd_timestamps[:count] - situation_us) < window_us)
+        )
         
-        return response
+        # Confirm the context text to rule out hash collisions, newest first
+        for index in candidates[::-1]:
+            decision = self.session_decisions[index]
+            if decision['situation'].context == situation.context:
+                return decision
+        
+        return None
     
     def _get_memory_context(self, situation: Situation, current_state: Dict[str, Any]) -> List:
         """Retrieve relevant memories for the current situation"""
@@ -258,10 +541,24 @@ class DigitalTwinV3:
             current_state=current_state
         )
         
-        return self.memory_retrieval.retrieve_contextual_memories(
+        # Only reuse memories for situations of the same kind, urgency and people
+        situation_embedding = hashed_text_embedding(f"{situation.category}: {situation.context}")
+        scope = (situation.category, retrieval_context.urgency, tuple(retrieval_context.people_involved))
+        
+        cached_memories = self.memory_context_cache.get(situation_embedding, scope)
+        if cached_memories is not None:
+            return list(cached_memories)
+        
+        # Embeddings are cached by text, so a recurring situation is embedded once
+        retrieval_context.query_embedding = self.vector_memory.embed_text(situation.context)
+        
+        memories = self.memory_retrieval.retrieve_contextual_memories(
             context=retrieval_context,
             max_memories=6
         )
+        self.memory_context_cache.put(situation_embedding, memories, scope)
+        
+        return memories
     
     def _choose_reasoning_mode_with_memory(self, 
                                          situation: Situation, 
@@ -276,15 +573,15 @@ class DigitalTwinV3:
         # Check memory for patterns about what reasoning mode works best
         reasoning_mode_memories = [
             m for m in memory_context 
-            if 'reasoning' in m.content.lower() and m.success_boost > 0
+            if m.keyword_mask & MEMORY_KEYWORDS['reasoning'] and m.success_boost > 0
         ]
         
         if reasoning_mode_memories:
             # If we have successful patterns, use them
             for memory in reasoning_mode_memories:
-                if 'heuristic' in memory.content.lower():
+                if memory.keyword_mask & MEMORY_KEYWORDS['heuristic']:
                     return "heuristic"
-                elif 'deliberation' in memory.content.lower():
+                elif memory.keyword_mask & MEMORY_KEYWORDS['deliberation']:
                     return "deliberation"
         
         # Check if heuristic reasoning is applicable
@@ -297,8 +594,7 @@ class DigitalTwinV3:
             return "heuristic"
         
         # Check for complex situations that need deliberation
-        complex_keywords = ["multiple options", "trade-off", "complex", "strategic", "important decision"]
-        if any(keyword in situation.context.lower() for keyword in complex_keywords):
+        if _mentions_complex_keyword(situation.context):
             return "deliberation"
         
         # Default to voice arbitration
@@ -437,27 +733,29 @@ class DigitalTwinV3:
         for memory in memory_context:
             if memory.memory_type == 'episodic' and memory.success_boost > 0:
                 lessons.append(f"Previously successful: {memory.content[:100]}...")
-            elif 'insight' in memory.content.lower():
+            elif memory.keyword_mask & MEMORY_KEYWORDS['insight']:
                 lessons.append(f"Learned: {memory.content[:100]}...")
         
         return lessons[:3]  # Top 3 lessons
     
-    def _get_similar_situation_summaries(self, memory_context: List) -> List[str]:
-        """Get summaries of similar situations from memory"""
-        
-        similar = []
-        for memory in memory_context:
-            if memory.memory_type == 'episodic' and memory.context_match > 0.1:
-                similar.append(f"Similar situation: {memory.content[:80]}...")
+    def _get_similar_situation_summaries(self, memory_context: List, limit: int = 2) -> List[str]:
+        """Get summaries of the episodic memories that best match the situation"""
+        
+        # Partial top-k selection; only the winners are sliced and formatted
+        matches = heapq.nlargest(
+            limit,
+            (m for m in memory_context if m.memory_type == 'episodic' and m.context_match > 0.1),
+            key=lambda m: m.context_match
+        )
         
-        return similar[:2]  # Top 2 similar situations
+        return [f"Similar situation: {memory.content[:80]}..." for memory in matches]
     
     def _extract_heuristic_insights(self, memory_context: List) -> str:
         """Extract insights relevant to heuristic reasoning"""
         
         insights = []
         for memory in memory_context:
-            if 'pattern' in memory.content.lower() and memory.success_boost > 0:
+            if memory.keyword_mask & MEMORY_KEYWORDS['pattern'] and memory.success_boost > 0:
                 insights.append(f"this pattern worked well before")
         
         return "; ".join(insights[:2]) if insights else ""
@@ -467,7 +765,7 @@ class DigitalTwinV3:
         
         lessons = []
         for memory in memory_context:
-            if 'strategic' in memory.content.lower() or 'deliberation' in memory.content.lower():
+            if memory.keyword_mask & (MEMORY_KEYWORDS['strategic'] | MEMORY_KEYWORDS['deliberation']):
                 lessons.append(f"strategic approach previously {memory.content[:50]}...")
         
         return "; ".join(lessons[:2]) if lessons else ""
@@ -477,7 +775,7 @@ class DigitalTwinV3:
         
         patterns = []
         for memory in memory_context:
-            if 'voice' in memory.content.lower() or 'values' in memory.content.lower():
+            if memory.keyword_mask & (MEMORY_KEYWORDS['voice'] | MEMORY_KEYWORDS['values']):
                 patterns.append(f"value pattern: {memory.content[:50]}...")
         
         return "; ".join(patterns[:2]) if patterns else ""
@@ -485,14 +783,17 @@ class DigitalTwinV3:
     def _enhance_voices_with_memory(self, voice_arguments: List, memory_context: List):
         """Enhance voice arguments with relevant memories"""
         
+        # Memory content is lowercased once when retrieved; only the first
+        # matching memory is used, so stop scanning at the first hit
         for voice_arg in voice_arguments:
-            relevant_memories = [
-                m for m in memory_context 
-                if voice_arg.voice_name.lower() in m.content.lower()
-            ]
+            voice_name = voice_arg.voice_name.lower()
+            relevant_memory = next(
+                (m for m in memory_context if voice_name in m.content_lower),
+                None
+            )
             
-            if relevant_memories:
-                memory_support = relevant_memories[0].content[:100]
+            if relevant_memory is not None:
+                memory_support = relevant_memory.content[:100]
                 voice_arg.supporting_points.append(f"Past experience: {memory_support}...")
     
     def learn_from_feedback(self, 
@@ -512,12 +813,7 @@ class DigitalTwinV3:
         """
         
         # Find the recent decision
-        recent_decision = None
-        for decision in reversed(self.session_decisions):
-            if (decision['situation'].context == situation.context and
-                abs((decision['timestamp'] - situation.timestamp).total_seconds()) < 600):
-                recent_decision = decision
-                break
+        recent_decision = self._find_session_decision(situation)
         
         if not recent_decision:
             self.logger.warning("Could not find corresponding decision for feedback")
@@ -548,8 +844,8 @@ class DigitalTwinV3:
         # Extract new patterns from this feedback
         pattern_insights = self.memory_updater.extract_insights_from_patterns(days=7)
         
-        self.logger.info(f"Learned from feedback: satisfaction={satisfaction:.2f}, "
-                        f"extracted {len(pattern_insights)} new insights")
+        self.logger.info("Learned from feedback: satisfaction=%.2f, extracted %d new insights",
+                         satisfaction, len(pattern_insights))
         
         return {
             "learning_stored": True,
@@ -558,7 +854,7 @@ class DigitalTwinV3:
             "new_patterns": len(pattern_insights)
         }
     
-    def ask_memory(self, question: str) -> str:
+    async def ask_memory(self, question: str) -> str:
         """
         Ask the memory system a specific question.
         
@@ -574,8 +870,11 @@ class DigitalTwinV3:
             reasoning_mode="deliberation"  # Use deliberation for memory queries
         )
         
-        memories = self.memory_retrieval.retrieve_contextual_memories(
-            retrieval_context, max_memories=5
+        # Retrieval may embed the question, so keep it off the event loop
+        memories = await asyncio.to_thread(
+            self.memory_retrieval.retrieve_contextual_memories,
+            retrieval_context,
+            max_memories=5
         )
         
         if not memories:
@@ -592,7 +891,7 @@ class DigitalTwinV3:
         
         return response
     
-    def introspect_with_memory(self, question: str) -> str:
+    async def introspect_with_memory(self, question: str) -> str:
         """
         Enhanced introspection using memory system.
         
@@ -614,32 +913,55 @@ class DigitalTwinV3:
             "recent_decisions": len(self.session_decisions)
         }
         
-        introspection_prompt = f"""
-        I am analyzing my own behavioral patterns using my complete memory system.
-        
-        QUESTION: {question}
-        
-        COMPREHENSIVE DATA:
-        {json.dumps(introspection_context, indent=2, default=str)}
-        
-        Analyze this question deeply, referencing specific patterns from my memory system.
-        Provide insights that only someone with access to my complete behavioral history could give.
-        Be specific and reference actual patterns when possible.
-        """
+        # One line per section, each serialized on its own with large
+        # collections capped, joined into the prompt once
+        prompt_parts = [
+            "I am analyzing my own behavioral patterns using my complete memory system.",
+            "",
+            f"QUESTION: {question}",
+            "",
+            "COMPREHENSIVE DATA:"
+        ]
+        prompt_parts.extend(
+            f"{section}: {_dumps_compact(_truncate_for_prompt(data))}"
+            for section, data in introspection_context.items()
+        )
+        prompt_parts.extend([
+            "",
+            "Analyze this question deeply, referencing specific patterns from my memory system.",
+            "Provide insights that only someone with access to my complete behavioral history could give.",
+            "Be specific and reference actual patterns when possible."
+        ])
+        introspection_prompt = "\n".join(prompt_parts)
         
         try:
-            response = self.llm_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are providing deep self-introspection for a digital twin with access to comprehensive memory and behavioral data."},
-                    {"role": "user", "content": introspection_prompt}
-                ],
-                temperature=0.6
-            )
-            return response.choices[0].message.content
+            async with self._llm_semaphore:
+                response = await async_call_with_retry(
+                    self.async_llm_client.chat.completions.create,
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": "You are providing deep self-introspection for a digital twin with access to comprehensive memory and behavioral data."},
+                        {"role": "user", "content": introspection_prompt}
+                    ],
+                    temperature=0.6
+                )
+            content = response.choices[0].message.content
+            if not content:
+                raise EmptyLLMResponseError("Empty introspection response")
+            return content
         except Exception as e:
+            self.logger.error(f"Deep introspection produced no output: {e}")
             return f"Unable to perform deep introspection: {str(e)}"
     
+    async def introspect_batch(self, questions: List[str]) -> List[str]:
+        """
+        Run several introspection questions concurrently.
+        
+        Requests are dispatched together and limited by max_concurrent_llm_calls;
+        answers are returned in the same order as the questions.
+        """
+        return await asyncio.gather(*[self.introspect_with_memory(q) for q in questions])
+    
     def get_reasoning_insights(self) -> Dict[str, Any]:
         """Enhanced reasoning insights with memory integration"""
         
@@ -653,7 +975,8 @@ class DigitalTwinV3:
                 "recent_learning": len(self.session_decisions)
             },
             "pattern_extraction": self.memory_updater.get_update_statistics(),
-            "retrieval_stats": self.memory_retrieval.get_retrieval_statistics()
+            "retrieval_stats": self.memory_retrieval.get_retrieval_statistics(),
+            "memory_context_cache": self.memory_context_cache.get_stats()
         }
         
         return {**base_insights, **memory_insights}
@@ -671,7 +994,16 @@ class DigitalTwinV3:
             }
         }
     
-    def maintain_memory_system(self):
+    def _maintain_semantic_memory(self) -> Dict[str, Any]:
+        """Consolidate, decay and clean up semantic memories (in that order)"""
+        
+        return {
+            'consolidated_memories': self.vector_memory.consolidate_memories(),
+            'decayed_memories': self.vector_memory.decay_unused_memories(),
+            'cleaned_semantic': self.vector_memory.cleanup_low_quality_memories()
+        }
+    
+    async def maintain_memory_system(self):
         """
         Perform maintenance on the memory system.
         
@@ -680,29 +1012,32 @@ class DigitalTwinV3:
         - Decaying unused memories
         - Extracting new patterns
         - Cleaning up low-quality memories
-        """
         
-        maintenance_stats = {}
+        The semantic and episodic stores are maintained concurrently in
+        worker threads. Each store's own steps still run in order, since they
+        mutate the same memory cache. Insight extraction reads episodic
+        memory and writes semantic memory, so it runs once both are done.
         
-        # Consolidate similar semantic memories
-        consolidated = self.vector_memory.consolidate_memories()
-        maintenance_stats['consolidated_memories'] = consolidated
+        reason() and store_decision may add memories on the event loop
+        meanwhile. The stores iterate over snapshots of their memory dicts
+        and look memories up by ID with .get(), so those inserts and the
+        maintenance removals can interleave safely.
+        """
         
-        # Decay unused memories
-        decayed = self.vector_memory.decay_unused_memories()
-        maintenance_stats['decayed_memories'] = decayed
+        semantic_stats, cleaned_episodic = await asyncio.gather(
+            asyncio.to_thread(self._maintain_semantic_memory),
+            asyncio.to_thread(self.episodic_memory.cleanup_old_memories)
+        )
+        
+        maintenance_stats = dict(semantic_stats)
+        maintenance_stats['cleaned_episodic'] = cleaned_episodic
         
         # Extract new behavioral insights
-        insights = self.memory_updater.extract_insights_from_patterns()
+        insights = await asyncio.to_thread(self.memory_updater.extract_insights_from_patterns)
         maintenance_stats['new_insights'] = len(insights)
         
-        # Clean up episodic memories
-        cleaned_episodic = self.episodic_memory.cleanup_old_memories()
-        maintenance_stats['cleaned_episodic'] = cleaned_episodic
-        
-        # Clean up low-quality semantic memories
-        cleaned_semantic = self.vector_memory.cleanup_low_quality_memories()
-        maintenance_stats['cleaned_semantic'] = cleaned_semantic
+        # Cached memory contexts may reference consolidated or removed memories
+        self.memory_context_cache.clear()
         
         self.logger.info(f"Memory maintenance completed: {maintenance_stats}")
         
@@ -713,22 +1048,143 @@ class DigitalTwinV3:
         self.is_shadow_mode = enabled
         return f"Shadow mode {'enabled' if enabled else 'disabled'}. Twin will {'observe and learn' if enabled else 'actively respond'}."
     
-    def export_memories(self, filepath: str = None) -> str:
-        """Export all memories for backup or analysis"""
+    def export_memories(self, filepath: str = None, stream: bool = False, shards: int = 0) -> str:
+        """
+        Export all memories for backup or analysis.
+        
+        Args:
+            filepath: Output path (defaults to a timestamped file name)
+            stream: Write JSON Lines instead of a single JSON document: a
+                header line, one line per memory, then a summary line
+            shards: If > 1, split episodic memories across this many
+                "<filepath>.shard<i>.json" files written in parallel, and
+                write a manifest to filepath (see load_sharded_export).
+                Not supported together with stream
+        
+        Raises:
+            ValueError: If both stream and shards > 1 are given
+        """
+        
+        if stream and shards > 1:
+            raise ValueError("Sharded export is not supported with stream=True")
         
         if not filepath:
-            filepath = f"twin_memories_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            extension = "jsonl" if stream else "json"
+            filepath = f"twin_memories_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
         
-        export_data = {
-            "export_timestamp": datetime.now().isoformat(),
-            "persona": self.persona,
-            "episodic_memories": [m.to_dict() for m in self.episodic_memory.memories.values()],
-            "semantic_memory_metadata": [m.to_dict() for m in self.vector_memory.memory_cache.values()],
-            "reasoning_insights": self.get_reasoning_insights(),
-            "memory_summary": self.get_memory_summary()
-        }
+        if stream:
+            return self._export_memories_jsonl(filepath)
+        
+        # Memory lists are spliced in from pre-serialized records, which are
+        # reused across exports until their store changes
+        episodic = self._serialized_memory_records("episodic")
+        if shards > 1:
+            episodic_section = ("episodic_shards", self._write_episodic_shards(filepath, episodic, shards))
+        else:
+            episodic_section = ("episodic_memories", episodic)
+        
+        sections = [
+            ("export_timestamp", datetime.now(timezone.utc)),
+            ("persona", self.persona),
+            episodic_section,
+            ("semantic_memory_metadata", self._serialized_memory_records("semantic")),
+            ("reasoning_insights", self.get_reasoning_insights()),
+            ("memory_summary", self.get_memory_summary())
+        ]
+        
+        # orjson output is already UTF-8 bytes, so write it without re-encoding
+        with open(filepath, 'wb') as f:
+            f.write(b"{")
+            for section_index, (key, value) in enumerate(sections):
+                if section_index:
+                    f.write(b",")
+                f.write(b"\n" + _dumps_bytes(key) + b": ")
+                
+                if not isinstance(value, _SerializedRecords):
+                    f.write(_dumps_bytes(value))
+                    continue
+                
+                f.write(_records_array_bytes(value))
+            f.write(b"\n}\n")
+        
+        return f"Exported complete memory system to {filepath}"
+    
+    def _write_episodic_shards(self, filepath: str, records: List[bytes], shards: int) -> List[Dict[str, Any]]:
+        """
+        Write episodic records to contiguous shard files in parallel.
+        
+        Records are already encoded, so the worker threads only join bytes
+        and write files; both release the GIL for large buffers.
+        
+        Returns:
+            Manifest entries: shard file name (relative to filepath) and record count
+        """
         
-        with open(filepath, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        shards = max(1, min(shards, len(records)))
+        size, extra = divmod(len(records), shards)
+        
+        chunks, start = [], 0
+        for index in range(shards):
+            end = start + size + (1 if index < extra else 0)
+            chunks.append(records[start:end])
+            start = end
+        
+        paths = [f"{filepath}.shard{index}.json" for index in range(shards)]
+        
+        def write_shard(path: str, chunk: List[bytes]):
+            with open(path, 'wb') as f:
+                f.write(_records_array_bytes(chunk) + b"\n")
+        
+        with ThreadPoolExecutor(max_workers=shards) as pool:
+            list(pool.map(write_shard, paths, chunks))
+        
+        return [
+            {"file": os.path.basename(path), "count": len(chunk)}
+            for path, chunk in zip(paths, chunks)
+        ]
+    
+    def _serialized_memory_records(self, kind: str) -> "_SerializedRecords":
+        """
+        Export records of one memory store ("episodic" or "semantic") as JSON bytes.
+        
+        The encoded records are kept until the store's version changes, so
+        repeated exports of an unchanged store skip re-serialization.
+        """
+        
+        if kind == "episodic":
+            store = self.episodic_memory
+            records = (_episodic_export_record(m) for m in list(store.memories.values()))
+        else:
+            store = self.vector_memory
+            records = (m.to_dict() for m in list(store.memory_cache.values()))
+        
+        cached = self._export_records.get(kind)
+        if cached is not None and cached[0] == store.version:
+            return cached[1]
+        
+        encoded = _SerializedRecords(_dumps_bytes(record) for record in records)
+        self._export_records[kind] = (store.version, encoded)
+        return encoded
+    
+    def _export_memories_jsonl(self, filepath: str) -> str:
+        """Export memories as JSON Lines, one record per line"""
+        
+        with open(filepath, 'wb') as f:
+            f.write(_dumps_bytes({
+                "kind": "header",
+                "export_timestamp": datetime.now(timezone.utc),
+                "persona": self.persona
+            }) + b"\n")
+            
+            for kind in ("episodic", "semantic"):
+                prefix = b'{"kind":' + _dumps_bytes(kind) + b',"data":'
+                for record in self._serialized_memory_records(kind):
+                    f.write(prefix + record + b"}\n")
+            
+            f.write(_dumps_bytes({
+                "kind": "summary",
+                "reasoning_insights": self.get_reasoning_insights(),
+                "memory_summary": self.get_memory_summary()
+            }) + b"\n")
         
         return f"Exported complete memory system to {filepath}"
\ No newline at end of file
@@ -7,6 +7,7 @@ a complex, time-based, multi-tool request.
 
 import asyncio
 import os
+import sys
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -14,52 +15,129 @@ from dotenv import load_dotenv
 from digital_twin import DigitalTwin, Situation
 from twin_controller import TwinController
 from scheduler import TwinScheduler
-from memory_interface import ChromaMemory, MemoryManager
+from memory_interface import ChromaMemory, FAISSMemory, MemoryManager
 from tools.voice_tool import VoiceTool
 from tools.task_manager_tool import TaskManagerTool
 
+# Load environment variables once; demos read these constants
+load_dotenv()
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
+TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
+USER_PHONE_NUMBER = os.getenv("USER_PHONE_NUMBER")
+USE_FAISS_MEMORY = os.getenv("DIGITAL_TWIN_FAISS_MEMORY", "").lower() in ("1", "true", "yes")
+
+# Placeholder number for the reminder demo when USER_PHONE_NUMBER is unset
+DEMO_PHONE_NUMBER = "+1234567890"
+
+REQUIRED_ENV_VARS = {"OPENAI_API_KEY": OPENAI_API_KEY}
+
+# Static console text, built once at import
+BANNER_HEADER = "🚀 Digital Twin Controller Integration Demo"
+BANNER_RULE = "=" * 50
+
+DEMO_MENU = (
+    "\nChoose a demo:",
+    "1. Schedule reminder call at 3:30 PM",
+    "2. Set up morning routine",
+    "3. Demonstrate learning from feedback",
+    "4. Exit"
+)
+
+REMINDER_CALL_STEPS = (
+    "\n⏰ At 3:30 PM, the system will:",
+    "   1. Retrieve pending tasks for today",
+    "   2. Format them into a natural speech message",
+    "   3. Call your phone and deliver the reminder",
+    # Simulate immediate execution for demo
+    "\n🎭 Demo: Simulating immediate execution..."
+)
+
+# The system is built once and shared by every demo run in this process
+_system = None
+_system_lock = asyncio.Lock()
+
+
+def _write_lines(lines):
+    """Write a block of console output with a single write call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
 
 async def setup_digital_twin_system():
     """
     Set up the complete digital twin system with all components.
+    
+    The first call builds the system (memory store, scheduler, tools); later
+    calls return the same controller, scheduler and task manager.
     """
     
-    # Load environment variables
-    load_dotenv()
+    global _system
+    
+    async with _system_lock:
+        if _system is None:
+            _system = await _build_digital_twin_system()
+    
+    return _system
+
+
+async def shutdown_digital_twin_system():
+    """Stop the shared scheduler, if the system was built"""
+    
+    global _system
+    
+    if _system is not None:
+        _, scheduler, _ = _system
+        await scheduler.stop()
+        _system = None
+
+
+def _create_memory():
+    """Create the memory backend"""
+    # Set DIGITAL_TWIN_FAISS_MEMORY=1 to search an in-process FAISS index
+    # over the Chroma-persisted vectors
+    if USE_FAISS_MEMORY:
+        return FAISSMemory()
+    return ChromaMemory()
+
+
+async def _build_digital_twin_system():
+    """Construct and start all components"""
     
     print("🧠 Initializing Digital Twin System...")
     
-    # 1. Initialize the brain
-    twin = DigitalTwin(
-        persona_path="persona.yaml",
-        api_key=os.getenv("OPENAI_API_KEY")
+    # 1. The brain, memory store and tools do not depend on each other, so
+    #    their blocking constructors run concurrently in worker threads
+    twin, memory, voice_tool, task_manager = await asyncio.gather(
+        asyncio.to_thread(
+            DigitalTwin,
+            persona_path="persona.yaml",
+            api_key=OPENAI_API_KEY
+        ),
+        asyncio.to_thread(_create_memory),
+        asyncio.to_thread(
+            VoiceTool,
+            twilio_account_sid=TWILIO_ACCOUNT_SID,
+            twilio_auth_token=TWILIO_AUTH_TOKEN,
+            twilio_phone_number=TWILIO_PHONE_NUMBER
+        ),
+        asyncio.to_thread(TaskManagerTool)
     )
     
-    # 2. Initialize memory
-    memory = ChromaMemory()
+    # 2. Wire memory into the brain and build the controller
     memory_manager = MemoryManager(memory)
     twin.set_memory_interface(memory)
-    
-    # 3. Initialize controller
     controller = TwinController(twin, memory_manager)
     
-    # 4. Initialize scheduler
+    # 3. Start the scheduler on this event loop
     scheduler = TwinScheduler()
     await scheduler.start()
     controller.set_scheduler(scheduler)
     
-    # 5. Initialize and register tools
-    
-    # Voice tool for making calls
-    voice_tool = VoiceTool(
-        twilio_account_sid=os.getenv("TWILIO_ACCOUNT_SID"),
-        twilio_auth_token=os.getenv("TWILIO_AUTH_TOKEN"),
-        twilio_phone_number=os.getenv("TWILIO_PHONE_NUMBER")
-    )
+    # 4. Register tools (voice for calls, task manager for getting tasks)
     controller.register_tool("voice", voice_tool)
-    
-    # Task manager for getting tasks
-    task_manager = TaskManagerTool()
     controller.register_tool("task_manager", task_manager)
     
     print("✅ System initialized successfully!")
@@ -74,20 +152,21 @@ async def demonstrate_reminder_call():
     
     # Set up the system
     controller, scheduler, task_manager = await setup_digital_twin_system()
+    now = datetime.now()
     
     # Create some sample tasks first
     print("\n📝 Creating sample tasks...")
     task_manager.create_task(
         title="Finish project presentation",
         priority="high",
-        deadline=datetime.now() + timedelta(hours=4),
+        deadline=now + timedelta(hours=4),
         tags=["work", "urgent"]
     )
     
     task_manager.create_task(
         title="Review code changes",
         priority="normal",
-        deadline=datetime.now() + timedelta(days=1),
+        deadline=now + timedelta(days=1),
         tags=["work"]
     )
     
@@ -104,47 +183,43 @@ async def demonstrate_reminder_call():
     
     # Process the request
     context = {
-        "user_phone": os.getenv("USER_PHONE_NUMBER", "+1234567890"),
-        "current_time": datetime.now().strftime("%I:%M %p")
+        "user_phone": USER_PHONE_NUMBER if USER_PHONE_NUMBER is not None else DEMO_PHONE_NUMBER,
+        "current_time": now.strftime("%I:%M %p")
     }
     
     print("\n🤖 Processing request...")
     plan = await controller.process_request(user_request, context)
     
-    print(f"\n📋 Created action plan:")
-    print(f"   ID: {plan.id}")
-    print(f"   Intent: {plan.intent}")
-    print(f"   Scheduled for: {plan.scheduled_time}")
-    print(f"   Status: {plan.status.value}")
-    print(f"\n   Steps:")
-    for i, step in enumerate(plan.steps, 1):
-        print(f"   {i}. {step['tool']}.{step['action']}")
+    # Each report section is collected and written in one call
+    lines = [
+        f"\n📋 Created action plan:",
+        f"   ID: {plan.id}",
+        f"   Intent: {plan.intent}",
+        f"   Scheduled for: {plan.scheduled_time}",
+        f"   Status: {plan.status.value}",
+        f"\n   Steps:"
+    ]
+    lines.extend(f"   {i}. {step['tool']}.{step['action']}" for i, step in enumerate(plan.steps, 1))
     
     # Show what would happen at 3:30 PM
-    print("\n⏰ At 3:30 PM, the system will:")
-    print("   1. Retrieve pending tasks for today")
-    print("   2. Format them into a natural speech message")
-    print("   3. Call your phone and deliver the reminder")
-    
-    # Simulate immediate execution for demo
-    print("\n🎭 Demo: Simulating immediate execution...")
+    lines.extend(REMINDER_CALL_STEPS)
+    _write_lines(lines)
     
     # Get tasks that would be spoken
     pending_tasks = task_manager.get_pending_tasks(timeframe="today")
-    print(f"\n📋 Found {len(pending_tasks)} tasks for today:")
+    lines = [f"\n📋 Found {len(pending_tasks)} tasks for today:"]
     for task in pending_tasks:
-        print(f"   - {task['title']} (Priority: {task['priority']})")
+        lines.append(f"   - {task['title']} (Priority: {task['priority']})")
         if 'deadline' in task:
-            print(f"     Due: {task['deadline']}")
+            lines.append(f"     Due: {task['deadline']}")
     
     # Show scheduled actions
-    print("\n⏱️ Currently scheduled actions:")
-    scheduled = scheduler.get_scheduled_actions()
-    for action in scheduled:
-        print(f"   - {action.id}: Scheduled for {action.next_execution}")
-    
-    # Clean up
-    await scheduler.stop()
+    lines.append("\n⏱️ Currently scheduled actions:")
+    lines.extend(
+        f"   - {action.id}: Scheduled for {action.next_execution}"
+        for action in scheduler.iter_scheduled_actions()
+    )
+    _write_lines(lines)
     
     print("\n✅ Demo completed!")
 
@@ -162,11 +237,9 @@ async def demonstrate_morning_routine():
     success = scheduler.schedule_recurring_reminder(
         action_id="morning_briefing",
         time_of_day="08:00",  # 8 AM every day
-        callback=lambda: asyncio.create_task(
-            controller.process_request(
-                "Check my calendar and tasks, then call me with a morning briefing",
-                {"user_phone": os.getenv("USER_PHONE_NUMBER")}
-            )
+        callback=lambda: controller.process_request(
+            "Check my calendar and tasks, then call me with a morning briefing",
+            {"user_phone": USER_PHONE_NUMBER}
         )
     )
     
@@ -178,8 +251,6 @@ async def demonstrate_morning_routine():
     # 2. Get high-priority tasks
     # 3. Check weather (when weather tool is added)
     # 4. Make a comprehensive briefing call
-    
-    await scheduler.stop()
 
 
 async def demonstrate_learning():
@@ -217,8 +288,6 @@ async def demonstrate_learning():
     
     print("\n✅ Twin has learned from this interaction!")
     print("   Next time, it will consider this compromise approach")
-    
-    await scheduler.stop()
 
 
 async def main():
@@ -226,26 +295,34 @@ async def main():
     Main demonstration entry point.
     """
     
-    print("🚀 Digital Twin Controller Integration Demo")
-    print("=" * 50)
+    _write_lines([BANNER_HEADER, BANNER_RULE])
     
     # Check for required environment variables
-    required_vars = ["OPENAI_API_KEY"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    missing_vars = [name for name, value in REQUIRED_ENV_VARS.items() if not value]
     
     if missing_vars:
         print(f"\n⚠️  Missing required environment variables: {', '.join(missing_vars)}")
         print("   Please set them in your .env file")
         return
     
+    try:
+        await _run_demo_menu()
+    finally:
+        await shutdown_digital_twin_system()
+
+
+async def _prompt(message: str) -> str:
+    """Read a line of input in a worker thread so scheduled actions keep running"""
+    return await asyncio.get_running_loop().run_in_executor(None, input, message)
+
+
+async def _run_demo_menu():
+    """Prompt for demos until the user exits"""
+    
     while True:
-        print("\nChoose a demo:")
-        print("1. Schedule reminder call at 3:30 PM")
-        print("2. Set up morning routine")
-        print("3. Demonstrate learning from feedback")
-        print("4. Exit")
+        _write_lines(DEMO_MENU)
         
-        choice = input("\nEnter choice (1-4): ").strip()
+        choice = (await _prompt("\nEnter choice (1-4): ")).strip()
         
         if choice == "1":
             await demonstrate_reminder_call()
@@ -260,7 +337,7 @@ async def main():
             print("Invalid choice. Please try again.")
         
         if choice in ["1", "2", "3"]:
-            input("\nPress Enter to continue...")
+            await _prompt("\nPress Enter to continue...")
 
 
 if __name__ == "__main__":
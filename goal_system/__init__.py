@@ -19,12 +19,44 @@ The Goal-Aware Agent provides:
 - Context-aware goal execution integrated with daily workflow
 """
 
-from .goal_manager import GoalManager, Goal, Milestone, GoalStatus
-from .strategic_planner import StrategicPlanner, ProjectPlan, TimelineAdaptation
-from .goal_reasoner import GoalAwareReasoner, GoalContext
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the submodule defining each; submodules are imported on
+# first attribute access (PEP 562) so importing the package stays cheap
+_LAZY_EXPORTS = {
+    'GoalManager': '.goal_manager',
+    'Goal': '.goal_manager',
+    'Milestone': '.goal_manager',
+    'GoalStatus': '.goal_manager',
+    'StrategicPlanner': '.strategic_planner',
+    'ProjectPlan': '.strategic_planner',
+    'TimelineAdaptation': '.strategic_planner',
+    'GoalAwareReasoner': '.goal_reasoner',
+    'GoalContext': '.goal_reasoner',
+}
 
 __all__ = [
     'GoalManager', 'Goal', 'Milestone', 'GoalStatus',
     'StrategicPlanner', 'ProjectPlan', 'TimelineAdaptation', 
     'GoalAwareReasoner', 'GoalContext'
-]
\ No newline at end of file
+]
+
+if TYPE_CHECKING:
+    from .goal_manager import GoalManager, Goal, Milestone, GoalStatus
+    from .strategic_planner import StrategicPlanner, ProjectPlan, TimelineAdaptation
+    from .goal_reasoner import GoalAwareReasoner, GoalContext
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -12,15 +12,62 @@ Features:
 - Integration with observer system for automatic progress detection
 """
 
+import asyncio
+import atexit
+import gzip
+import heapq
 import logging
-from typing import Dict, List, Any, Optional, Union
+import operator
+import threading
+import warnings
+import weakref
+from collections import defaultdict
+from collections.abc import MutableMapping
+from contextlib import contextmanager, nullcontext
+from typing import Dict, List, Any, Optional, Set, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
 import json
+import os
+import sys
 import uuid
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Append-only mutation logs are folded into the JSON snapshot once they grow
+# past this multiple of the snapshot size (or the floor, for tiny snapshots)
+LOG_COMPACTION_RATIO = 4
+LOG_COMPACTION_MIN_BYTES = 64 * 1024
+
+# Snapshots are gzipped; level 1 keeps most of the ratio on these repetitive
+# records for little CPU
+SNAPSHOT_COMPRESSLEVEL = 1
+
+# Upserts queued inside a running event loop are written together after this delay
+FLUSH_DELAY_SECONDS = 0.1
+
+# Observed time in a goal-related app above this counts toward milestone progress
+AUTO_PROGRESS_MIN_SECONDS = 1800  # 30 minutes
+
+# Milestone fields mirrored in GoalManager's milestone columns; setting any
+# of them bumps the owning manager's column counter
+_COLUMN_FIELDS = frozenset({'goal_id', 'target_date', 'status', 'priority', 'progress_percentage'})
+
+# Setting a Milestone's status or priority bumps the owning manager's rank
+# counter, which keys its cached top active milestone per goal
+_RANK_FIELDS = frozenset({'status', 'priority'})
+
+# Goal/Milestone drop their per-instance __dict__ where dataclass supports it
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class GoalStatus(Enum):
     """Status of a goal or milestone"""
@@ -52,7 +99,221 @@ class MeasurementType(Enum):
     BEHAVIORAL = "behavioral" # Tracked through observer system
 
 
-@dataclass
+# Hot-loop constants: enum members compared by identity, and C-level sort keys
+# in place of per-call lambdas
+_ACTIVE = GoalStatus.ACTIVE
+_COMPLETED = GoalStatus.COMPLETED
+_CLOSED_STATUSES = frozenset({GoalStatus.COMPLETED, GoalStatus.CANCELLED})
+_get_priority = operator.attrgetter('priority')
+_get_rank = operator.attrgetter('priority', 'target_date')
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib json fallback for what orjson encodes natively: dataclasses, enums, datetimes"""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps_bytes(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes; Goal/Milestone objects may be passed as-is"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, default=_json_default, separators=(",", ":")).encode('utf-8')
+
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def _flush_at_exit(manager_ref: "weakref.ref[GoalManager]"):
+    """Write any upserts a GoalManager still has queued when the interpreter exits"""
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush()
+
+
+def _field_converters(f) -> tuple:
+    """(dump, load) expression templates for a field; {} is the value expression"""
+    if f.type is datetime:
+        return "{}.isoformat()", "_fromiso({})"
+    if f.type == Optional[datetime]:
+        return "(None if {0} is None else {0}.isoformat())", "(None if {0} is None else _fromiso({0}))"
+    if isinstance(f.type, type) and issubclass(f.type, Enum):
+        return f"_{f.name}_to_value[{{}}]", f"_{f.name}_from_value[{{}}]"
+    return "{}", "{}"
+
+
+def _generated_converters(cls):
+    """
+    Attach to_dict() and from_dict() to a dataclass, generated from its fields.
+    
+    Enums are stored by value (via member<->value lookup tables rather than
+    .value / Enum(...) calls) and datetimes as ISO strings. On load, fields
+    with defaults may be absent; each converter is compiled once per class.
+    Fields with init=False are runtime state and are neither stored nor loaded.
+    
+    Also attaches _from_parsed_dict(), which takes datetime fields already
+    parsed, and _date_fields, the (name, optional) datetime fields, for
+    _from_dicts.
+    """
+    namespace = {"cls": cls, "_fromiso": datetime.fromisoformat, "_MISSING": MISSING}
+    dump_items = []
+    date_fields = []
+    load_parts = {"from_dict": ([], []), "_from_parsed_dict": ([], [])}
+    
+    for f in fields(cls):
+        if not f.init:
+            continue
+        dump, load = _field_converters(f)
+        if isinstance(f.type, type) and issubclass(f.type, Enum):
+            namespace[f"_{f.name}_to_value"] = {member: member.value for member in f.type}
+            namespace[f"_{f.name}_from_value"] = {member.value: member for member in f.type}
+        
+        is_date = f.type is datetime or f.type == Optional[datetime]
+        if is_date:
+            date_fields.append((f.name, f.type != datetime))
+        
+        dump_items.append(f"{f.name!r}: {dump.format('obj.' + f.name)}")
+        for func_name, (required_args, optional_loads) in load_parts.items():
+            field_load = "{}" if is_date and func_name == "_from_parsed_dict" else load
+            if f.default is MISSING and f.default_factory is MISSING:
+                required_args.append(f"{f.name}={field_load.format(f'data[{f.name!r}]')}")
+            else:
+                optional_loads.append(
+                    f"    v = data.get({f.name!r}, _MISSING)\n"
+                    f"    if v is not _MISSING:\n"
+                    f"        kwargs[{f.name!r}] = {field_load.format('v')}\n"
+                )
+    
+    source = (
+        "def to_dict(obj):\n"
+        f"    return {{{', '.join(dump_items)}}}\n"
+    )
+    for func_name, (required_args, optional_loads) in load_parts.items():
+        source += (
+            "\n"
+            f"def {func_name}(data):\n"
+            "    kwargs = {}\n"
+            + "".join(optional_loads) +
+            f"    return cls({', '.join(required_args)}, **kwargs)\n"
+        )
+    exec(compile(source, f"<{cls.__name__} converters>", "exec"), namespace)
+    
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = "Convert to dictionary for storage"
+    from_dict = namespace["from_dict"]
+    from_dict.__doc__ = f"Rebuild a {cls.__name__} from its to_dict() form"
+    
+    cls.to_dict = to_dict
+    cls.from_dict = staticmethod(from_dict)
+    cls._from_parsed_dict = staticmethod(namespace["_from_parsed_dict"])
+    cls._date_fields = tuple(date_fields)
+    return cls
+
+
+def _from_dicts(cls, records: List[Dict[str, Any]]) -> list:
+    """
+    Rebuild many objects of a _generated_converters class from to_dict() records.
+    
+    Each datetime column is parsed in one numpy pass, about twice as fast as
+    per-value datetime.fromisoformat. Falls back to from_dict per record when
+    a column holds anything numpy would not read exactly as fromisoformat
+    does, such as non-strings or UTC offsets (numpy drops them with a warning).
+    """
+    parsed = {}
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for name, optional in cls._date_fields:
+                values = [record.get(name) for record in records]
+                if not all(isinstance(v, str) or (optional and v is None) for v in values):
+                    raise ValueError(f"unparseable {name} column")
+                parsed[name] = np.array(values, dtype='datetime64[us]').tolist()
+    except (ValueError, TypeError, Warning):
+        return [cls.from_dict(record) for record in records]
+    
+    # Copies, so the caller's records stay valid input for from_dict
+    records = [dict(record) for record in records]
+    for name, column in parsed.items():
+        for record, value in zip(records, column):
+            if name in record:
+                record[name] = value
+    return [cls._from_parsed_dict(record) for record in records]
+
+
+class _EditCounters:
+    """
+    Change counters and edit hook for one GoalManager's goals and milestones.
+    
+    The manager's maps attach their counters to each object they hold. Field
+    assignments on that object bump them and record() it for the manager's
+    mutation log; in-place edits made by Goal/Milestone methods do the same
+    through _mark_edited(). Inserts record too, and inserts and deletes bump
+    all counters. An object held by several managers reports to the last one.
+    
+    Inside batch() records are held, so an object edited many times in one
+    operation is queued once.
+    """
+    __slots__ = ('edits', 'columns', 'rank', '_manager_ref', '_held', '_batch_depth')
+    
+    def __init__(self, manager: Optional["GoalManager"] = None):
+        self.edits = 0
+        self.columns = 0
+        self.rank = 0
+        # Weak, so goals outliving their manager don't keep it alive
+        self._manager_ref = weakref.ref(manager) if manager is not None else None
+        self._held: Dict[int, Union["Goal", "Milestone"]] = {}
+        self._batch_depth = 0
+    
+    def bump_all(self):
+        self.edits += 1
+        self.columns += 1
+        self.rank += 1
+    
+    def record(self, obj: Union["Goal", "Milestone"]):
+        """Queue obj's current state for the owning manager's mutation log"""
+        if self._batch_depth:
+            self._held[id(obj)] = obj
+            return
+        manager = self._manager_ref() if self._manager_ref is not None else None
+        if manager is not None:
+            manager._queue_upsert(obj)
+    
+    @contextmanager
+    def batch(self):
+        """Record each object edited inside the block once, when the outermost block exits"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._held:
+                held, self._held = self._held, {}
+                for obj in held.values():
+                    self.record(obj)
+
+
+def _edit_batch(obj: Union["Goal", "Milestone"]):
+    """_EditCounters.batch() of the manager holding obj, or a no-op if none does"""
+    edits = getattr(obj, '_edits', None)
+    return edits.batch() if edits is not None else nullcontext()
+
+
+def _dependencies_met(milestone: "Milestone", milestones_by_id: Dict[str, "Milestone"]) -> bool:
+    """True if every milestone this one depends on exists and is completed"""
+    for dep_id in milestone.depends_on:
+        dep_milestone = milestones_by_id.get(dep_id)
+        if not dep_milestone or dep_milestone.status is not _COMPLETED:
+            return False
+    return True
+
+
+@_generated_converters
+@dataclass(**_DATACLASS_SLOTS)
 class Milestone:
     """A specific milestone within a goal"""
     id: str
@@ -84,71 +345,83 @@ class Milestone:
     obstacles_encountered: List[str] = field(default_factory=list)
     lessons_learned: List[str] = field(default_factory=list)
     
+    # Counters of the GoalManager holding this milestone (not stored)
+    _edits: Optional[_EditCounters] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if not self.id:
             self.id = f"milestone_{uuid.uuid4().hex[:8]}"
     
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        edits = getattr(self, '_edits', None)
+        if edits is not None:
+            edits.edits += 1
+            if name in _COLUMN_FIELDS:
+                edits.columns += 1
+            if name in _RANK_FIELDS:
+                edits.rank += 1
+            edits.record(self)
+    
+    def _mark_edited(self):
+        """Report an in-place edit of a list/dict field to the holding manager"""
+        edits = getattr(self, '_edits', None)
+        if edits is not None:
+            edits.edits += 1
+            edits.record(self)
+    
+    def _is_overdue(self, now: datetime) -> bool:
+        """Check if milestone is overdue as of now"""
+        return (self.status not in _CLOSED_STATUSES and 
+                now > self.target_date)
+    
+    def _days_until_deadline(self, now: datetime) -> int:
+        """Days from now until target date (negative if overdue)"""
+        return (self.target_date - now).days
+    
     @property
     def is_overdue(self) -> bool:
         """Check if milestone is overdue"""
-        return (self.status not in [GoalStatus.COMPLETED, GoalStatus.CANCELLED] and 
-                datetime.now() > self.target_date)
+        return self._is_overdue(datetime.now())
     
     @property
     def days_until_deadline(self) -> int:
         """Days until target date (negative if overdue)"""
-        return (self.target_date - datetime.now()).days
+        return self._days_until_deadline(datetime.now())
     
     def mark_completed(self, completion_notes: str = ""):
         """Mark milestone as completed"""
-        self.status = GoalStatus.COMPLETED
-        self.completion_date = datetime.now()
-        self.progress_percentage = 100.0
-        self.last_updated = datetime.now()
-        
-        if completion_notes:
-            self.lessons_learned.append(f"Completed: {completion_notes}")
+        with _edit_batch(self):
+            self.status = GoalStatus.COMPLETED
+            self.completion_date = datetime.now()
+            self.progress_percentage = 100.0
+            self.last_updated = datetime.now()
+            
+            if completion_notes:
+                self.lessons_learned.append(f"Completed: {completion_notes}")
+                self._mark_edited()
     
     def update_progress(self, progress: float, notes: str = ""):
         """Update milestone progress"""
-        self.progress_percentage = max(0.0, min(100.0, progress))
-        self.last_updated = datetime.now()
-        
-        if progress >= 100.0:
-            self.mark_completed(notes)
-        elif notes:
-            self.lessons_learned.append(f"Progress update: {notes}")
+        with _edit_batch(self):
+            self.progress_percentage = max(0.0, min(100.0, progress))
+            self.last_updated = datetime.now()
+            
+            if progress >= 100.0:
+                self.mark_completed(notes)
+            elif notes:
+                self.lessons_learned.append(f"Progress update: {notes}")
+                self._mark_edited()
     
     def add_obstacle(self, obstacle: str):
         """Record an obstacle encountered"""
         self.obstacles_encountered.append(f"{datetime.now().isoformat()}: {obstacle}")
+        # The assignment records the list edit too
         self.last_updated = datetime.now()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage"""
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'goal_id': self.goal_id,
-            'target_date': self.target_date.isoformat(),
-            'estimated_effort_hours': self.estimated_effort_hours,
-            'actual_effort_hours': self.actual_effort_hours,
-            'status': self.status.value,
-            'progress_percentage': self.progress_percentage,
-            'measurement_type': self.measurement_type.value,
-            'depends_on': self.depends_on,
-            'priority': self.priority,
-            'created_date': self.created_date.isoformat(),
-            'last_updated': self.last_updated.isoformat(),
-            'completion_date': self.completion_date.isoformat() if self.completion_date else None,
-            'success_criteria': self.success_criteria,
-            'obstacles_encountered': self.obstacles_encountered,
-            'lessons_learned': self.lessons_learned
-        }
 
 
-@dataclass
+@_generated_converters
+@dataclass(**_DATACLASS_SLOTS)
 class Goal:
     """A high-level goal with intelligent decomposition and tracking"""
     id: str
@@ -191,30 +464,69 @@ class Goal:
     related_apps: List[str] = field(default_factory=list)  # Apps associated with this goal
     activity_patterns: Dict[str, Any] = field(default_factory=dict)
     
+    # Counters of the GoalManager holding this goal (not stored)
+    _edits: Optional[_EditCounters] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         if not self.id:
             self.id = f"goal_{uuid.uuid4().hex[:8]}"
     
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        edits = getattr(self, '_edits', None)
+        if edits is not None:
+            edits.edits += 1
+            edits.record(self)
+    
+    def _mark_edited(self):
+        """Report an in-place edit of a list/dict field to the holding manager"""
+        edits = getattr(self, '_edits', None)
+        if edits is not None:
+            edits.edits += 1
+            edits.record(self)
+    
+    def _is_overdue(self, now: datetime) -> bool:
+        """Check if goal is overdue as of now"""
+        return (self.status not in _CLOSED_STATUSES and 
+                now > self.target_date)
+    
+    def _days_until_deadline(self, now: datetime) -> int:
+        """Days from now until target date (negative if overdue)"""
+        return (self.target_date - now).days
+    
     @property
     def is_overdue(self) -> bool:
         """Check if goal is overdue"""
-        return (self.status not in [GoalStatus.COMPLETED, GoalStatus.CANCELLED] and 
-                datetime.now() > self.target_date)
+        return self._is_overdue(datetime.now())
     
     @property
     def days_until_deadline(self) -> int:
         """Days until target date (negative if overdue)"""
-        return (self.target_date - datetime.now()).days
+        return self._days_until_deadline(datetime.now())
     
     @property
     def weeks_remaining(self) -> float:
         """Weeks remaining until deadline"""
         return self.days_until_deadline / 7.0
     
-    def calculate_progress_from_milestones(self, milestones: List[Milestone]) -> float:
-        """Calculate overall progress from milestone completion"""
+    def _own_milestones(self, milestones: Union[List[Milestone], "GoalManager"]) -> List[Milestone]:
+        """This goal's milestones, from a milestone list or a GoalManager's index"""
+        if isinstance(milestones, GoalManager):
+            return milestones.milestones_for_goal(self.id)
+        return [m for m in milestones if m.goal_id == self.id]
+    
+    def calculate_progress_from_milestones(self, milestones: Union[List[Milestone], "GoalManager"]) -> float:
+        """
+        Calculate overall progress from milestone completion.
+        
+        Args:
+            milestones: All milestones, or the GoalManager (uses its goal index)
+        """
         
-        goal_milestones = [m for m in milestones if m.goal_id == self.id]
+        if isinstance(milestones, GoalManager):
+            return milestones.goal_progress(self.id)
+        
+        goal_milestones = self._own_milestones(milestones)
         
         if not goal_milestones:
             return self.progress_percentage
@@ -230,85 +542,192 @@ class Goal:
         
         return weighted_progress / total_weight if total_weight > 0 else 0.0
     
-    def get_next_milestones(self, milestones: List[Milestone], limit: int = 3) -> List[Milestone]:
-        """Get next milestones to work on"""
+    def get_next_milestones(self, milestones: Union[List[Milestone], "GoalManager"], limit: int = 3) -> List[Milestone]:
+        """
+        Get next milestones to work on.
         
-        goal_milestones = [m for m in milestones if m.goal_id == self.id]
+        Args:
+            milestones: All milestones, or the GoalManager (uses its goal index)
+            limit: Maximum milestones to return
+        """
         
-        # Filter available milestones (not completed, dependencies met)
-        available = []
-        for milestone in goal_milestones:
-            if milestone.status in [GoalStatus.COMPLETED, GoalStatus.CANCELLED]:
-                continue
-            
-            # Check if dependencies are met
-            dependencies_met = True
-            for dep_id in milestone.depends_on:
-                dep_milestone = next((m for m in milestones if m.id == dep_id), None)
-                if not dep_milestone or dep_milestone.status != GoalStatus.COMPLETED:
-                    dependencies_met = False
-                    break
-            
-            if dependencies_met:
-                available.append(milestone)
+        goal_milestones = self._own_milestones(milestones)
         
-        # Sort by priority and deadline
-        available.sort(key=lambda m: (m.priority, m.target_date))
+        # Filter available milestones (not completed, dependencies met)
+        if isinstance(milestones, GoalManager):
+            milestones_by_id = milestones.milestones
+        else:
+            milestones_by_id = {m.id: m for m in milestones}
+        available = [
+            m for m in goal_milestones
+            if m.status not in _CLOSED_STATUSES
+            and _dependencies_met(m, milestones_by_id)
+        ]
         
-        return available[:limit]
+        # Top `limit` by priority and deadline, without sorting the rest
+        return heapq.nsmallest(limit, available, key=_get_rank)
     
     def add_related_app(self, app_name: str):
         """Add an app that's related to working on this goal"""
         if app_name not in self.related_apps:
             self.related_apps.append(app_name)
+            self._mark_edited()
     
     def update_from_observer_data(self, activity_data: Dict[str, Any]):
         """Update goal based on observer system data"""
         
-        # Track time spent in related apps
-        for app_name, time_spent in activity_data.get('app_usage', {}).items():
-            if app_name in self.related_apps:
-                if 'app_time_tracking' not in self.activity_patterns:
-                    self.activity_patterns['app_time_tracking'] = {}
-                
-                self.activity_patterns['app_time_tracking'][app_name] = (
-                    self.activity_patterns['app_time_tracking'].get(app_name, 0) + time_spent
-                )
+        with _edit_batch(self):
+            # Track time spent in related apps
+            related_apps = set(self.related_apps)
+            for app_name, time_spent in activity_data.get('app_usage', {}).items():
+                if app_name in related_apps:
+                    self._track_app_time(app_name, time_spent)
+            
+            self._track_productive_hours(activity_data)
+    
+    def _track_app_time(self, app_name: str, time_spent: int):
+        """Add observed time in a related app to the activity patterns"""
+        if 'app_time_tracking' not in self.activity_patterns:
+            self.activity_patterns['app_time_tracking'] = {}
         
-        # Update preferred work times based on when goal-related work happens
+        self.activity_patterns['app_time_tracking'][app_name] = (
+            self.activity_patterns['app_time_tracking'].get(app_name, 0) + time_spent
+        )
+        self._mark_edited()
+    
+    def _track_productive_hours(self, activity_data: Dict[str, Any]):
+        """Update preferred work times based on when goal-related work happens"""
         productive_hours = activity_data.get('productive_hours', [])
         if productive_hours:
             self.activity_patterns['productive_hours'] = productive_hours
+            self._mark_edited()
+
+
+class _LazyObjectMap(MutableMapping):
+    """
+    ID -> Goal/Milestone mapping whose entries may still be raw to_dict() records.
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage"""
-        return {
-            'id': self.id,
-            'title': self.title,
-            'description': self.description,
-            'goal_type': self.goal_type.value,
-            'target_date': self.target_date.isoformat(),
-            'created_date': self.created_date.isoformat(),
-            'estimated_duration_weeks': self.estimated_duration_weeks,
-            'status': self.status.value,
-            'progress_percentage': self.progress_percentage,
-            'measurement_type': self.measurement_type.value,
-            'parent_goal_id': self.parent_goal_id,
-            'sub_goal_ids': self.sub_goal_ids,
-            'milestone_ids': self.milestone_ids,
-            'motivation': self.motivation,
-            'success_vision': self.success_vision,
-            'impact_areas': self.impact_areas,
-            'priority': self.priority,
-            'energy_level_required': self.energy_level_required,
-            'preferred_work_times': self.preferred_work_times,
-            'success_metrics': self.success_metrics,
-            'risk_factors': self.risk_factors,
-            'mitigation_strategies': self.mitigation_strategies,
-            'lessons_learned': self.lessons_learned,
-            'related_apps': self.related_apps,
-            'activity_patterns': self.activity_patterns
-        }
+    Loading keeps the parsed records as-is; a record becomes an object the
+    first time it is read, and values()/items() materialize everything still
+    pending in one batched _from_dicts pass. Entries keep their load order.
+    A record that fails to convert is logged and dropped.
+    """
+    
+    def __init__(self, cls, edits: _EditCounters, records: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.cls = cls
+        self.edits = edits
+        self.logger = logging.getLogger(__name__)
+        # Values are objects, or dicts for records not yet materialized
+        self._entries: Dict[str, Any] = dict(records or {})
+        edits.bump_all()
+    
+    def __getitem__(self, key: str):
+        value = self._entries[key]
+        if type(value) is dict:
+            try:
+                value = self.cls.from_dict(value)
+            except Exception as e:
+                self.logger.error(f"Dropping unreadable {self.cls.__name__} {key}: {e}")
+                del self._entries[key]
+                self.edits.bump_all()
+                raise KeyError(key) from e
+            object.__setattr__(value, '_edits', self.edits)
+            self._entries[key] = value
+        return value
+    
+    def __setitem__(self, key: str, value):
+        object.__setattr__(value, '_edits', self.edits)
+        self._entries[key] = value
+        self.edits.bump_all()
+        self.edits.record(value)
+    
+    def __delitem__(self, key: str):
+        value = self._entries.pop(key)
+        if type(value) is not dict:
+            # Later edits to a removed object must not re-add it to the log
+            object.__setattr__(value, '_edits', None)
+        self.edits.bump_all()
+    
+    def __iter__(self):
+        return iter(self._entries)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+    
+    def values(self):
+        self._materialize_all()
+        return self._entries.values()
+    
+    def items(self):
+        self._materialize_all()
+        return self._entries.items()
+    
+    def values_where(self, name: str, member: Enum) -> list:
+        """
+        Objects whose enum field `name` equals member, materializing only those.
+        
+        Pending records are matched on their stored value.
+        """
+        matches = []
+        for key, value in list(self._entries.items()):
+            if type(value) is dict:
+                if value.get(name) != member.value:
+                    continue
+                try:
+                    value = self[key]
+                except KeyError:
+                    continue
+            if getattr(value, name) is member:
+                matches.append(value)
+        return matches
+    
+    def storage_values(self) -> list:
+        """Entries for writing a snapshot: objects, plus pending records as loaded"""
+        return list(self._entries.values())
+    
+    def _materialize_all(self):
+        """Turn every pending record into an object"""
+        pending = [(key, value) for key, value in self._entries.items() if type(value) is dict]
+        if not pending:
+            return
+        
+        try:
+            objects = _from_dicts(self.cls, [record for _, record in pending])
+        except Exception:
+            # Some record is unreadable; convert one by one so only it is dropped
+            for key, _ in pending:
+                try:
+                    self[key]
+                except KeyError:
+                    pass
+            return
+        
+        for (key, _), obj in zip(pending, objects):
+            object.__setattr__(obj, '_edits', self.edits)
+            self._entries[key] = obj
+
+
+_STATUS_CODES = {status: code for code, status in enumerate(GoalStatus)}
+_CLOSED_STATUS_CODES = np.array([_STATUS_CODES[GoalStatus.COMPLETED], _STATUS_CODES[GoalStatus.CANCELLED]], dtype=np.uint8)
+
+
+@dataclass
+class _MilestoneColumns:
+    """Parallel arrays over GoalManager.milestones, one row per milestone"""
+    milestones: List[Milestone]
+    priority: np.ndarray     # int64
+    deadline: np.ndarray     # datetime64[us]
+    status: np.ndarray       # uint8 codes from _STATUS_CODES
+    progress: np.ndarray     # float64 progress_percentage
+    goal: np.ndarray         # int64 codes into goal_codes
+    goal_codes: Dict[str, int]
+    
+    # Per goal code: sum of (6 - priority) and of progress weighted by it
+    goal_weight: np.ndarray
+    goal_weighted_progress: np.ndarray
 
 
 class GoalManager:
@@ -327,8 +746,37 @@ class GoalManager:
         self.logger = logging.getLogger(__name__)
         
         # Goal storage
-        self.goals: Dict[str, Goal] = {}
-        self.milestones: Dict[str, Milestone] = {}
+        # Loaded records become objects on first access (see _LazyObjectMap)
+        self._edits = _EditCounters(self)
+        self.goals: MutableMapping[str, Goal] = _LazyObjectMap(Goal, self._edits)
+        self.milestones: MutableMapping[str, Milestone] = _LazyObjectMap(Milestone, self._edits)
+        
+        # goal_id -> milestone IDs; rebuilt if milestones are added or
+        # removed without going through _index_milestone
+        self._goal_milestones: Dict[str, List[str]] = defaultdict(list)
+        self._indexed_milestone_count = 0
+        
+        # Column view of self.milestones for get_next_actions and goal_progress,
+        # keyed by self._edits.columns at build time
+        self._columns: Optional[_MilestoneColumns] = None
+        self._columns_key: Optional[int] = None
+        
+        # goal_id -> (cache key, ID of its highest-priority active milestone)
+        self._top_active_cache: Dict[str, tuple] = {}
+        
+        # Uncompressed bytes in each snapshot / mutation log, keyed by store name
+        self._snapshot_bytes: Dict[str, int] = {"goals": 0, "milestones": 0}
+        self._log_bytes: Dict[str, int] = {"goals": 0, "milestones": 0}
+        
+        # Upserts waiting for the debounced flush, keyed by store then object ID
+        self._pending: Dict[str, Dict[str, Union[Goal, Milestone]]] = {"goals": {}, "milestones": {}}
+        self._flush_lock = threading.Lock()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
+        atexit.register(_flush_at_exit, weakref.ref(self))
+        
+        # In-flight decompositions started by create_goal
+        self._decomposition_tasks: Set[asyncio.Task] = set()
         
         # Load existing data
         self._load_goals()
@@ -354,21 +802,79 @@ class GoalManager:
         )
         
         self.goals[goal.id] = goal
-        self._save_goals()
         
         self.logger.info(f"Created new goal: {goal.title} (ID: {goal.id})")
         
         # Trigger intelligent decomposition
         if self.ai_interface:
-            asyncio.create_task(self._decompose_goal_intelligently(goal))
+            try:
+                task = asyncio.get_running_loop().create_task(self._decompose_goal_intelligently(goal))
+            except RuntimeError:
+                self.logger.warning(f"No running event loop; skipping decomposition of goal {goal.id}")
+            else:
+                # Keep a reference so the task is not garbage-collected mid-flight
+                self._decomposition_tasks.add(task)
+                task.add_done_callback(self._decomposition_tasks.discard)
         
         return goal
     
+    async def create_goals_bulk(self, specs: List[Dict[str, Any]]) -> List[Goal]:
+        """
+        Create several goals and decompose them together.
+        
+        Args:
+            specs: create_goal keyword arguments per goal (title, description,
+                target_date, optional goal_type and Goal fields)
+        
+        Returns:
+            The created goals, in spec order
+        """
+        goals = []
+        for spec in specs:
+            spec = dict(spec)
+            goal = Goal(
+                id="",  # Will be auto-generated
+                title=spec.pop('title'),
+                description=spec.pop('description'),
+                goal_type=spec.pop('goal_type', GoalType.PROJECT),
+                target_date=spec.pop('target_date'),
+                **spec
+            )
+            self.goals[goal.id] = goal
+            goals.append(goal)
+        
+        self.logger.info(f"Created {len(goals)} goals in bulk")
+        
+        if self.ai_interface and goals:
+            try:
+                prompts = [self._decomposition_prompt(goal) for goal in goals]
+                suggestions = await self._get_ai_milestone_suggestions_batch(prompts)
+            except Exception as e:
+                self.logger.error(f"Error in bulk goal decomposition: {e}")
+            else:
+                for goal, milestones_data in zip(goals, suggestions):
+                    try:
+                        self._apply_milestone_suggestions(goal, milestones_data)
+                    except Exception as e:
+                        self.logger.error(f"Error decomposing goal {goal.id}: {e}")
+        
+        return goals
+    
     async def _decompose_goal_intelligently(self, goal: Goal):
         """Use AI to intelligently decompose goal into milestones"""
         
         try:
-            decomposition_prompt = f"""
+            # This would call the AI interface to generate milestones
+            # For now, we'll create a basic structure
+            milestones_data = await self._get_ai_milestone_suggestions(self._decomposition_prompt(goal))
+            self._apply_milestone_suggestions(goal, milestones_data)
+            
+        except Exception as e:
+            self.logger.error(f"Error in intelligent goal decomposition: {e}")
+    
+    def _decomposition_prompt(self, goal: Goal) -> str:
+        """Prompt asking the AI to break a goal into milestones"""
+        return f"""
 Break down this goal into specific, actionable milestones:
 
 Goal: {goal.title}
@@ -386,11 +892,10 @@ Create 3-7 milestones that:
 
 Format as JSON array with fields: title, description, estimated_effort_hours, success_criteria, priority (1-5)
 """
-            
-            # This would call the AI interface to generate milestones
-            # For now, we'll create a basic structure
-            milestones_data = await self._get_ai_milestone_suggestions(decomposition_prompt)
-            
+    
+    def _apply_milestone_suggestions(self, goal: Goal, milestones_data: List[Dict[str, Any]]):
+        """Create and store the suggested milestones for a goal"""
+        with self._edits.batch():
             for i, milestone_data in enumerate(milestones_data):
                 milestone = Milestone(
                     id="",  # Auto-generated
@@ -404,15 +909,21 @@ Format as JSON array with fields: title, description, estimated_effort_hours, su
                 )
                 
                 self.milestones[milestone.id] = milestone
+                self._index_milestone(milestone)
                 goal.milestone_ids.append(milestone.id)
             
-            self._save_goals()
-            self._save_milestones()
-            
-            self.logger.info(f"Generated {len(milestones_data)} milestones for goal: {goal.title}")
-            
-        except Exception as e:
-            self.logger.error(f"Error in intelligent goal decomposition: {e}")
+            goal._mark_edited()
+        
+        self.logger.info(f"Generated {len(milestones_data)} milestones for goal: {goal.title}")
+    
+    async def _get_ai_milestone_suggestions_batch(self, prompts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Get AI-generated milestone suggestions for several prompts at once.
+        
+        A backend with a batch API should override this; by default the
+        single-prompt calls run concurrently.
+        """
+        return list(await asyncio.gather(*(self._get_ai_milestone_suggestions(prompt) for prompt in prompts)))
     
     async def _get_ai_milestone_suggestions(self, prompt: str) -> List[Dict[str, Any]]:
         """Get AI-generated milestone suggestions"""
@@ -453,65 +964,222 @@ Format as JSON array with fields: title, description, estimated_effort_hours, su
         
         return milestone_date
     
+    @property
+    def version(self) -> int:
+        """
+        Changes whenever a goal or milestone is added, removed or edited.
+        
+        In-place edits of list/dict fields made outside the Goal/Milestone
+        methods (e.g. goal.related_apps.append) are not seen.
+        """
+        return self._edits.edits
+    
     def get_active_goals(self) -> List[Goal]:
         """Get all active goals"""
-        return [goal for goal in self.goals.values() if goal.status == GoalStatus.ACTIVE]
+        return self.goals.values_where('status', _ACTIVE)
     
-    def get_overdue_items(self) -> Dict[str, List[Union[Goal, Milestone]]]:
-        """Get overdue goals and milestones"""
+    def get_overdue_items(self, now: Optional[datetime] = None) -> Dict[str, List[Union[Goal, Milestone]]]:
+        """Get overdue goals and milestones as of now (default: current time)"""
         
-        overdue_goals = [goal for goal in self.goals.values() if goal.is_overdue]
-        overdue_milestones = [milestone for milestone in self.milestones.values() if milestone.is_overdue]
+        if now is None:
+            now = datetime.now()
+        
+        overdue_goals = [goal for goal in self.goals.values() if goal._is_overdue(now)]
+        overdue_milestones = [milestone for milestone in self.milestones.values() if milestone._is_overdue(now)]
         
         return {
             'goals': overdue_goals,
             'milestones': overdue_milestones
         }
     
+    def first_overdue_milestone(self, now: Optional[datetime] = None) -> Optional[Milestone]:
+        """The first of get_overdue_items(now)['milestones'], found on the milestone columns"""
+        if now is None:
+            now = datetime.now()
+        if not self.milestones:
+            return None
+        
+        columns = self._milestone_columns()
+        overdue_mask = ~np.isin(columns.status, _CLOSED_STATUS_CODES) & (columns.deadline < np.datetime64(now, 'us'))
+        
+        rows = np.flatnonzero(overdue_mask)
+        return columns.milestones[rows[0]] if len(rows) else None
+    
+    def get_urgent_milestones(self, now: Optional[datetime] = None, within_days: int = 7) -> List[Milestone]:
+        """
+        Active milestones due within the next within_days days, soonest first.
+        
+        Filtered and ordered on the milestone columns; milestones due the same
+        day keep insertion order.
+        """
+        if now is None:
+            now = datetime.now()
+        if not self.milestones:
+            return []
+        
+        columns = self._milestone_columns()
+        
+        # Whole days until deadline, floored like timedelta.days
+        days = (columns.deadline - np.datetime64(now, 'us')) // np.timedelta64(1, 'D')
+        urgent_mask = (columns.status == _STATUS_CODES[_ACTIVE]) & (days >= 0) & (days <= within_days)
+        
+        candidates = np.flatnonzero(urgent_mask)
+        order = candidates[np.argsort(days[candidates], kind='stable')]
+        return [columns.milestones[row] for row in order.tolist()]
+    
     def get_next_actions(self, limit: int = 5) -> List[Milestone]:
-        """Get next actions across all active goals"""
+        """
+        Get next actions across all active goals.
+        
+        Same result as merging each active goal's get_next_milestones(limit=2),
+        but ranked in one vectorized pass over the milestone columns.
+        """
+        per_goal_limit = 2
+        
+        goal_rank = {goal.id: rank for rank, goal in enumerate(self.get_active_goals())}
+        if limit <= 0 or not goal_rank or not self.milestones:
+            return []
+        
+        columns = self._milestone_columns()
+        
+        rank_by_code = np.full(len(columns.goal_codes), -1, dtype=np.int64)
+        for goal_id, code in columns.goal_codes.items():
+            rank_by_code[code] = goal_rank.get(goal_id, -1)
+        milestone_rank = rank_by_code[columns.goal]
+        
+        open_mask = (milestone_rank >= 0) & ~np.isin(columns.status, _CLOSED_STATUS_CODES)
+        candidates = np.flatnonzero(open_mask)
+        
+        # Priority, then deadline; ties keep goal order, then insertion order
+        order = candidates[np.lexsort((
+            candidates,
+            milestone_rank[candidates],
+            columns.deadline[candidates],
+            columns.priority[candidates],
+        ))]
         
         next_actions = []
+        taken_per_goal: Dict[str, int] = defaultdict(int)
+        for row in order.tolist():
+            milestone = columns.milestones[row]
+            if taken_per_goal[milestone.goal_id] >= per_goal_limit:
+                continue
+            if not _dependencies_met(milestone, self.milestones):
+                continue
+            
+            taken_per_goal[milestone.goal_id] += 1
+            next_actions.append(milestone)
+            if len(next_actions) == limit:
+                break
+        
+        return next_actions
+    
+    def _milestone_columns(self) -> _MilestoneColumns:
+        """Column view of self.milestones, rebuilt when a mirrored field or the milestone set changed"""
+        # Materialize pending records before reading the key
+        milestones = self.milestones.values()
+        key = self._edits.columns
+        if self._columns is not None and self._columns_key == key:
+            return self._columns
         
-        for goal in self.get_active_goals():
-            goal_next = goal.get_next_milestones(list(self.milestones.values()), limit=2)
-            next_actions.extend(goal_next)
+        milestones = list(milestones)
+        count = len(milestones)
+        goal_codes: Dict[str, int] = {}
         
-        # Sort by priority and deadline
-        next_actions.sort(key=lambda m: (m.priority, m.target_date))
+        priority = np.fromiter((m.priority for m in milestones), dtype=np.int64, count=count)
+        progress = np.fromiter((m.progress_percentage for m in milestones), dtype=np.float64, count=count)
+        goal = np.fromiter(
+            (goal_codes.setdefault(m.goal_id, len(goal_codes)) for m in milestones),
+            dtype=np.int64, count=count
+        )
+        
+        # Higher priority = more weight, as in calculate_progress_from_milestones
+        weight = 6 - priority
         
-        return next_actions[:limit]
+        self._columns = _MilestoneColumns(
+            milestones=milestones,
+            priority=priority,
+            deadline=np.array([m.target_date for m in milestones], dtype='datetime64[us]'),
+            status=np.fromiter((_STATUS_CODES[m.status] for m in milestones), dtype=np.uint8, count=count),
+            progress=progress,
+            goal=goal,
+            goal_codes=goal_codes,
+            goal_weight=np.bincount(goal, weights=weight, minlength=len(goal_codes)),
+            goal_weighted_progress=np.bincount(goal, weights=progress * weight, minlength=len(goal_codes))
+        )
+        self._columns_key = key
+        return self._columns
     
-    def update_progress_from_observer(self, observer_data: Dict[str, Any]):
-        """Update goal progress based on observer system data"""
+    def goal_progress(self, goal_id: str) -> float:
+        """
+        Weighted milestone progress for a goal, from the milestone columns.
+        
+        Matches Goal.calculate_progress_from_milestones; falls back to the
+        goal's own progress_percentage when it has no milestones.
+        """
+        goal = self.goals.get(goal_id)
+        columns = self._milestone_columns()
         
-        for goal in self.get_active_goals():
-            goal.update_from_observer_data(observer_data)
+        code = columns.goal_codes.get(goal_id)
+        if code is None:
+            return goal.progress_percentage if goal else 0.0
         
-        # Auto-detect progress in goal-related activities
-        app_usage = observer_data.get('app_usage', {})
+        total_weight = columns.goal_weight[code]
+        if total_weight <= 0:
+            return 0.0
+        return float(columns.goal_weighted_progress[code] / total_weight)
+    
+    def update_progress_from_observer(self, observer_data: Dict[str, Any]):
+        """Update goal progress based on observer system data"""
         
-        for goal in self.get_active_goals():
-            for app_name in goal.related_apps:
-                if app_name in app_usage:
-                    time_spent = app_usage[app_name]
-                    
-                    # Simple heuristic: significant time in goal-related app = progress
-                    if time_spent > 1800:  # 30 minutes
+        with self._edits.batch():
+            active_goals = self.get_active_goals()
+            app_usage = observer_data.get('app_usage', {})
+            
+            # Invert related_apps once per tick, so each used app finds its goals
+            # directly instead of every goal scanning every used app
+            goals_by_app: Dict[str, List[Goal]] = defaultdict(list)
+            for goal in active_goals:
+                for app_name in dict.fromkeys(goal.related_apps):
+                    goals_by_app[app_name].append(goal)
+            
+            for app_name, time_spent in app_usage.items():
+                for goal in goals_by_app.get(app_name, ()):
+                    goal._track_app_time(app_name, time_spent)
+            
+            for goal in active_goals:
+                goal._track_productive_hours(observer_data)
+            
+            # Auto-detect progress in goal-related activities
+            # Simple heuristic: significant time in goal-related app = progress
+            significant_usage = {
+                app_name: time_spent for app_name, time_spent in app_usage.items()
+                if time_spent > AUTO_PROGRESS_MIN_SECONDS and app_name in goals_by_app
+            }
+            if not significant_usage:
+                return
+            
+            # Only goals tied to a significant app are visited; each goal's apps are
+            # still applied in related_apps order, since a completed milestone hands
+            # later updates on to the next one
+            touched_goals = {}
+            for app_name in significant_usage:
+                for goal in goals_by_app[app_name]:
+                    touched_goals[goal.id] = goal
+            
+            for goal in touched_goals.values():
+                for app_name in goal.related_apps:
+                    time_spent = significant_usage.get(app_name)
+                    if time_spent is not None:
                         self._auto_update_milestone_progress(goal, app_name, time_spent)
     
     def _auto_update_milestone_progress(self, goal: Goal, app_name: str, time_spent: int):
         """Auto-update milestone progress based on observed activity"""
         
-        active_milestones = [
-            self.milestones[mid] for mid in goal.milestone_ids
-            if mid in self.milestones and self.milestones[mid].status == GoalStatus.ACTIVE
-        ]
+        # Update the highest priority active milestone
+        milestone = self.top_active_milestone(goal)
         
-        if active_milestones:
-            # Update the highest priority active milestone
-            milestone = min(active_milestones, key=lambda m: m.priority)
-            
+        if milestone is not None:
             # Estimate progress based on time spent (rough heuristic)
             estimated_progress = (time_spent / 3600) / milestone.estimated_effort_hours * 100
             
@@ -521,6 +1189,51 @@ Format as JSON array with fields: title, description, estimated_effort_hours, su
                 f"Auto-updated from {app_name} activity ({time_spent//60} minutes)"
             )
     
+    def top_active_milestone(self, goal: Goal) -> Optional[Milestone]:
+        """
+        The goal's highest-priority ACTIVE milestone, memoized per goal.
+        
+        Reused until a milestone's status or priority is set, a milestone is
+        added or removed, or the goal's milestone list changes length.
+        """
+        key = (self._edits.rank, len(goal.milestone_ids))
+        cached = self._top_active_cache.get(goal.id)
+        if cached is not None and cached[0] == key:
+            return self.milestones.get(cached[1]) if cached[1] is not None else None
+        
+        active_milestones = [
+            self.milestones[mid] for mid in goal.milestone_ids
+            if mid in self.milestones and self.milestones[mid].status is _ACTIVE
+        ]
+        top = min(active_milestones, key=_get_priority) if active_milestones else None
+        
+        self._top_active_cache[goal.id] = (key, top.id if top is not None else None)
+        return top
+    
+    def _index_milestone(self, milestone: Milestone):
+        """Add a milestone stored in self.milestones to the goal index"""
+        self._goal_milestones[milestone.goal_id].append(milestone.id)
+        self._indexed_milestone_count += 1
+    
+    def _rebuild_milestone_index(self):
+        """Rebuild the goal index from self.milestones"""
+        self._goal_milestones = defaultdict(list)
+        for milestone in self.milestones.values():
+            self._goal_milestones[milestone.goal_id].append(milestone.id)
+        self._indexed_milestone_count = len(self.milestones)
+    
+    def milestones_for_goal(self, goal_id: str) -> List[Milestone]:
+        """Milestones belonging to a goal, via the goal index"""
+        if self._indexed_milestone_count != len(self.milestones):
+            self._rebuild_milestone_index()
+        
+        goal_milestones = []
+        for milestone_id in self._goal_milestones.get(goal_id, ()):
+            milestone = self.milestones.get(milestone_id)
+            if milestone is not None and milestone.goal_id == goal_id:
+                goal_milestones.append(milestone)
+        return goal_milestones
+    
     def get_goal_by_id(self, goal_id: str) -> Optional[Goal]:
         """Get goal by ID"""
         return self.goals.get(goal_id)
@@ -534,7 +1247,7 @@ Format as JSON array with fields: title, description, estimated_effort_hours, su
         
         total_goals = len(self.goals)
         active_goals = len(self.get_active_goals())
-        completed_goals = len([g for g in self.goals.values() if g.status == GoalStatus.COMPLETED])
+        completed_goals = len(self.goals.values_where('status', _COMPLETED))
         overdue_items = self.get_overdue_items()
         
         return {
@@ -547,100 +1260,160 @@ Format as JSON array with fields: title, description, estimated_effort_hours, su
             'completion_rate': (completed_goals / total_goals * 100) if total_goals > 0 else 0
         }
     
+    def _queue_upsert(self, obj: Union[Goal, Milestone]):
+        """
+        Queue an upsert for the object's store log.
+        
+        Called through _EditCounters.record() whenever a held goal or
+        milestone is inserted or edited, so this is the dirty set for both.
+        
+        Inside a running event loop the write is debounced by FLUSH_DELAY_SECONDS,
+        so a burst of mutations costs one append; repeated upserts of the same
+        object collapse into one line. Without a loop it is written immediately,
+        but edits inside an _EditCounters.batch() (the multi-field Goal and
+        Milestone methods, the observer tick) still arrive once per object.
+        """
+        store = "goals" if type(obj) is Goal else "milestones"
+        with self._flush_lock:
+            self._pending[store][obj.id] = obj
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        
+        with self._flush_lock:
+            if self._flush_handle is None or self._flush_loop is not loop:
+                self._flush_loop = loop
+                self._flush_handle = loop.call_later(FLUSH_DELAY_SECONDS, self.flush)
+    
+    def flush(self):
+        """Write all queued upserts now, compacting if a log has grown too large"""
+        with self._flush_lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            pending = self._pending
+            self._pending = {"goals": {}, "milestones": {}}
+        
+        needs_compaction = False
+        for store, objects in pending.items():
+            if not objects:
+                continue
+            
+            data = b"".join(
+                _dumps_bytes({"op": "upsert", "id": obj_id, "obj": obj}) + b"\n"
+                for obj_id, obj in objects.items()
+            )
+            with open(self.storage_dir / f"{store}.log", 'ab') as f:
+                f.write(data)
+            
+            self._log_bytes[store] += len(data)
+            threshold = LOG_COMPACTION_RATIO * max(self._snapshot_bytes[store], LOG_COMPACTION_MIN_BYTES)
+            needs_compaction = needs_compaction or self._log_bytes[store] > threshold
+        
+        if needs_compaction:
+            self._compact()
+    
+    def _compact(self):
+        """Rewrite both snapshots from memory and truncate their logs"""
+        # The snapshots cover everything in memory, including queued upserts
+        with self._flush_lock:
+            self._pending = {"goals": {}, "milestones": {}}
+        self._save_goals()
+        self._save_milestones()
+    
     def _save_goals(self):
         """Save goals to storage"""
-        goals_file = self.storage_dir / "goals.json"
-        
-        with open(goals_file, 'w') as f:
-            json.dump([goal.to_dict() for goal in self.goals.values()], f, indent=2)
+        self._write_snapshot("goals", self.goals.storage_values())
     
     def _save_milestones(self):
         """Save milestones to storage"""
-        milestones_file = self.storage_dir / "milestones.json"
+        self._write_snapshot("milestones", self.milestones.storage_values())
+    
+    def _write_snapshot(self, store: str, records: List[Union[Goal, Milestone, Dict[str, Any]]]):
+        """
+        Atomically replace a store's gzipped snapshot, then truncate its log.
+        
+        A crash between the two steps only leaves upserts that replay onto
+        the new snapshot unchanged.
+        """
+        snapshot_file = self.storage_dir / f"{store}.json.gz"
+        tmp_file = self.storage_dir / f"{store}.json.gz.tmp"
+        data = _dumps_bytes(records)
+        
+        with gzip.open(tmp_file, 'wb', compresslevel=SNAPSHOT_COMPRESSLEVEL) as f:
+            f.write(data)
+        os.replace(tmp_file, snapshot_file)
+        
+        # An uncompressed snapshot from before gzip storage is now superseded
+        legacy_file = self.storage_dir / f"{store}.json"
+        if legacy_file.exists():
+            legacy_file.unlink()
+        
+        open(self.storage_dir / f"{store}.log", 'w').close()
         
-        with open(milestones_file, 'w') as f:
-            json.dump([milestone.to_dict() for milestone in self.milestones.values()], f, indent=2)
+        self._snapshot_bytes[store] = len(data)
+        self._log_bytes[store] = 0
     
-    def _load_goals(self):
-        """Load goals from storage"""
-        goals_file = self.storage_dir / "goals.json"
+    def _read_store(self, store: str) -> Dict[str, Dict[str, Any]]:
+        """Read a store's snapshot and replay its log on top, keyed by ID"""
+        records: Dict[str, Dict[str, Any]] = {}
         
-        if goals_file.exists():
-            try:
-                with open(goals_file, 'r') as f:
-                    goals_data = json.load(f)
-                
-                for goal_data in goals_data:
-                    # Convert back to Goal object
-                    goal = Goal(
-                        id=goal_data['id'],
-                        title=goal_data['title'],
-                        description=goal_data['description'],
-                        goal_type=GoalType(goal_data['goal_type']),
-                        target_date=datetime.fromisoformat(goal_data['target_date']),
-                        created_date=datetime.fromisoformat(goal_data['created_date']),
-                        estimated_duration_weeks=goal_data['estimated_duration_weeks'],
-                        status=GoalStatus(goal_data['status']),
-                        progress_percentage=goal_data['progress_percentage'],
-                        measurement_type=MeasurementType(goal_data['measurement_type']),
-                        parent_goal_id=goal_data.get('parent_goal_id'),
-                        sub_goal_ids=goal_data.get('sub_goal_ids', []),
-                        milestone_ids=goal_data.get('milestone_ids', []),
-                        motivation=goal_data.get('motivation', ''),
-                        success_vision=goal_data.get('success_vision', ''),
-                        impact_areas=goal_data.get('impact_areas', []),
-                        priority=goal_data.get('priority', 3),
-                        energy_level_required=goal_data.get('energy_level_required', 'medium'),
-                        preferred_work_times=goal_data.get('preferred_work_times', []),
-                        success_metrics=goal_data.get('success_metrics', []),
-                        risk_factors=goal_data.get('risk_factors', []),
-                        mitigation_strategies=goal_data.get('mitigation_strategies', []),
-                        lessons_learned=goal_data.get('lessons_learned', []),
-                        related_apps=goal_data.get('related_apps', []),
-                        activity_patterns=goal_data.get('activity_patterns', {})
-                    )
-                    
-                    self.goals[goal.id] = goal
-                
-            except Exception as e:
-                self.logger.error(f"Error loading goals: {e}")
+        # Fall back to an uncompressed snapshot written before gzip storage
+        snapshot_file = self.storage_dir / f"{store}.json.gz"
+        legacy_file = self.storage_dir / f"{store}.json"
+        data = None
+        if snapshot_file.exists():
+            with gzip.open(snapshot_file, 'rb') as f:
+                data = f.read()
+        elif legacy_file.exists():
+            with open(legacy_file, 'rb') as f:
+                data = f.read()
+        
+        if data is not None:
+            # Uncompressed size, which log growth is measured against
+            self._snapshot_bytes[store] = len(data)
+            for record in _loads(data):
+                records[record['id']] = record
+        
+        log_file = self.storage_dir / f"{store}.log"
+        if log_file.exists():
+            self._log_bytes[store] = log_file.stat().st_size
+            with open(log_file, 'rb') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = _loads(line)
+                    except json.JSONDecodeError:
+                        # Most likely a write torn by a crash; later lines still apply
+                        self.logger.warning(f"Skipping malformed {store}.log line {line_number}")
+                        continue
+                    if entry.get('op') == 'upsert':
+                        records[entry['id']] = entry['obj']
+        
+        return records
+    
+    def _load_goals(self):
+        """Load goal records from the snapshot plus log; objects are built on access"""
+        try:
+            self.goals = _LazyObjectMap(Goal, self._edits, self._read_store("goals"))
+            
+        except Exception as e:
+            self.logger.error(f"Error loading goals: {e}")
     
     def _load_milestones(self):
-        """Load milestones from storage"""
-        milestones_file = self.storage_dir / "milestones.json"
-        
-        if milestones_file.exists():
-            try:
-                with open(milestones_file, 'r') as f:
-                    milestones_data = json.load(f)
-                
-                for milestone_data in milestones_data:
-                    milestone = Milestone(
-                        id=milestone_data['id'],
-                        title=milestone_data['title'],
-                        description=milestone_data['description'],
-                        goal_id=milestone_data['goal_id'],
-                        target_date=datetime.fromisoformat(milestone_data['target_date']),
-                        estimated_effort_hours=milestone_data['estimated_effort_hours'],
-                        actual_effort_hours=milestone_data.get('actual_effort_hours', 0.0),
-                        status=GoalStatus(milestone_data['status']),
-                        progress_percentage=milestone_data['progress_percentage'],
-                        measurement_type=MeasurementType(milestone_data['measurement_type']),
-                        depends_on=milestone_data.get('depends_on', []),
-                        priority=milestone_data.get('priority', 1),
-                        created_date=datetime.fromisoformat(milestone_data['created_date']),
-                        last_updated=datetime.fromisoformat(milestone_data['last_updated']),
-                        completion_date=datetime.fromisoformat(milestone_data['completion_date']) if milestone_data.get('completion_date') else None,
-                        success_criteria=milestone_data.get('success_criteria', []),
-                        obstacles_encountered=milestone_data.get('obstacles_encountered', []),
-                        lessons_learned=milestone_data.get('lessons_learned', [])
-                    )
-                    
-                    self.milestones[milestone.id] = milestone
-                
-            except Exception as e:
-                self.logger.error(f"Error loading milestones: {e}")
-
-
-# Import asyncio for async operations
-import asyncio
\ No newline at end of file
+        """Load milestone records from the snapshot plus log; objects are built on access"""
+        try:
+            records = self._read_store("milestones")
+            self.milestones = _LazyObjectMap(Milestone, self._edits, records)
+            
+            # Index by goal straight from the records, without materializing
+            for milestone_id, record in records.items():
+                self._goal_milestones[record['goal_id']].append(milestone_id)
+            self._indexed_milestone_count = len(records)
+            
+        except Exception as e:
+            self.logger.error(f"Error loading milestones: {e}")
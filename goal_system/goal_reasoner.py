@@ -13,14 +13,81 @@ Features:
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
-from .goal_manager import Goal, Milestone, GoalStatus, GoalType, GoalManager
+import numpy as np
+
+from .goal_manager import Goal, Milestone, GoalType, GoalManager
 from .strategic_planner import StrategicPlanner, ProjectPlan, TimelineStatus
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Number of request texts whose relevance assessment is kept; the same text is
+# typically assessed for the prompt, the recommendations and the context
+RELEVANCE_CACHE_SIZE = 1024
+
+# Request words that hint at each goal type (+1 relevance each)
+GOAL_TYPE_KEYWORDS = {
+    GoalType.PROJECT: ['project', 'build', 'create', 'develop', 'launch'],
+    GoalType.LEARNING: ['learn', 'study', 'practice', 'skill', 'course'],
+    GoalType.CREATIVE: ['design', 'write', 'create', 'art', 'creative'],
+    GoalType.CAREER: ['work', 'career', 'job', 'professional'],
+    GoalType.HEALTH: ['health', 'fitness', 'exercise', 'wellness'],
+    GoalType.HABIT: ['habit', 'routine', 'daily', 'practice']
+}
+
+
+def _relevance_goals_key(active_goals: List[Goal]) -> tuple:
+    """Everything about the active goals that relevance scoring reads"""
+    return tuple(
+        (goal.id, goal.title, goal.description, tuple(goal.related_apps), goal.goal_type)
+        for goal in active_goals
+    )
+
+
+def _relevance_patterns(goal: Goal) -> Dict[str, int]:
+    """
+    Lowercase substrings whose presence in a request raises goal's relevance.
+    
+    Maps each pattern to its total weight; a pattern listed more than once
+    (e.g. a word in both title and description) counts each time.
+    """
+    patterns: Dict[str, int] = {}
+    
+    def add(pattern: str, weight: int):
+        patterns[pattern] = patterns.get(pattern, 0) + weight
+    
+    add(goal.title.lower(), 10)
+    for keyword in goal.title.lower().split() + goal.description.lower().split():
+        if len(keyword) > 3:
+            add(keyword, 2)
+    for app in goal.related_apps:
+        add(app.lower(), 3)
+    for keyword in GOAL_TYPE_KEYWORDS.get(goal.goal_type, []):
+        add(keyword, 1)
+    return patterns
+
+
+@dataclass
+class _RelevanceIndex:
+    """Distinct relevance patterns of the active goals, with one entry per (pattern, goal) weight"""
+    patterns: List[str]
+    entry_pattern: np.ndarray   # int64 index into patterns
+    entry_goal: np.ndarray      # int64 index into the active goals
+    entry_weight: np.ndarray    # float64
+    base_scores: np.ndarray     # float64, from empty patterns (in every request)
+    automaton: Any = None       # pyahocorasick automaton: pattern -> pattern index
+
 
 class GoalRelevance(Enum):
     """How relevant a request/decision is to goals"""
@@ -30,6 +97,17 @@ class GoalRelevance(Enum):
     NOT_RELEVANT = "not_relevant"          # No relation to goals
 
 
+def _relevance_for_score(score: int) -> GoalRelevance:
+    """Relevance level for a goal's relevance score"""
+    if score >= 8:
+        return GoalRelevance.HIGHLY_RELEVANT
+    if score >= 4:
+        return GoalRelevance.MODERATELY_RELEVANT
+    if score >= 1:
+        return GoalRelevance.TANGENTIALLY_RELEVANT
+    return GoalRelevance.NOT_RELEVANT
+
+
 @dataclass
 class GoalContext:
     """Context about goals for reasoning"""
@@ -42,46 +120,53 @@ class GoalContext:
     relevant_goal_ids: List[str]
     strategic_recommendations: List[str]
     
+    # Days until deadline per urgent milestone id, as of when the context was built
+    urgent_days: Dict[str, int] = field(default_factory=dict)
+    
+    def days_left(self, milestone: Milestone) -> int:
+        """Days until milestone's deadline, from urgent_days when it was precomputed"""
+        days = self.urgent_days.get(milestone.id)
+        return days if days is not None else milestone.days_until_deadline
+    
     def to_reasoning_prompt(self) -> str:
         """Convert to text for AI reasoning"""
         
-        context_text = "CURRENT GOALS CONTEXT:\n\n"
+        parts = ["CURRENT GOALS CONTEXT:\n\n"]
         
         # Active goals
         if self.active_goals:
-            context_text += "Active Goals:\n"
-            for goal in self.active_goals[:3]:  # Top 3
-                progress = f"{goal.progress_percentage:.1f}%"
-                deadline = goal.target_date.strftime('%Y-%m-%d')
-                context_text += f"• {goal.title} ({progress} complete, due {deadline})\n"
-            context_text += "\n"
+            parts.append("Active Goals:\n")
+            parts.extend(
+                f"• {goal.title} ({goal.progress_percentage:.1f}% complete, due {goal.target_date:%Y-%m-%d})\n"
+                for goal in self.active_goals[:3]  # Top 3
+            )
+            parts.append("\n")
         
         # Urgent items
         if self.urgent_milestones:
-            context_text += "Urgent Milestones:\n"
-            for milestone in self.urgent_milestones[:3]:
-                days_left = milestone.days_until_deadline
-                context_text += f"• {milestone.title} (due in {days_left} days)\n"
-            context_text += "\n"
+            parts.append("Urgent Milestones:\n")
+            parts.extend(
+                f"• {milestone.title} (due in {self.days_left(milestone)} days)\n"
+                for milestone in self.urgent_milestones[:3]
+            )
+            parts.append("\n")
         
         # Next actions
         if self.next_actions:
-            context_text += "Next Actions:\n"
-            for action in self.next_actions[:3]:
-                context_text += f"• {action.title}\n"
-            context_text += "\n"
+            parts.append("Next Actions:\n")
+            parts.extend(f"• {action.title}\n" for action in self.next_actions[:3])
+            parts.append("\n")
         
         # Current priorities
         if self.current_priorities:
-            context_text += f"Current Priorities: {', '.join(self.current_priorities)}\n\n"
+            parts.append(f"Current Priorities: {', '.join(self.current_priorities)}\n\n")
         
         # Strategic recommendations
         if self.strategic_recommendations:
-            context_text += "Strategic Recommendations:\n"
-            for rec in self.strategic_recommendations[:2]:
-                context_text += f"• {rec}\n"
+            parts.append("Strategic Recommendations:\n")
+            parts.extend(f"• {rec}\n" for rec in self.strategic_recommendations[:2])
         
-        return context_text
+        return "".join(parts)
 
 
 class GoalAwareReasoner:
@@ -95,42 +180,68 @@ class GoalAwareReasoner:
         self.strategic_planner = strategic_planner
         self.logger = logging.getLogger(__name__)
         
-        # Context caching
+        # Context caching: reused while GoalManager.version is unchanged, and
+        # never for longer than _cache_duration (urgency depends on the clock,
+        # and in-place list edits don't change the version)
         self._context_cache = None
         self._context_cache_time = None
+        self._context_cache_version = None
         self._cache_duration = timedelta(minutes=5)
+        self._context_lock = threading.Lock()
+        
+        # Pattern index over the active goals, rebuilt when those goals or
+        # their text change
+        self._relevance_index: Optional[_RelevanceIndex] = None
+        self._relevance_index_key = None
+        
+        # Per-goal relevance patterns, keyed by goal id with the text they came from
+        self._relevance_patterns_cache: Dict[str, Tuple[tuple, Dict[str, int]]] = {}
+        
+        # Relevance results by request text, valid while the active goals' key
+        # matches _relevance_cache_key
+        self._relevance_cache: "OrderedDict[str, Tuple[GoalRelevance, List[str]]]" = OrderedDict()
+        self._relevance_cache_key = None
     
     def get_goal_context(self, request_text: str = "", force_refresh: bool = False) -> GoalContext:
         """Get current goal context for reasoning"""
         
-        # Check cache validity
-        if (not force_refresh and 
-            self._context_cache and 
-            self._context_cache_time and 
-            datetime.now() - self._context_cache_time < self._cache_duration):
+        with self._context_lock:
+            # Check cache validity
+            if (not force_refresh and 
+                self._context_cache and 
+                self._context_cache_version == self.goal_manager.version and 
+                datetime.now() - self._context_cache_time < self._cache_duration):
+                
+                # Update relevance for new request
+                if request_text:
+                    self._context_cache.goal_relevance, self._context_cache.relevant_goal_ids = self._assess_goal_relevance(request_text)
+                
+                return self._context_cache
+            
+            context = self._build_goal_context(request_text)
             
-            # Update relevance for new request
-            if request_text:
-                self._context_cache.goal_relevance, self._context_cache.relevant_goal_ids = self._assess_goal_relevance(request_text)
+            # Cache the context; the version is read after building, which
+            # may itself touch goals or milestones
+            self._context_cache = context
+            self._context_cache_time = datetime.now()
+            self._context_cache_version = self.goal_manager.version
             
-            return self._context_cache
+            return context
+    
+    def _build_goal_context(self, request_text: str) -> GoalContext:
+        """Build a fresh goal context"""
         
-        # Build fresh context
+        now = datetime.now()
         active_goals = self.goal_manager.get_active_goals()
-        overdue_items = self.goal_manager.get_overdue_items()
+        overdue_items = self.goal_manager.get_overdue_items(now)
         next_actions = self.goal_manager.get_next_actions(limit=5)
         
         # Get urgent milestones (due within 7 days)
-        urgent_milestones = []
-        for milestone in self.goal_manager.milestones.values():
-            if (milestone.status == GoalStatus.ACTIVE and 
-                0 <= milestone.days_until_deadline <= 7):
-                urgent_milestones.append(milestone)
-        
-        urgent_milestones.sort(key=lambda m: m.days_until_deadline)
+        urgent_milestones = self.goal_manager.get_urgent_milestones(now, within_days=7)
+        urgent_days = {m.id: m._days_until_deadline(now) for m in urgent_milestones}
         
         # Determine current priorities
-        current_priorities = self._determine_current_priorities(active_goals, urgent_milestones)
+        current_priorities = self._determine_current_priorities(active_goals, urgent_milestones, urgent_days)
         
         # Get strategic recommendations
         strategic_recommendations = []
@@ -154,33 +265,34 @@ class GoalAwareReasoner:
             current_priorities=current_priorities,
             goal_relevance=goal_relevance,
             relevant_goal_ids=relevant_goal_ids,
-            strategic_recommendations=strategic_recommendations[:4]  # Limit to 4
+            strategic_recommendations=strategic_recommendations[:4],  # Limit to 4
+            urgent_days=urgent_days
         )
         
-        # Cache the context
-        self._context_cache = context
-        self._context_cache_time = datetime.now()
-        
         return context
     
-    def _determine_current_priorities(self, active_goals: List[Goal], urgent_milestones: List[Milestone]) -> List[str]:
-        """Determine what should be prioritized right now"""
+    def _determine_current_priorities(self, active_goals: List[Goal], urgent_milestones: List[Milestone],
+                                      urgent_days: Dict[str, int]) -> List[str]:
+        """
+        Determine what should be prioritized right now.
         
-        priorities = []
+        urgent_milestones must be sorted soonest first, as from
+        GoalManager.get_urgent_milestones.
+        """
         
-        # Overdue items are highest priority
-        for milestone in urgent_milestones:
-            if milestone.days_until_deadline < 0:
-                priorities.append(f"OVERDUE: {milestone.title}")
+        priorities = []
         
-        # Urgent items (next 3 days)
+        # Overdue, then urgent (next 3 days) items, in one pass; sorted by
+        # days left, so overdue ones come first and later ones are further out
         for milestone in urgent_milestones:
-            if 0 <= milestone.days_until_deadline <= 3:
-                priorities.append(f"URGENT: {milestone.title}")
+            days = urgent_days[milestone.id]
+            if days > 3:
+                break
+            priorities.append(f"{'OVERDUE' if days < 0 else 'URGENT'}: {milestone.title}")
         
         # High priority goals
-        high_priority_goals = [g for g in active_goals if g.priority <= 2]
-        for goal in high_priority_goals[:2]:
+        high_priority_goals = (g for g in active_goals if g.priority <= 2)
+        for goal in islice(high_priority_goals, 2):
             priorities.append(f"High Priority Goal: {goal.title}")
         
         return priorities[:5]  # Limit to top 5
@@ -191,65 +303,111 @@ class GoalAwareReasoner:
         if not request_text:
             return GoalRelevance.NOT_RELEVANT, []
         
+        active_goals = self.goal_manager.get_active_goals()
+        goals_key = _relevance_goals_key(active_goals)
+        
+        if goals_key != self._relevance_cache_key:
+            self._relevance_cache.clear()
+            self._relevance_cache_key = goals_key
+        
+        cached = self._relevance_cache.get(request_text)
+        if cached is not None:
+            self._relevance_cache.move_to_end(request_text)
+            return cached[0], list(cached[1])
+        
         request_lower = request_text.lower()
-        relevant_goals = []
-        max_relevance = GoalRelevance.NOT_RELEVANT
         
-        active_goals = self.goal_manager.get_active_goals()
+        scores = self._relevance_scores(active_goals, goals_key, request_lower)
         
-        for goal in active_goals:
-            relevance_score = 0
-            
-            # Direct goal title mention
-            if goal.title.lower() in request_lower:
-                relevance_score += 10
-            
-            # Goal keywords in request
-            goal_keywords = goal.title.lower().split() + goal.description.lower().split()
-            for keyword in goal_keywords:
-                if len(keyword) > 3 and keyword in request_lower:
-                    relevance_score += 2
-            
-            # Related apps mentioned
-            for app in goal.related_apps:
-                if app.lower() in request_lower:
-                    relevance_score += 3
-            
-            # Goal type relevance
-            type_keywords = {
-                GoalType.PROJECT: ['project', 'build', 'create', 'develop', 'launch'],
-                GoalType.LEARNING: ['learn', 'study', 'practice', 'skill', 'course'],
-                GoalType.CREATIVE: ['design', 'write', 'create', 'art', 'creative'],
-                GoalType.CAREER: ['work', 'career', 'job', 'professional'],
-                GoalType.HEALTH: ['health', 'fitness', 'exercise', 'wellness'],
-                GoalType.HABIT: ['habit', 'routine', 'daily', 'practice']
-            }
-            
-            goal_type_keywords = type_keywords.get(goal.goal_type, [])
-            for keyword in goal_type_keywords:
-                if keyword in request_lower:
-                    relevance_score += 1
-            
-            # Assess relevance level
-            if relevance_score >= 8:
-                goal_relevance = GoalRelevance.HIGHLY_RELEVANT
-                relevant_goals.append(goal.id)
-            elif relevance_score >= 4:
-                goal_relevance = GoalRelevance.MODERATELY_RELEVANT
-                relevant_goals.append(goal.id)
-            elif relevance_score >= 1:
-                goal_relevance = GoalRelevance.TANGENTIALLY_RELEVANT
-                relevant_goals.append(goal.id)
-            
-            # Track highest relevance found
-            if goal_relevance.value == 'highly_relevant':
-                max_relevance = GoalRelevance.HIGHLY_RELEVANT
-            elif goal_relevance.value == 'moderately_relevant' and max_relevance != GoalRelevance.HIGHLY_RELEVANT:
-                max_relevance = GoalRelevance.MODERATELY_RELEVANT
-            elif goal_relevance.value == 'tangentially_relevant' and max_relevance == GoalRelevance.NOT_RELEVANT:
-                max_relevance = GoalRelevance.TANGENTIALLY_RELEVANT
-        
-        return max_relevance, relevant_goals
+        # Every goal scoring at least tangential relevance; the overall level
+        # is that of the best-scoring goal
+        relevant_goals = [goal.id for goal, score in zip(active_goals, scores) if score >= 1]
+        max_relevance = _relevance_for_score(max(scores, default=0))
+        
+        self._relevance_cache[request_text] = (max_relevance, relevant_goals)
+        if len(self._relevance_cache) > RELEVANCE_CACHE_SIZE:
+            self._relevance_cache.popitem(last=False)
+        
+        return max_relevance, list(relevant_goals)
+    
+    def _goal_relevance_patterns(self, goal: Goal) -> Dict[str, int]:
+        """_relevance_patterns(goal), cached until the goal's text, apps or type change"""
+        
+        key = (goal.title, goal.description, tuple(goal.related_apps), goal.goal_type)
+        cached = self._relevance_patterns_cache.get(goal.id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        patterns = _relevance_patterns(goal)
+        self._relevance_patterns_cache[goal.id] = (key, patterns)
+        return patterns
+    
+    def _relevance_scores(self, active_goals: List[Goal], goals_key: tuple, request_lower: str) -> List[int]:
+        """
+        Relevance score of every active goal for a lowercased request.
+        
+        Each distinct pattern is looked for once, however many goals share
+        it (in one Aho-Corasick pass with pyahocorasick, else by substring
+        checks), and counts once however often it occurs. Matched weights
+        are summed per goal in one vectorized pass.
+        """
+        
+        if goals_key != self._relevance_index_key:
+            self._relevance_index = self._build_relevance_index(active_goals)
+            self._relevance_index_key = goals_key
+        index = self._relevance_index
+        
+        if index.automaton is not None:
+            matched = np.zeros(len(index.patterns), dtype=bool)
+            for _, pattern_index in index.automaton.iter(request_lower):
+                matched[pattern_index] = True
+        else:
+            matched = np.fromiter(
+                (pattern in request_lower for pattern in index.patterns),
+                dtype=bool, count=len(index.patterns)
+            )
+        
+        scores = index.base_scores + np.bincount(
+            index.entry_goal,
+            weights=index.entry_weight * matched[index.entry_pattern],
+            minlength=len(active_goals)
+        )
+        return scores.astype(np.int64).tolist()
+    
+    def _build_relevance_index(self, active_goals: List[Goal]) -> _RelevanceIndex:
+        """Index the active goals' relevance patterns, deduplicated across goals"""
+        
+        pattern_ids: Dict[str, int] = {}
+        entry_pattern: List[int] = []
+        entry_goal: List[int] = []
+        entry_weight: List[int] = []
+        base_scores = np.zeros(len(active_goals))
+        
+        for goal_index, goal in enumerate(active_goals):
+            for pattern, weight in self._goal_relevance_patterns(goal).items():
+                if not pattern:
+                    # The empty string is in every request
+                    base_scores[goal_index] += weight
+                    continue
+                entry_pattern.append(pattern_ids.setdefault(pattern, len(pattern_ids)))
+                entry_goal.append(goal_index)
+                entry_weight.append(weight)
+        
+        automaton = None
+        if AHOCORASICK_AVAILABLE and pattern_ids:
+            automaton = ahocorasick.Automaton()
+            for pattern, pattern_index in pattern_ids.items():
+                automaton.add_word(pattern, pattern_index)
+            automaton.make_automaton()
+        
+        return _RelevanceIndex(
+            patterns=list(pattern_ids),
+            entry_pattern=np.array(entry_pattern, dtype=np.int64),
+            entry_goal=np.array(entry_goal, dtype=np.int64),
+            entry_weight=np.array(entry_weight, dtype=np.float64),
+            base_scores=base_scores,
+            automaton=automaton
+        )
     
     def enhance_reasoning_prompt(self, base_prompt: str, request_text: str = "") -> str:
         """Enhance a reasoning prompt with goal context"""
@@ -280,7 +438,7 @@ class GoalAwareReasoner:
         # Urgent milestone reminders
         if goal_context.urgent_milestones:
             milestone = goal_context.urgent_milestones[0]
-            days_left = milestone.days_until_deadline
+            days_left = goal_context.days_left(milestone)
             
             if days_left < 0:
                 recommendations.append(f"⚠️ OVERDUE: {milestone.title} was due {abs(days_left)} days ago")
@@ -308,29 +466,27 @@ class GoalAwareReasoner:
     def should_proactively_mention_goals(self, current_activity: Dict[str, Any] = None) -> Tuple[bool, str]:
         """Determine if goals should be proactively mentioned"""
         
-        goal_context = self.get_goal_context()
+        # Answered from direct manager queries; most calls have nothing to
+        # say, so the full goal context is not built
+        now = datetime.now()
         
         # Always mention overdue items
-        if goal_context.overdue_items['milestones']:
-            overdue_milestone = goal_context.overdue_items['milestones'][0]
+        overdue_milestone = self.goal_manager.first_overdue_milestone(now)
+        if overdue_milestone is not None:
             return True, f"Reminder: {overdue_milestone.title} is overdue"
         
         # Mention urgent items
-        if goal_context.urgent_milestones:
-            urgent = goal_context.urgent_milestones[0]
-            if urgent.days_until_deadline <= 1:
-                return True, f"Urgent: {urgent.title} is due tomorrow"
+        due_soon = self.goal_manager.get_urgent_milestones(now, within_days=1)
+        if due_soon:
+            return True, f"Urgent: {due_soon[0].title} is due tomorrow"
         
         # Mention goal-related activity
         if current_activity:
             current_app = current_activity.get('current_app', '')
             
-            for goal in goal_context.active_goals:
+            for goal in self.goal_manager.get_active_goals():
                 if current_app in goal.related_apps:
-                    next_milestones = goal.get_next_milestones(
-                        list(self.goal_manager.milestones.values()), 
-                        limit=1
-                    )
+                    next_milestones = goal.get_next_milestones(self.goal_manager, limit=1)
                     
                     if next_milestones:
                         milestone = next_milestones[0]
@@ -343,44 +499,47 @@ class GoalAwareReasoner:
         
         goal_context = self.get_goal_context(force_refresh=True)
         
-        briefing = "📅 **Daily Goal Briefing**\n\n"
+        parts = ["📅 **Daily Goal Briefing**\n\n"]
         
         # Urgent items
         if goal_context.urgent_milestones:
-            briefing += "🚨 **Urgent Today:**\n"
+            parts.append("🚨 **Urgent Today:**\n")
             for milestone in goal_context.urgent_milestones[:3]:
-                days_left = milestone.days_until_deadline
+                days_left = goal_context.days_left(milestone)
                 urgency = "OVERDUE" if days_left < 0 else f"{days_left} days left"
-                briefing += f"• {milestone.title} ({urgency})\n"
-            briefing += "\n"
+                parts.append(f"• {milestone.title} ({urgency})\n")
+            parts.append("\n")
         
         # Active goals progress
         if goal_context.active_goals:
-            briefing += "🎯 **Active Goals:**\n"
-            for goal in goal_context.active_goals[:3]:
-                progress = f"{goal.progress_percentage:.1f}%"
-                briefing += f"• {goal.title} - {progress} complete\n"
-            briefing += "\n"
+            parts.append("🎯 **Active Goals:**\n")
+            parts.extend(
+                f"• {goal.title} - {goal.progress_percentage:.1f}% complete\n"
+                for goal in goal_context.active_goals[:3]
+            )
+            parts.append("\n")
         
         # Recommended actions
         if goal_context.next_actions:
-            briefing += "📋 **Recommended Actions:**\n"
-            for action in goal_context.next_actions[:3]:
-                briefing += f"• {action.title}\n"
-            briefing += "\n"
+            parts.append("📋 **Recommended Actions:**\n")
+            parts.extend(f"• {action.title}\n" for action in goal_context.next_actions[:3])
+            parts.append("\n")
         
         # Strategic recommendations
         if goal_context.strategic_recommendations:
-            briefing += "💡 **Strategic Focus:**\n"
-            for rec in goal_context.strategic_recommendations[:2]:
-                briefing += f"• {rec}\n"
+            parts.append("💡 **Strategic Focus:**\n")
+            parts.extend(f"• {rec}\n" for rec in goal_context.strategic_recommendations[:2])
         
-        return briefing
+        return "".join(parts)
     
     def get_goal_aware_task_prioritization(self, tasks: List[str]) -> List[Tuple[str, int, str]]:
         """Prioritize tasks based on goal alignment"""
         
         goal_context = self.get_goal_context()
+        find_urgent_milestone = self._urgent_milestone_matcher(goal_context.urgent_milestones)
+        
+        # Relevant goals are always active ones, so resolve titles from one map
+        goal_titles = {goal.id: goal.title for goal in self.goal_manager.get_active_goals()}
         prioritized_tasks = []
         
         for task in tasks:
@@ -393,8 +552,8 @@ class GoalAwareReasoner:
             # Boost priority based on goal relevance
             if relevance == GoalRelevance.HIGHLY_RELEVANT:
                 priority = 1
-                goal_titles = [self.goal_manager.get_goal_by_id(gid).title for gid in relevant_goals[:2]]
-                reason = f"Directly advances: {', '.join(goal_titles)}"
+                titles = [goal_titles[gid] for gid in relevant_goals[:2] if gid in goal_titles]
+                reason = f"Directly advances: {', '.join(titles)}"
             elif relevance == GoalRelevance.MODERATELY_RELEVANT:
                 priority = 2
                 reason = "Supports active goals"
@@ -403,11 +562,10 @@ class GoalAwareReasoner:
                 reason = "Loosely related to goals"
             
             # Check for urgent milestone keywords
-            for milestone in goal_context.urgent_milestones:
-                if any(word in task.lower() for word in milestone.title.lower().split()):
-                    priority = 1
-                    reason = f"Urgent milestone: {milestone.title}"
-                    break
+            milestone = find_urgent_milestone(task.lower())
+            if milestone is not None:
+                priority = 1
+                reason = f"Urgent milestone: {milestone.title}"
             
             prioritized_tasks.append((task, priority, reason))
         
@@ -416,6 +574,38 @@ class GoalAwareReasoner:
         
         return prioritized_tasks
     
+    def _urgent_milestone_matcher(self, urgent_milestones: List[Milestone]) -> Callable[[str], Optional[Milestone]]:
+        """
+        Build a lookup for the first urgent milestone with a title word in a lowercased task.
+        
+        Title words are split once per call rather than once per task; with
+        pyahocorasick each task is scanned once for all of them.
+        """
+        
+        title_words = [dict.fromkeys(m.title.lower().split()) for m in urgent_milestones]
+        
+        if AHOCORASICK_AVAILABLE and any(title_words):
+            # Each word maps to the first urgent milestone whose title has it
+            automaton = ahocorasick.Automaton()
+            for index in reversed(range(len(urgent_milestones))):
+                for word in title_words[index]:
+                    automaton.add_word(word, index)
+            automaton.make_automaton()
+            
+            def find(task_lower: str) -> Optional[Milestone]:
+                first = min((index for _, index in automaton.iter(task_lower)), default=None)
+                return urgent_milestones[first] if first is not None else None
+            
+            return find
+        
+        def find(task_lower: str) -> Optional[Milestone]:
+            for milestone, words in zip(urgent_milestones, title_words):
+                if any(word in task_lower for word in words):
+                    return milestone
+            return None
+        
+        return find
+    
     def update_goal_progress_from_completion(self, completed_task: str, time_spent_hours: float = 0):
         """Update goal progress when a task is completed"""
         
@@ -425,18 +615,10 @@ class GoalAwareReasoner:
             for goal_id in relevant_goal_ids:
                 goal = self.goal_manager.get_goal_by_id(goal_id)
                 if goal:
-                    # Find active milestones for this goal
-                    active_milestones = [
-                        self.goal_manager.get_milestone_by_id(mid) 
-                        for mid in goal.milestone_ids
-                        if (mid in self.goal_manager.milestones and 
-                            self.goal_manager.milestones[mid].status == GoalStatus.ACTIVE)
-                    ]
+                    # Update the highest priority active milestone
+                    milestone = self.goal_manager.top_active_milestone(goal)
                     
-                    if active_milestones:
-                        # Update the highest priority milestone
-                        milestone = min(active_milestones, key=lambda m: m.priority)
-                        
+                    if milestone is not None:
                         # Estimate progress boost
                         progress_boost = min(20.0, time_spent_hours / milestone.estimated_effort_hours * 100)
                         new_progress = min(milestone.progress_percentage + progress_boost, 100.0)
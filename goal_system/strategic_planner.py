@@ -477,10 +477,7 @@ class StrategicPlanner:
             return {}
         
         plan = self.project_plans.get(goal_id)
-        next_milestones = goal.get_next_milestones(
-            list(self.goal_manager.milestones.values()), 
-            limit=3
-        )
+        next_milestones = goal.get_next_milestones(self.goal_manager, limit=3)
         
         # Calculate recommended time allocation
         total_available_hours = plan.weekly_capacity_hours if plan else 10
@@ -540,10 +537,7 @@ class StrategicPlanner:
                 }
                 
                 # Get next milestone
-                next_milestones = goal.get_next_milestones(
-                    list(self.goal_manager.milestones.values()), 
-                    limit=1
-                )
+                next_milestones = goal.get_next_milestones(self.goal_manager, limit=1)
                 
                 if next_milestones:
                     summary['next_milestone'] = {
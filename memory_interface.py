@@ -14,13 +14,84 @@ The memory system stores:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import Callable, List, Dict, Any, Optional
 from datetime import datetime
 import json
+import threading
+import numpy as np
 import chromadb
 from chromadb.utils import embedding_functions
 import uuid
 
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+
+class QueryEmbeddingCache:
+    """
+    Bounded LRU of query embeddings keyed by the whitespace-normalized query.
+    
+    Recurring prompts (scheduled reminders, demo replays) skip the embedding
+    model entirely. Scheduler callbacks run on other threads, so every
+    access is guarded by one lock; the embedding itself is computed outside
+    the lock.
+    """
+    
+    def __init__(self, embed: Callable[[str], Any], max_entries: int = 1024):
+        self.embed = embed
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Cache key for a query: collapse runs of whitespace and strip"""
+        return " ".join(query.split())
+    
+    def get(self, query: str) -> np.ndarray:
+        """Return the embedding for a query, computing and caching it on a miss"""
+        key = self.normalize(query)
+        
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+            self.misses += 1
+        
+        embedding = np.asarray(self.embed(key), dtype=np.float32)
+        
+        with self._lock:
+            self._entries[key] = embedding
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        
+        return embedding
+    
+    def clear(self):
+        """Drop all cached embeddings"""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total > 0 else 0.0
+        }
+
 
 class MemoryInterface(ABC):
     """Abstract base class for memory storage systems"""
@@ -85,6 +156,18 @@ class ChromaMemory(MemoryInterface):
             embedding_function=self.embedding_function,
             metadata={"description": "Digital twin memory storage"}
         )
+        
+        # Twins search with the same "category: context" queries repeatedly,
+        # so keep recent query embeddings instead of re-encoding them
+        self.query_cache = QueryEmbeddingCache(self._compute_query_embedding)
+    
+    def _compute_query_embedding(self, query: str):
+        """Embed a search query with the collection's embedding function"""
+        return self.embedding_function([query])[0]
+    
+    def _embed_query(self, query: str) -> np.ndarray:
+        """Cached embedding for a search query"""
+        return self.query_cache.get(query)
     
     def add(self, content: str, metadata: Dict[str, Any] = None) -> str:
         """
@@ -138,9 +221,9 @@ class ChromaMemory(MemoryInterface):
         if filters:
             where_clause = filters
         
-        # Perform search
+        # Perform search with a cached query embedding
         results = self.collection.query(
-            query_texts=[query],
+            query_embeddings=[self._embed_query(query).tolist()],
             n_results=k,
             where=where_clause
         )
@@ -294,6 +377,208 @@ class ChromaMemory(MemoryInterface):
         )
 
 
+class FAISSMemory(ChromaMemory):
+    """
+    Chroma-persisted memory with an exact in-process FAISS search index.
+    
+    Chroma stays the persistence layer; at startup the stored vectors are
+    loaded once into a contiguous (N, d) float32 matrix with parallel
+    id/document/metadata lists, and searches run against a flat
+    inner-product index over the L2-normalized vectors. For the few
+    thousand entries of a personal twin this exact scan is cheaper than
+    an HNSW query. Without the faiss package the same scan is done with
+    numpy.
+    """
+    
+    def __init__(self, 
+                 collection_name: str = "digital_twin_memory",
+                 persist_directory: str = "./chroma_db",
+                 embedding_model: str = "all-MiniLM-L6-v2"):
+        super().__init__(collection_name, persist_directory, embedding_model)
+        
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        self._metadatas: List[Dict[str, Any]] = []
+        self._vectors: Optional[np.ndarray] = None  # (N, d) float32, normalized
+        self._index = None
+        
+        self._load_from_collection()
+    
+    @staticmethod
+    def _normalize(vectors) -> np.ndarray:
+        """L2-normalize rows so inner product equals cosine similarity"""
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+    
+    def _load_from_collection(self):
+        """Rebuild the in-memory vectors and index from the persisted collection"""
+        stored = self.collection.get(include=['documents', 'metadatas', 'embeddings'])
+        
+        self._ids = list(stored['ids'])
+        self._documents = list(stored['documents'] or [])
+        self._metadatas = [m or {} for m in (stored['metadatas'] or [{}] * len(self._ids))]
+        
+        embeddings = stored.get('embeddings')
+        self._vectors = self._normalize(embeddings) if len(self._ids) else None
+        self._rebuild_index()
+    
+    def _rebuild_index(self):
+        """Recreate the flat IP index over the current vectors"""
+        self._index = None
+        if FAISS_AVAILABLE and self._vectors is not None:
+            self._index = faiss.IndexFlatIP(self._vectors.shape[1])
+            self._index.add(self._vectors)
+    
+    def _embed_document(self, content: str) -> List[float]:
+        """Embed a memory document with the collection's embedding function"""
+        return [float(x) for x in self.embedding_function([content])[0]]
+    
+    def add(self, content: str, metadata: Dict[str, Any] = None) -> str:
+        """Add a memory to Chroma and to the in-memory index"""
+        memory_id = str(uuid.uuid4())
+        
+        if metadata is None:
+            metadata = {}
+        
+        if 'timestamp' not in metadata:
+            metadata['timestamp'] = datetime.now().isoformat()
+        
+        if 'type' not in metadata:
+            metadata['type'] = self._classify_memory_type(content)
+        
+        # Embed once and hand the vector to Chroma so it is not encoded twice
+        embedding = self._embed_document(content)
+        self.collection.add(
+            documents=[content],
+            metadatas=[metadata],
+            embeddings=[embedding],
+            ids=[memory_id]
+        )
+        
+        vector = self._normalize(embedding)
+        self._ids.append(memory_id)
+        self._documents.append(content)
+        self._metadatas.append(metadata)
+        self._vectors = vector if self._vectors is None else np.vstack([self._vectors, vector])
+        if FAISS_AVAILABLE:
+            if self._index is None:
+                self._index = faiss.IndexFlatIP(vector.shape[1])
+            self._index.add(vector)
+        
+        return memory_id
+    
+    def search(self, query: str, k: int = 5, filters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Search for relevant memories with an exact inner-product scan.
+        
+        Filters support field equality and {"$in": [...]}; anything else is
+        delegated to Chroma's own query. Scores are on ChromaMemory's scale,
+        1 - squared L2 distance, which is 2 * cosine - 1 for unit vectors.
+        """
+        if self._vectors is None:
+            return []
+        
+        mask = None
+        if filters:
+            mask = self._filter_mask(filters)
+            if mask is None:
+                return super().search(query, k, filters)
+        
+        query_vector = self._normalize(self._embed_query(query))
+        
+        if mask is None:
+            if self._index is not None:
+                scores, rows = self._index.search(query_vector, min(k, len(self._ids)))
+                hits = [(int(r), float(s)) for r, s in zip(rows[0], scores[0]) if r >= 0]
+            else:
+                hits = self._top_k(self._vectors @ query_vector[0], np.arange(len(self._ids)), k)
+        else:
+            candidates = np.flatnonzero(mask)
+            if len(candidates) == 0:
+                return []
+            hits = self._top_k(self._vectors[candidates] @ query_vector[0], candidates, k)
+        
+        return [
+            {
+                'id': self._ids[row],
+                'content': self._documents[row],
+                'metadata': self._metadatas[row],
+                'score': 2 * score - 1
+            }
+            for row, score in hits
+        ]
+    
+    @staticmethod
+    def _top_k(scores: np.ndarray, rows: np.ndarray, k: int) -> List[tuple]:
+        """Best k (row, score) pairs, highest score first"""
+        if len(scores) > k:
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best])]
+        return [(int(rows[i]), float(scores[i])) for i in best]
+    
+    def _filter_mask(self, filters: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Boolean row mask for simple metadata filters, or None if unsupported"""
+        conditions = []
+        for field, condition in filters.items():
+            if field.startswith('$'):
+                return None
+            if isinstance(condition, dict):
+                if set(condition) != {'$in'}:
+                    return None
+                allowed = condition['$in']
+                conditions.append((field, lambda value, allowed=allowed: value in allowed))
+            else:
+                conditions.append((field, lambda value, expected=condition: value == expected))
+        
+        return np.fromiter(
+            (all(test(metadata.get(field)) for field, test in conditions)
+             for metadata in self._metadatas),
+            dtype=bool,
+            count=len(self._metadatas)
+        )
+    
+    def update(self, memory_id: str, content: str = None, metadata: Dict[str, Any] = None) -> bool:
+        """Update a memory in Chroma and refresh its row in the index"""
+        if not super().update(memory_id, content, metadata):
+            return False
+        
+        try:
+            row = self._ids.index(memory_id)
+        except ValueError:
+            return True
+        
+        stored = self.collection.get(ids=[memory_id], include=['documents', 'metadatas', 'embeddings'])
+        self._documents[row] = stored['documents'][0]
+        self._metadatas[row] = stored['metadatas'][0] or {}
+        if content is not None:
+            self._vectors[row] = self._normalize(stored['embeddings'][0])[0]
+            self._rebuild_index()
+        
+        return True
+    
+    def delete(self, memory_id: str) -> bool:
+        """Delete a memory from Chroma and drop its row from the index"""
+        if not super().delete(memory_id):
+            return False
+        
+        try:
+            row = self._ids.index(memory_id)
+        except ValueError:
+            return True
+        
+        del self._ids[row]
+        del self._documents[row]
+        del self._metadatas[row]
+        self._vectors = np.delete(self._vectors, row, axis=0) if self._ids else None
+        self._rebuild_index()
+        
+        return True
+
+
 class MemoryManager:
     """
     High-level memory management for the digital twin.
@@ -17,6 +17,7 @@ from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+import copy
 import json
 import uuid
 import logging
@@ -181,6 +182,11 @@ class EpisodicMemorySystem:
         # In-memory storage for current session
         self.memories: Dict[str, EpisodicMemory] = {}
         
+        # Bumped on every save and by mark_modified() so statistics and
+        # exports can be cached
+        self.version = 0
+        self._statistics_cache: Optional[Tuple[int, int, Dict[str, Any]]] = None
+        
         # Load existing memories
         self._load_memories()
     
@@ -205,13 +211,18 @@ class EpisodicMemorySystem:
         except Exception as e:
             self.logger.error(f"Error loading episodic memories: {e}")
     
+    def mark_modified(self):
+        """Record an in-place edit to a stored memory without writing to disk"""
+        self.version += 1
+    
     def _save_memories(self):
         """Save memories to storage"""
+        self.version += 1
         storage_file = self.storage_dir / "episodic_memories.json"
         
         try:
             data = {
-                'memories': [memory.to_dict() for memory in self.memories.values()],
+                'memories': [memory.to_dict() for memory in list(self.memories.values())],
                 'last_updated': datetime.now().isoformat(),
                 'total_count': len(self.memories)
             }
@@ -324,11 +335,11 @@ class EpisodicMemorySystem:
         This is crucial for learning - connecting decisions to their results.
         """
         
-        if decision_memory_id not in self.memories:
+        memory = self.memories.get(decision_memory_id)
+        if memory is None:
             self.logger.warning(f"Decision memory {decision_memory_id} not found")
             return False
         
-        memory = self.memories[decision_memory_id]
         memory.add_outcome(outcome, satisfaction, lessons_learned)
         
         self._save_memories()
@@ -362,7 +373,7 @@ class EpisodicMemorySystem:
         
         matching_memories = []
         
-        for memory in self.memories.values():
+        for memory in list(self.memories.values()):
             # Apply filters
             if memory_type and memory.memory_type != memory_type:
                 continue
@@ -480,7 +491,7 @@ class EpisodicMemorySystem:
         # Score memories by similarity
         scored_memories = []
         
-        for memory in self.memories.values():
+        for memory in list(self.memories.values()):
             # Calculate similarity score
             memory_text = f"{memory.title} {memory.description}".lower()
             memory_words = set(memory_text.split())
@@ -523,8 +534,18 @@ class EpisodicMemorySystem:
         if not self.memories:
             return {"message": "No memories stored"}
         
+        # recent_activity depends on the clock, so cached stats expire hourly
+        hour = int(datetime.now().timestamp()) // 3600
+        if self._statistics_cache is not None:
+            version, cached_hour, cached_stats = self._statistics_cache
+            if version == self.version and cached_hour == hour:
+                return copy.deepcopy(cached_stats)
+        
+        # One snapshot, so maintenance threads can remove memories meanwhile
+        memories = list(self.memories.values())
+        
         stats = {
-            "total_memories": len(self.memories),
+            "total_memories": len(memories),
             "by_type": {},
             "by_importance": {},
             "by_month": {},
@@ -535,7 +556,7 @@ class EpisodicMemorySystem:
         }
         
         # Count by type and importance
-        for memory in self.memories.values():
+        for memory in memories:
             mem_type = memory.memory_type.value
             importance = memory.importance.value
             
@@ -551,15 +572,15 @@ class EpisodicMemorySystem:
                 stats["people_involved"][person] = stats["people_involved"].get(person, 0) + 1
         
         # Most accessed memories
-        accessed_memories = [(mem.title, mem.access_count) for mem in self.memories.values() if mem.access_count > 0]
+        accessed_memories = [(mem.title, mem.access_count) for mem in memories if mem.access_count > 0]
         stats["most_accessed"] = sorted(accessed_memories, key=lambda x: x[1], reverse=True)[:5]
         
         # Recent activity (last 7 days)
         week_ago = datetime.now() - timedelta(days=7)
-        stats["recent_activity"] = sum(1 for mem in self.memories.values() if mem.timestamp >= week_ago)
+        stats["recent_activity"] = sum(1 for mem in memories if mem.timestamp >= week_ago)
         
         # Satisfaction patterns for decisions
-        decision_memories = [mem for mem in self.memories.values() 
+        decision_memories = [mem for mem in memories 
                            if mem.memory_type == MemoryType.DECISION and mem.satisfaction is not None]
         
         if decision_memories:
@@ -574,7 +595,9 @@ class EpisodicMemorySystem:
                 "total_decisions_tracked": len(decision_memories)
             }
         
-        return stats
+        self._statistics_cache = (self.version, hour, stats)
+        
+        return copy.deepcopy(stats)
     
     def cleanup_old_memories(self, days: int = 365, keep_important: bool = True):
         """Clean up old, low-importance memories to prevent storage bloat"""
@@ -582,7 +605,7 @@ class EpisodicMemorySystem:
         cutoff_date = datetime.now() - timedelta(days=days)
         
         to_remove = []
-        for memory_id, memory in self.memories.items():
+        for memory_id, memory in list(self.memories.items()):
             if memory.timestamp < cutoff_date:
                 # Keep important memories regardless of age
                 if keep_important and memory.importance in [MemoryImportance.HIGH, MemoryImportance.CRITICAL]:
@@ -600,7 +623,7 @@ class EpisodicMemorySystem:
         
         # Remove old memories
         for memory_id in to_remove:
-            del self.memories[memory_id]
+            self.memories.pop(memory_id, None)
         
         if to_remove:
             self._save_memories()
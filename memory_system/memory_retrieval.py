@@ -13,7 +13,7 @@ the most relevant context for decision-making.
 
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 
 from .episodic_memory import EpisodicMemorySystem, MemoryType, MemoryImportance
@@ -31,6 +31,7 @@ class RetrievalContext:
     urgency: str = "medium"                     # low, medium, high
     time_available: int = None                  # Minutes available
     similar_situations: List[str] = None        # Previous similar contexts
+    query_embedding: List[float] = None         # Precomputed embedding of query
     
     def __post_init__(self):
         if self.current_state is None:
@@ -41,6 +42,29 @@ class RetrievalContext:
             self.similar_situations = []
 
 
+# Keywords the twin uses to route memories into reasoning; each memory gets a
+# bitmask of which ones its content mentions
+MEMORY_KEYWORDS = {
+    'reasoning': 1 << 0,
+    'heuristic': 1 << 1,
+    'deliberation': 1 << 2,
+    'pattern': 1 << 3,
+    'voice': 1 << 4,
+    'values': 1 << 5,
+    'strategic': 1 << 6,
+    'insight': 1 << 7,
+}
+
+
+def keyword_mask(content_lower: str) -> int:
+    """Bitmask of MEMORY_KEYWORDS found in lowercased content"""
+    mask = 0
+    for keyword, bit in MEMORY_KEYWORDS.items():
+        if keyword in content_lower:
+            mask |= bit
+    return mask
+
+
 @dataclass
 class MemoryContext:
     """A memory with context and relevance scores"""
@@ -57,6 +81,14 @@ class MemoryContext:
     source: str = None  # Which system provided this memory
     reasoning_influence: str = None  # How this memory should influence reasoning
     confidence: float = 0.8
+    
+    # Derived once when the context is built so consumers never re-lowercase
+    content_lower: str = field(init=False, repr=False)
+    keyword_mask: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.content_lower = self.content.lower()
+        self.keyword_mask = keyword_mask(self.content_lower)
 
 
 class IntelligentMemoryRetrieval:
@@ -174,7 +206,8 @@ class IntelligentMemoryRetrieval:
             query=context.query,
             reasoning_mode=context.reasoning_mode,
             current_state=context.current_state,
-            limit=15
+            limit=15,
+            query_embedding=context.query_embedding
         )
         
         # Convert to standard format
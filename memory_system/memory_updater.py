@@ -176,6 +176,8 @@ class MemoryUpdater:
                             if arg.urgency.value > 0.7]
             memory.tags.extend([f"voice_{voice.lower()}" for voice in winning_voices])
         
+        self.episodic_memory.mark_modified()
+        
         return memory.id
     
     def _store_semantic_decision(self,
@@ -579,8 +581,8 @@ class MemoryUpdater:
         """
         
         if memory_type == "semantic":
-            if memory_id in self.vector_memory.memory_cache:
-                memory = self.vector_memory.memory_cache[memory_id]
+            memory = self.vector_memory.memory_cache.get(memory_id)
+            if memory is not None:
                 old_relevance = memory.relevance_score
                 memory.relevance_score = max(0.1, min(1.0, memory.relevance_score + relevance_change))
                 
@@ -590,8 +592,8 @@ class MemoryUpdater:
                 self.vector_memory._save_memory_metadata()
         
         elif memory_type == "episodic":
-            if memory_id in self.episodic_memory.memories:
-                memory = self.episodic_memory.memories[memory_id]
+            memory = self.episodic_memory.memories.get(memory_id)
+            if memory is not None:
                 # Episodic memories don't have relevance scores, but we can adjust confidence
                 old_confidence = memory.confidence
                 memory.confidence = max(0.1, min(1.0, memory.confidence + relevance_change))
@@ -1050,11 +1052,11 @@ class MemoryUpdater:
         
         # Add goal-specific statistics if available
         if GOAL_SYSTEM_AVAILABLE:
-            goal_memories = [m for m in self.episodic_memory.memories.values() 
+            goal_memories = [m for m in list(self.episodic_memory.memories.values())
                            if m.metadata.get('source') == 'goal_system']
             stats['goal_memories'] = len(goal_memories)
             
-            strategic_memories = [m for m_id, m in self.vector_memory.memory_cache.items()
+            strategic_memories = [m for m in list(self.vector_memory.memory_cache.values())
                                 if 'strategic' in m.tags or 'goal' in m.tags]
             stats['strategic_memories'] = len(strategic_memories)
         
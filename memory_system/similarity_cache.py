@@ -0,0 +1,151 @@
+"""
+Similarity Cache for Memory Retrieval
+
+Caches retrieval results for near-duplicate situations. Situations are
+embedded locally with feature-hashed bag-of-words vectors, so a lookup
+needs no embedding API call, and candidates are found with random
+hyperplane LSH before an exact cosine check.
+
+Entries are kept in LRU order: a hit moves the entry to the front and
+inserting past capacity evicts the least recently used entry.
+"""
+
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import re
+import zlib
+import numpy as np
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def hashed_text_embedding(text: str, dim: int = 1024) -> np.ndarray:
+    """
+    Embed text as a normalized feature-hashed bag of words (unigrams + bigrams).
+
+    Args:
+        text: Text to embed
+        dim: Vector dimension
+
+    Returns:
+        L2-normalized float32 vector
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    features = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+    vector = np.zeros(dim, dtype=np.float32)
+    for feature in features:
+        vector[zlib.crc32(feature.encode('utf-8')) % dim] += 1.0
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+class SimLRUCache:
+    """
+    LRU cache keyed by embedding similarity.
+
+    Each embedding gets a 64-bit random-projection signature split into
+    bands; entries sharing any band are candidates, and a candidate is a hit
+    when it has the same scope and cosine similarity >= threshold.
+    """
+
+    def __init__(self,
+                 capacity: int = 512,
+                 threshold: float = 0.95,
+                 dim: int = 1024,
+                 n_planes: int = 64,
+                 n_bands: int = 8,
+                 max_age: timedelta = timedelta(minutes=10),
+                 seed: int = 0):
+        self.capacity = capacity
+        self.threshold = threshold
+        self.dim = dim
+        self.n_bands = n_bands
+        self.band_size = n_planes // n_bands
+        self.max_age = max_age
+
+        self._planes = np.random.default_rng(seed).standard_normal((n_planes, dim)).astype(np.float32)
+        self._band_weights = (1 << np.arange(self.band_size)).astype(np.int64)
+
+        # key -> (embedding, scope, created_at, bands, value), most recent first
+        self._entries: "OrderedDict[int, Tuple[np.ndarray, Hashable, datetime, Tuple[int, ...], Any]]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, int], Set[int]] = {}
+        self._next_key = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def _bands(self, embedding: np.ndarray) -> Tuple[int, ...]:
+        """LSH band values for an embedding"""
+        bits = (self._planes @ embedding > 0).astype(np.int64).reshape(self.n_bands, self.band_size)
+        return tuple(int(v) for v in bits @ self._band_weights)
+
+    def _remove(self, key: int):
+        _, _, _, bands, _ = self._entries.pop(key)
+        for band_index, band_value in enumerate(bands):
+            bucket = self._buckets.get((band_index, band_value))
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[(band_index, band_value)]
+
+    def get(self, embedding: np.ndarray, scope: Hashable = None) -> Optional[Any]:
+        """Return the cached value for a similar embedding in the same scope, or None"""
+
+        now = datetime.now()
+        candidates = set()
+        for band_index, band_value in enumerate(self._bands(embedding)):
+            candidates.update(self._buckets.get((band_index, band_value), ()))
+
+        best_key, best_score = None, self.threshold
+        for key in candidates:
+            cached_embedding, cached_scope, created_at, _, _ = self._entries[key]
+            if cached_scope != scope:
+                continue
+            if now - created_at > self.max_age:
+                self._remove(key)
+                continue
+            score = float(cached_embedding @ embedding)
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(best_key, last=False)
+        self.hits += 1
+        return self._entries[best_key][4]
+
+    def put(self, embedding: np.ndarray, value: Any, scope: Hashable = None):
+        """Insert a value at the front, evicting the least recently used entry if full"""
+
+        key = self._next_key
+        self._next_key += 1
+
+        bands = self._bands(embedding)
+        self._entries[key] = (embedding, scope, datetime.now(), bands, value)
+        self._entries.move_to_end(key, last=False)
+        for band_index, band_value in enumerate(bands):
+            self._buckets.setdefault((band_index, band_value), set()).add(key)
+
+        while len(self._entries) > self.capacity:
+            self._remove(next(reversed(self._entries)))
+
+    def clear(self):
+        """Drop all cached entries"""
+        self._entries.clear()
+        self._buckets.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total > 0 else 0.0
+        }
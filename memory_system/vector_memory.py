@@ -17,6 +17,8 @@ from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from collections import OrderedDict
+import copy
 import json
 import uuid
 import logging
@@ -39,6 +41,10 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# Number of text embeddings kept in memory; the same text is typically
+# embedded for duplicate detection, insertion and relationship linking
+EMBEDDING_CACHE_SIZE = 1024
+
 
 class VectorMemoryType(Enum):
     """Types of vector memories"""
@@ -138,6 +144,8 @@ class EnhancedVectorMemory:
         # Initialize ChromaDB
         self.chroma_client = None
         self.collection = None
+        self.embedding_function = None
+        self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
         
         if CHROMADB_AVAILABLE:
             self._init_chromadb(collection_name)
@@ -145,6 +153,11 @@ class EnhancedVectorMemory:
         # In-memory cache for performance
         self.memory_cache: Dict[str, VectorMemory] = {}
         
+        # Bumped on every metadata save (every mutation path saves) so
+        # insights can be cached
+        self.version = 0
+        self._insights_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        
         # Load existing memories
         self._load_memory_metadata()
     
@@ -175,6 +188,8 @@ class EnhancedVectorMemory:
                     model_name="all-MiniLM-L6-v2"
                 )
             
+            self.embedding_function = embedding_function
+            
             # Get or create collection
             self.collection = self.chroma_client.get_or_create_collection(
                 name=collection_name,
@@ -188,6 +203,34 @@ class EnhancedVectorMemory:
             self.logger.error(f"Failed to initialize ChromaDB: {e}")
             self.chroma_client = None
     
+    def embed_text(self, text: str) -> Optional[List[float]]:
+        """
+        Embed text with the collection's embedding function, reusing cached vectors.
+        
+        Returns:
+            The embedding, or None if no embedding function is available
+        """
+        
+        cached = self._embedding_cache.get(text)
+        if cached is not None:
+            self._embedding_cache.move_to_end(text)
+            return cached
+        
+        if self.embedding_function is None:
+            return None
+        
+        try:
+            embedding = list(self.embedding_function([text])[0])
+        except Exception as e:
+            self.logger.warning(f"Embedding failed, falling back to text query: {e}")
+            return None
+        
+        self._embedding_cache[text] = embedding
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        
+        return embedding
+    
     def _load_memory_metadata(self):
         """Load memory metadata from storage"""
         metadata_file = self.storage_dir / "memory_metadata.json"
@@ -225,11 +268,12 @@ class EnhancedVectorMemory:
     
     def _save_memory_metadata(self):
         """Save memory metadata to storage"""
+        self.version += 1
         metadata_file = self.storage_dir / "memory_metadata.json"
         
         try:
             data = {
-                'memories': [memory.to_dict() for memory in self.memory_cache.values()],
+                'memories': [memory.to_dict() for memory in list(self.memory_cache.values())],
                 'last_updated': datetime.now().isoformat(),
                 'total_count': len(self.memory_cache)
             }
@@ -279,8 +323,11 @@ class EnhancedVectorMemory:
             decision_outcome=decision_outcome
         )
         
+        # Embed once for the duplicate check, insertion and relationship linking
+        embedding = self.embed_text(content)
+        
         # Check for similar existing memories to avoid duplication
-        similar_memories = self.search_similar(content, threshold=0.9, limit=3)
+        similar_memories = self.search_similar(content, threshold=0.9, limit=3, query_embedding=embedding)
         
         if similar_memories:
             # If very similar memory exists, update it instead of creating new
@@ -300,7 +347,8 @@ class EnhancedVectorMemory:
                     'source_reasoning_mode': source_reasoning_mode or '',
                     **(metadata or {})
                 }],
-                ids=[memory_id]
+                ids=[memory_id],
+                **({'embeddings': [embedding]} if embedding is not None else {})
             )
             
             # Add to cache
@@ -310,7 +358,7 @@ class EnhancedVectorMemory:
             self._save_memory_metadata()
             
             # Find and link related memories
-            self._link_related_memories(memory_id, content)
+            self._link_related_memories(memory_id, content, embedding)
             
             self.logger.info(f"Added {memory_type.value} memory: {content[:50]}...")
             return memory_id
@@ -322,11 +370,10 @@ class EnhancedVectorMemory:
     def _update_existing_memory(self, existing_id: str, new_content: str, new_memory: VectorMemory) -> str:
         """Update existing similar memory instead of creating duplicate"""
         
-        if existing_id not in self.memory_cache:
+        existing_memory = self.memory_cache.get(existing_id)
+        if existing_memory is None:
             return None
         
-        existing_memory = self.memory_cache[existing_id]
-        
         # Combine content
         combined_content = f"{existing_memory.content}\n\nAdditional context: {new_content}"
         
@@ -349,30 +396,36 @@ class EnhancedVectorMemory:
         
         return existing_id
     
-    def _link_related_memories(self, memory_id: str, content: str):
+    def _link_related_memories(self, memory_id: str, content: str, embedding: List[float] = None):
         """Find and link related memories"""
         
         # Find semantically similar memories
-        similar_memories = self.search_similar(content, threshold=0.7, limit=5)
+        similar_memories = self.search_similar(content, threshold=0.7, limit=5, query_embedding=embedding)
         
-        memory = self.memory_cache[memory_id]
+        memory = self.memory_cache.get(memory_id)
+        if memory is None:
+            return
         
         for similar in similar_memories:
             if similar['id'] != memory_id:
                 # Link both ways
                 memory.related_memories.append(similar['id'])
                 
-                if similar['id'] in self.memory_cache:
-                    related_memory = self.memory_cache[similar['id']]
+                related_memory = self.memory_cache.get(similar['id'])
+                if related_memory is not None:
                     if memory_id not in related_memory.related_memories:
                         related_memory.related_memories.append(memory_id)
+        
+        # Links are edited in place after the last save
+        self.version += 1
     
     def search_similar(self, 
                       query: str,
                       memory_types: List[VectorMemoryType] = None,
                       threshold: float = 0.5,
                       limit: int = 10,
-                      boost_recent: bool = True) -> List[Dict[str, Any]]:
+                      boost_recent: bool = True,
+                      query_embedding: List[float] = None) -> List[Dict[str, Any]]:
         """
         Search for semantically similar memories.
         
@@ -382,6 +435,7 @@ class EnhancedVectorMemory:
             threshold: Minimum similarity threshold
             limit: Maximum results
             boost_recent: Boost recently accessed memories
+            query_embedding: Precomputed embedding of query, if the caller has one
             
         Returns:
             List of similar memories with scores
@@ -397,11 +451,19 @@ class EnhancedVectorMemory:
                 type_values = [mt.value for mt in memory_types]
                 where_clause = {"memory_type": {"$in": type_values}}
             
+            if query_embedding is None:
+                query_embedding = self.embed_text(query)
+            
             # Search in ChromaDB
+            if query_embedding is not None:
+                query_args = {'query_embeddings': [query_embedding]}
+            else:
+                query_args = {'query_texts': [query]}
+            
             results = self.collection.query(
-                query_texts=[query],
                 n_results=limit * 2,  # Get more results for filtering
-                where=where_clause
+                where=where_clause,
+                **query_args
             )
             
             # Process results
@@ -471,7 +533,8 @@ class EnhancedVectorMemory:
                                query: str,
                                reasoning_mode: str = None,
                                current_state: Dict[str, Any] = None,
-                               limit: int = 5) -> List[Dict[str, Any]]:
+                               limit: int = 5,
+                               query_embedding: List[float] = None) -> List[Dict[str, Any]]:
         """
         Get memories relevant to current context and reasoning mode.
         
@@ -492,7 +555,7 @@ class EnhancedVectorMemory:
             preferred_types = [VectorMemoryType.PREFERENCE, VectorMemoryType.RELATIONSHIP]
         
         # Get base similar memories
-        all_memories = self.search_similar(query, limit=limit*2)
+        all_memories = self.search_similar(query, limit=limit*2, query_embedding=query_embedding)
         
         # Score memories based on context
         contextual_memories = []
@@ -551,43 +614,68 @@ class EnhancedVectorMemory:
         
         return boost
     
+    def _embedding_matrix(self, memory_ids: List[str]) -> Tuple[List[str], Optional[np.ndarray]]:
+        """
+        Load stored embeddings as one contiguous matrix.
+        
+        Returns:
+            (ids, vectors): ids that have an embedding, and a parallel
+            (N, d) float32 matrix of L2-normalized rows (None if empty)
+        """
+        
+        if not memory_ids:
+            return [], None
+        
+        stored = self.collection.get(ids=memory_ids, include=['embeddings'])
+        embeddings = stored.get('embeddings')
+        if embeddings is None or len(embeddings) == 0:
+            return [], None
+        
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return list(stored['ids']), vectors / norms
+    
     def consolidate_memories(self, similarity_threshold: float = 0.8):
         """
         Consolidate very similar memories to reduce redundancy.
         
         This prevents the memory system from becoming cluttered with
-        near-duplicate memories.
+        near-duplicate memories. All pairwise similarities come from a
+        single matrix product over the stored embeddings; each memory is
+        merged with its most similar remaining memory above the threshold.
+        
+        similarity_threshold is on search_similar's scale, 1 - squared L2
+        distance, which for normalized embeddings is 2 * cosine - 1 (the
+        default 0.8 means cosine > 0.9).
         """
         
         if not self.collection:
             return
         
-        consolidated_count = 0
-        memory_ids = list(self.memory_cache.keys())
+        memory_ids, vectors = self._embedding_matrix(list(self.memory_cache.keys()))
+        if vectors is None:
+            return 0
+        
+        # Cosine similarities, mapped to search_similar's 1 - squared L2 scale
+        similarities = 2 * (vectors @ vectors.T) - 1
+        np.fill_diagonal(similarities, -np.inf)
+        alive = np.ones(len(memory_ids), dtype=bool)
         
+        consolidated_count = 0
         for i, memory_id in enumerate(memory_ids):
-            if memory_id not in self.memory_cache:
+            if not alive[i] or memory_id not in self.memory_cache:
                 continue  # Already consolidated
             
-            memory = self.memory_cache[memory_id]
-            
-            # Find very similar memories
-            similar = self.search_similar(
-                memory.content,
-                threshold=similarity_threshold,
-                limit=5
-            )
+            # Most similar memory that has not been merged away
+            scores = np.where(alive, similarities[i], -np.inf)
+            best = int(np.argmax(scores))
+            if scores[best] <= similarity_threshold or memory_ids[best] not in self.memory_cache:
+                continue
             
-            # Consolidate with most similar
-            for similar_memory in similar:
-                if (similar_memory['id'] != memory_id and 
-                    similar_memory['id'] in self.memory_cache and
-                    similar_memory['score'] > similarity_threshold):
-                    
-                    # Merge memories
-                    self._merge_memories(memory_id, similar_memory['id'])
-                    consolidated_count += 1
-                    break
+            self._merge_memories(memory_id, memory_ids[best])
+            alive[best] = False
+            consolidated_count += 1
         
         if consolidated_count > 0:
             self.logger.info(f"Consolidated {consolidated_count} similar memories")
@@ -597,8 +685,10 @@ class EnhancedVectorMemory:
     def _merge_memories(self, primary_id: str, secondary_id: str):
         """Merge two similar memories"""
         
-        primary = self.memory_cache[primary_id]
-        secondary = self.memory_cache[secondary_id]
+        primary = self.memory_cache.get(primary_id)
+        secondary = self.memory_cache.get(secondary_id)
+        if primary is None or secondary is None:
+            return
         
         # Combine content
         combined_content = f"{primary.content}\n\nRelated: {secondary.content}"
@@ -628,7 +718,7 @@ class EnhancedVectorMemory:
         
         # Remove secondary memory
         self.collection.delete(ids=[secondary_id])
-        del self.memory_cache[secondary_id]
+        self.memory_cache.pop(secondary_id, None)
         
         self._save_memory_metadata()
     
@@ -642,7 +732,7 @@ class EnhancedVectorMemory:
         cutoff_date = datetime.now() - timedelta(days=days_threshold)
         decayed_count = 0
         
-        for memory in self.memory_cache.values():
+        for memory in list(self.memory_cache.values()):
             # Skip recently accessed memories
             if memory.last_accessed and memory.last_accessed > cutoff_date:
                 continue
@@ -670,8 +760,14 @@ class EnhancedVectorMemory:
         if not self.memory_cache:
             return {"message": "No memories stored"}
         
+        if self._insights_cache is not None and self._insights_cache[0] == self.version:
+            return copy.deepcopy(self._insights_cache[1])
+        
+        # One snapshot, so maintenance threads can remove memories meanwhile
+        memories = list(self.memory_cache.values())
+        
         insights = {
-            "total_memories": len(self.memory_cache),
+            "total_memories": len(memories),
             "by_type": {},
             "by_reasoning_mode": {},
             "access_patterns": {},
@@ -680,7 +776,7 @@ class EnhancedVectorMemory:
         }
         
         # Count by type
-        for memory in self.memory_cache.values():
+        for memory in memories:
             mem_type = memory.memory_type.value
             insights["by_type"][mem_type] = insights["by_type"].get(mem_type, 0) + 1
             
@@ -690,7 +786,7 @@ class EnhancedVectorMemory:
                 insights["by_reasoning_mode"][mode] = insights["by_reasoning_mode"].get(mode, 0) + 1
         
         # Access patterns
-        accessed_memories = [m for m in self.memory_cache.values() if m.access_count > 0]
+        accessed_memories = [m for m in memories if m.access_count > 0]
         if accessed_memories:
             avg_access = sum(m.access_count for m in accessed_memories) / len(accessed_memories)
             most_accessed = max(accessed_memories, key=lambda x: x.access_count)
@@ -703,14 +799,14 @@ class EnhancedVectorMemory:
             }
         
         # Relationship network
-        total_links = sum(len(m.related_memories) for m in self.memory_cache.values())
+        total_links = sum(len(m.related_memories) for m in memories)
         insights["relationship_network"] = {
             "total_links": total_links,
-            "average_links_per_memory": total_links / len(self.memory_cache) if self.memory_cache else 0
+            "average_links_per_memory": total_links / len(memories) if memories else 0
         }
         
         # Quality metrics
-        memories_with_outcomes = [m for m in self.memory_cache.values() if m.decision_outcome is not None]
+        memories_with_outcomes = [m for m in memories if m.decision_outcome is not None]
         if memories_with_outcomes:
             avg_outcome = sum(m.decision_outcome for m in memories_with_outcomes) / len(memories_with_outcomes)
             insights["quality_metrics"] = {
@@ -718,14 +814,16 @@ class EnhancedVectorMemory:
                 "average_decision_satisfaction": avg_outcome
             }
         
-        return insights
+        self._insights_cache = (self.version, insights)
+        
+        return copy.deepcopy(insights)
     
     def cleanup_low_quality_memories(self, min_relevance: float = 0.2, min_confidence: float = 0.3):
         """Remove low-quality memories"""
         
         to_remove = []
         
-        for memory_id, memory in self.memory_cache.items():
+        for memory_id, memory in list(self.memory_cache.items()):
             if (memory.relevance_score < min_relevance and 
                 memory.confidence < min_confidence and
                 memory.access_count == 0):
@@ -736,7 +834,7 @@ class EnhancedVectorMemory:
             self.collection.delete(ids=to_remove)
             
             for memory_id in to_remove:
-                del self.memory_cache[memory_id]
+                self.memory_cache.pop(memory_id, None)
             
             self._save_memory_metadata()
             self.logger.info(f"Cleaned up {len(to_remove)} low-quality memories")
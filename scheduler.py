@@ -9,8 +9,9 @@ For production, you might want to use APScheduler or Celery.
 """
 
 import asyncio
+import inspect
 import logging
-from typing import Dict, Callable, Optional, Any, List
+from typing import Dict, Callable, Optional, Any, Iterator, List
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -191,12 +192,12 @@ class TwinScheduler:
         self.logger.info(f"Executing scheduled action {action.id}")
         
         try:
-            # Execute callback
+            # Execute callback; coroutine functions and factories returning a
+            # coroutine (e.g. a lambda) are awaited in place, without a Task hop
             if action.callback:
-                if asyncio.iscoroutinefunction(action.callback):
-                    result = await action.callback(**action.params)
-                else:
-                    result = action.callback(**action.params)
+                result = action.callback(**action.params)
+                if inspect.isawaitable(result):
+                    result = await result
                 
                 self.logger.info(f"Action {action.id} executed successfully")
             
@@ -265,6 +266,17 @@ class TwinScheduler:
             actions = [a for a in actions if a.active]
         return sorted(actions, key=lambda x: x.next_execution or datetime.max)
     
+    def iter_scheduled_actions(self, active_only: bool = True) -> Iterator[ScheduledAction]:
+        """
+        Iterate scheduled actions in scheduling order, without copying or sorting.
+        
+        Consume the iterator without awaiting in between, since the monitor
+        loop removes finished actions from the underlying store.
+        """
+        for action in self.scheduled_actions.values():
+            if action.active or not active_only:
+                yield action
+    
     async def _monitor_scheduled_actions(self):
         """Monitor and clean up completed actions periodically"""
         while self._running:
@@ -301,7 +313,7 @@ class TwinScheduler:
         Args:
             action_id: Unique identifier
             time_of_day: Time in HH:MM format
-            callback: Function to call
+            callback: Function or coroutine factory to call; awaitable results are awaited
             params: Parameters for callback
             days: List of days (Mon, Tue, etc.) - None means every day
         
@@ -372,8 +384,7 @@ if __name__ == "__main__":
         await asyncio.sleep(10)
         
         # Show scheduled actions
-        actions = scheduler.get_scheduled_actions()
-        for action in actions:
+        for action in scheduler.iter_scheduled_actions():
             print(f"Scheduled: {action.id} at {action.next_execution}")
         
         await scheduler.stop()
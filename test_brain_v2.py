@@ -10,6 +10,7 @@ This script demonstrates the advanced reasoning capabilities:
 """
 
 import asyncio
+import logging
 import os
 from datetime import datetime
 from dotenv import load_dotenv
@@ -268,4 +269,5 @@ async def run_all_tests():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(run_all_tests())
\ No newline at end of file
@@ -13,7 +13,10 @@ Tests:
 5. Goal-aware reasoning
 """
 
+import gzip
+import json
 import logging
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -27,6 +30,10 @@ def test_goal_system_basics():
     print("🎯 Testing Goal System Basics")
     print("=" * 50)
     
+    # Goal storage goes to a scratch directory, so runs leave no logs or
+    # snapshots behind
+    storage = tempfile.TemporaryDirectory()
+    
     try:
         # Test 1: Import goal system components
         print("\n📋 Test 1: Goal System Imports")
@@ -40,9 +47,7 @@ def test_goal_system_basics():
         # Test 2: Initialize Goal System
         print("\n🏗️ Test 2: Goal System Initialization")
         
-        # Create test directory
-        test_dir = Path("test_goal_basic")
-        test_dir.mkdir(exist_ok=True)
+        test_dir = Path(storage.name)
         
         # Initialize goal system (without AI interface for now)
         goal_manager = GoalManager(storage_dir=str(test_dir), ai_interface=None)
@@ -241,12 +246,162 @@ def test_goal_system_basics():
         print(f"❌ Test failed: {e}")
         logger.exception("Basic goal test error")
         return False
+    
+    finally:
+        storage.cleanup()
+
+def test_goal_storage_round_trip():
+    """Test that goals and milestones survive reloads, compaction and old formats"""
+    
+    print("💾 Testing Goal Storage Round-Trip")
+    print("=" * 50)
+    
+    from goal_system import goal_manager as gm_module
+    from goal_system.goal_manager import GoalManager, GoalType, GoalStatus, Milestone
+    
+    def create_sample(manager):
+        goal = manager.create_goal(
+            title="Ship storage layer",
+            description="Persist goals across restarts",
+            target_date=datetime.now() + timedelta(weeks=2),
+            goal_type=GoalType.PROJECT,
+            priority=2,
+            related_apps=["VS Code"]
+        )
+        milestone = Milestone(
+            id="",  # Auto-generated
+            title="Write round-trip test",
+            description="Cover reload, compaction and legacy files",
+            goal_id=goal.id,
+            target_date=datetime.now() + timedelta(days=3),
+            estimated_effort_hours=2,
+            depends_on=["milestone_elsewhere"]
+        )
+        manager.milestones[milestone.id] = milestone
+        goal.milestone_ids = [milestone.id]
+        milestone.update_progress(50.0, "Halfway")
+        return goal, milestone
+    
+    def assert_reloads(storage_dir, goal, milestone):
+        reloaded = GoalManager(storage_dir=storage_dir, ai_interface=None)
+        assert reloaded.goals[goal.id].to_dict() == goal.to_dict()
+        assert reloaded.milestones[milestone.id].to_dict() == milestone.to_dict()
+        assert reloaded.milestones[milestone.id].status is milestone.status
+        return reloaded
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Test 1: Create, then reload from the snapshot plus log
+        print("\n🔁 Test 1: Create and Reload")
+        
+        storage_dir = str(Path(tmp) / "create")
+        manager = GoalManager(storage_dir=storage_dir, ai_interface=None)
+        goal, milestone = create_sample(manager)
+        manager.flush()
+        assert_reloads(storage_dir, goal, milestone)
+        print("✅ Goal and milestone reloaded unchanged")
+        
+        # Test 2: Compaction folds the logs into gzipped snapshots
+        print("\n🗜️ Test 2: Log Compaction")
+        
+        original_min_bytes = gm_module.LOG_COMPACTION_MIN_BYTES
+        gm_module.LOG_COMPACTION_MIN_BYTES = 0
+        try:
+            goal.priority = 1
+            manager.flush()
+        finally:
+            gm_module.LOG_COMPACTION_MIN_BYTES = original_min_bytes
+        
+        for store in ("goals", "milestones"):
+            assert (Path(storage_dir) / f"{store}.json.gz").exists()
+            assert (Path(storage_dir) / f"{store}.log").stat().st_size == 0
+        assert_reloads(storage_dir, goal, milestone)
+        print("✅ Snapshots written, logs truncated, contents preserved")
+        
+        # Test 3: Uncompressed goals.json from before gzip storage
+        print("\n📦 Test 3: Legacy goals.json Migration")
+        
+        legacy_dir = Path(tmp) / "legacy"
+        legacy_dir.mkdir()
+        (legacy_dir / "goals.json").write_text(json.dumps([goal.to_dict()]))
+        (legacy_dir / "milestones.json").write_text(json.dumps([milestone.to_dict()]))
+        
+        migrated = assert_reloads(str(legacy_dir), goal, milestone)
+        migrated._compact()
+        assert not (legacy_dir / "goals.json").exists()
+        with gzip.open(legacy_dir / "goals.json.gz", 'rt', encoding='utf-8') as f:
+            assert json.load(f) == [goal.to_dict()]
+        assert_reloads(str(legacy_dir), goal, milestone)
+        print("✅ Legacy snapshot read and replaced by goals.json.gz")
+        
+        # Test 4: Stdlib json when orjson is not installed
+        print("\n🐍 Test 4: JSON Fallback Without orjson")
+        
+        original = (gm_module.ORJSON_AVAILABLE, gm_module._loads)
+        gm_module.ORJSON_AVAILABLE, gm_module._loads = False, json.loads
+        try:
+            fallback_dir = str(Path(tmp) / "fallback")
+            fallback_manager = GoalManager(storage_dir=fallback_dir, ai_interface=None)
+            fallback_goal, fallback_milestone = create_sample(fallback_manager)
+            fallback_manager.flush()
+            assert_reloads(fallback_dir, fallback_goal, fallback_milestone)
+        finally:
+            gm_module.ORJSON_AVAILABLE, gm_module._loads = original
+        
+        # Files written by the fallback stay readable with orjson
+        assert_reloads(fallback_dir, fallback_goal, fallback_milestone)
+        print("✅ Stdlib json round-trip matches")
+        
+        # Test 5: A torn last log line is skipped
+        print("\n✂️ Test 5: Torn Last Log Line")
+        
+        torn_dir = str(Path(tmp) / "torn")
+        torn_manager = GoalManager(storage_dir=torn_dir, ai_interface=None)
+        torn_goal, torn_milestone = create_sample(torn_manager)
+        torn_manager.flush()
+        with open(Path(torn_dir) / "goals.log", 'ab') as f:
+            f.write(b'{"op":"upsert","id":"goal_torn","obj":{"id":"goal_to')
+        
+        reloaded = assert_reloads(torn_dir, torn_goal, torn_milestone)
+        assert "goal_torn" not in reloaded.goals
+        assert len(reloaded.goals) == 1
+        print("✅ Torn line skipped, earlier upserts kept")
+        
+        # Test 6: Edits made after creation are logged without an explicit save
+        print("\n✏️ Test 6: In-Place Edits Persist")
+        
+        edits_dir = str(Path(tmp) / "edits")
+        edits_manager = GoalManager(storage_dir=edits_dir, ai_interface=None)
+        edited_goal, edited_milestone = create_sample(edits_manager)
+        edited_goal.status = GoalStatus.ACTIVE
+        edited_milestone.status = GoalStatus.ACTIVE
+        edits_manager.update_progress_from_observer({
+            'app_usage': {"VS Code": 3600},
+            'productive_hours': [9, 10]
+        })
+        edited_goal.add_related_app("Terminal")
+        edits_manager.create_goal(
+            title="Second goal",
+            description="Created after the edits",
+            target_date=datetime.now() + timedelta(weeks=1)
+        )
+        
+        reloaded = assert_reloads(edits_dir, edited_goal, edited_milestone)
+        reloaded_goal = reloaded.goals[edited_goal.id]
+        assert reloaded_goal.status is GoalStatus.ACTIVE
+        assert reloaded_goal.related_apps == ["VS Code", "Terminal"]
+        assert reloaded_goal.activity_patterns['app_time_tracking'] == {"VS Code": 3600}
+        assert reloaded.milestones[edited_milestone.id].status is GoalStatus.COMPLETED
+        print("✅ Status, related apps, observer time and progress reloaded")
+    
+    print("\n🚀 Goal storage round-trip verified!")
+
 
 if __name__ == "__main__":
     print("🚀 Starting Basic Goal System Test")
     print("=" * 60)
     
     success = test_goal_system_basics()
+    test_goal_storage_round_trip()
     
     if success:
         print("\n🎉 BASIC GOAL SYSTEM TEST PASSED!")
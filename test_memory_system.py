@@ -10,6 +10,7 @@ This script demonstrates the complete memory-enhanced digital twin:
 """
 
 import asyncio
+import logging
 import os
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -130,7 +131,7 @@ async def test_memory_retrieval(twin: DigitalTwinV3):
     
     for question in questions:
         print(f"\n💭 Question: {question}")
-        answer = twin.ask_memory(question)
+        answer = await twin.ask_memory(question)
         print(f"🧠 Memory response: {answer[:200]}...")
 
 
@@ -146,7 +147,7 @@ async def test_introspection_with_memory(twin: DigitalTwinV3):
     
     for question in introspection_questions:
         print(f"\n🤔 Deep question: {question}")
-        insight = twin.introspect_with_memory(question)
+        insight = await twin.introspect_with_memory(question)
         print(f"🧠 Deep insight: {insight[:300]}...")
 
 
@@ -204,7 +205,7 @@ async def test_pattern_extraction(twin: DigitalTwinV3):
     
     # Trigger pattern extraction
     print("\n🧠 Extracting behavioral patterns...")
-    maintenance_stats = twin.maintain_memory_system()
+    maintenance_stats = await twin.maintain_memory_system()
     
     print(f"Maintenance results: {maintenance_stats}")
     
@@ -234,7 +235,7 @@ async def test_memory_consolidation(twin: DigitalTwinV3):
     
     # Run memory maintenance
     print("\n🧹 Running memory maintenance...")
-    maintenance_results = twin.maintain_memory_system()
+    maintenance_results = await twin.maintain_memory_system()
     
     print("Memory system after consolidation:")
     after_stats = twin.get_memory_summary()
@@ -359,4 +360,5 @@ async def run_comprehensive_memory_tests():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     asyncio.run(run_comprehensive_memory_tests())
\ No newline at end of file
@@ -11,6 +11,8 @@ Supports:
 - Context-aware task retrieval
 """
 
+import bisect
+import heapq
 import json
 import os
 from typing import List, Dict, Any, Optional
@@ -27,6 +29,10 @@ class TaskPriority(Enum):
     LOW = "low"
 
 
+# Sort rank of each priority in pending-task listings (lower first)
+PRIORITY_ORDER = {TaskPriority.HIGH: 0, TaskPriority.NORMAL: 1, TaskPriority.LOW: 2}
+
+
 class TaskStatus(Enum):
     """Task completion status"""
     PENDING = "pending"
@@ -105,6 +111,13 @@ class TaskManagerTool:
         
         # Load tasks from storage
         self.tasks: Dict[str, Task] = {}
+        
+        # Deadline index: sorted (deadline, task_id) entries for dated tasks,
+        # plus insertion-ordered ids of undated tasks. Completed tasks are
+        # dropped lazily when a range scan reaches them.
+        self._by_deadline: List[tuple] = []
+        self._undated: Dict[str, None] = {}
+        
         self._load_tasks()
     
     def _load_tasks(self):
@@ -116,6 +129,7 @@ class TaskManagerTool:
                     for task_data in data:
                         task = Task.from_dict(task_data)
                         self.tasks[task.id] = task
+                        self._index_task(task)
                 self.logger.info(f"Loaded {len(self.tasks)} tasks")
             except Exception as e:
                 self.logger.error(f"Failed to load tasks: {e}")
@@ -129,9 +143,50 @@ class TaskManagerTool:
         except Exception as e:
             self.logger.error(f"Failed to save tasks: {e}")
     
+    def _index_task(self, task: Task):
+        """Add a task to the deadline index (no-op if already indexed)"""
+        if task.deadline is None:
+            self._undated[task.id] = None
+            return
+        
+        entry = (task.deadline, task.id)
+        position = bisect.bisect_left(self._by_deadline, entry)
+        if position == len(self._by_deadline) or self._by_deadline[position] != entry:
+            self._by_deadline.insert(position, entry)
+    
+    def _tasks_due_between(self, start: Optional[datetime], end: datetime) -> List[Task]:
+        """
+        Non-completed dated tasks with start <= deadline < end, in deadline order.
+        
+        Entries for completed, deleted or re-dated tasks are removed from the
+        index as they are encountered; re-dated tasks are re-indexed.
+        """
+        lo = 0 if start is None else bisect.bisect_left(self._by_deadline, (start,))
+        hi = bisect.bisect_left(self._by_deadline, (end,))
+        
+        tasks, stale = [], []
+        for position in range(lo, hi):
+            deadline, task_id = self._by_deadline[position]
+            task = self.tasks.get(task_id)
+            if task is None or task.status == TaskStatus.COMPLETED or task.deadline != deadline:
+                stale.append(position)
+                continue
+            tasks.append(task)
+        
+        # Pop every stale entry before re-indexing so positions stay valid
+        redated = [self.tasks.get(self._by_deadline.pop(position)[1]) for position in reversed(stale)]
+        for task in redated:
+            if task is not None and task.status != TaskStatus.COMPLETED:
+                self._index_task(task)
+                if task.deadline is not None and (start is None or task.deadline >= start) and task.deadline < end:
+                    tasks.append(task)
+        
+        return tasks
+    
     def get_pending_tasks(self, 
                          timeframe: str = "today",
                          include_deadlines: bool = True,
+                         limit: Optional[int] = None,
                          **kwargs) -> List[Dict[str, Any]]:
         """
         Get pending tasks based on criteria.
@@ -139,40 +194,50 @@ class TaskManagerTool:
         Args:
             timeframe: "today", "this_week", "all"
             include_deadlines: Whether to include deadline info
+            limit: Return only the top N tasks by priority and deadline
             
         Returns:
             List of task dictionaries
         """
-        # Filter tasks
-        pending_tasks = [
-            task for task in self.tasks.values()
-            if task.status in [TaskStatus.PENDING, TaskStatus.IN_PROGRESS]
-        ]
+        active = (TaskStatus.PENDING, TaskStatus.IN_PROGRESS)
         
-        # Apply timeframe filter
+        # Dated timeframes slice the deadline index instead of scanning every task
         if timeframe == "today":
-            today = datetime.now().date()
+            today_start = datetime.combine(datetime.now().date(), datetime.min.time())
             pending_tasks = [
-                task for task in pending_tasks
-                if (task.deadline and task.deadline.date() == today) or
-                   (not task.deadline and task.priority == TaskPriority.HIGH)
+                task for task in self._tasks_due_between(today_start, today_start + timedelta(days=1))
+                if task.status in active
             ]
+            pending_tasks.extend(
+                task for task in map(self.tasks.get, self._undated)
+                if task is not None and task.deadline is None
+                and task.status in active and task.priority == TaskPriority.HIGH
+            )
         elif timeframe == "this_week":
+            # Deadline inclusive of week_end, as before
             week_end = datetime.now() + timedelta(days=7)
             pending_tasks = [
-                task for task in pending_tasks
-                if task.deadline and task.deadline <= week_end
+                task for task in self._tasks_due_between(None, week_end + timedelta.resolution)
+                if task.status in active
+            ]
+        else:
+            pending_tasks = [
+                task for task in self.tasks.values()
+                if task.status in active
             ]
         
-        # Sort by priority and deadline
+        # Order by priority, then days until deadline (undated last)
+        now = datetime.now()
+        
         def sort_key(task):
-            priority_order = {TaskPriority.HIGH: 0, TaskPriority.NORMAL: 1, TaskPriority.LOW: 2}
-            deadline_score = 0 if task.deadline else 999
-            if task.deadline:
-                deadline_score = (task.deadline - datetime.now()).days
-            return (priority_order[task.priority], deadline_score)
+            deadline_score = (task.deadline - now).days if task.deadline else 999
+            return (PRIORITY_ORDER[task.priority], deadline_score)
         
-        pending_tasks.sort(key=sort_key)
+        if limit is not None:
+            # Top-k selection keeps a k-sized heap instead of ordering every task
+            pending_tasks = heapq.nsmallest(limit, pending_tasks, key=sort_key)
+        else:
+            pending_tasks.sort(key=sort_key)
         
         # Format for output
         formatted_tasks = []
@@ -186,7 +251,7 @@ class TaskManagerTool:
             
             if include_deadlines and task.deadline:
                 # Format deadline in human-readable way
-                deadline_delta = task.deadline - datetime.now()
+                deadline_delta = task.deadline - now
                 if deadline_delta.days == 0:
                     deadline_str = f"today at {task.deadline.strftime('%I:%M %p')}"
                 elif deadline_delta.days == 1:
@@ -225,6 +290,7 @@ class TaskManagerTool:
         )
         
         self.tasks[task.id] = task
+        self._index_task(task)
         self._save_tasks()
         
         self.logger.info(f"Created task: {task.title}")
@@ -233,12 +299,36 @@ class TaskManagerTool:
     def update_task_status(self, task_id: str, status: str) -> bool:
         """Update task status"""
         if task_id in self.tasks:
-            self.tasks[task_id].status = TaskStatus(status)
-            self.tasks[task_id].updated_at = datetime.now()
+            task = self.tasks[task_id]
+            task.status = TaskStatus(status)
+            task.updated_at = datetime.now()
+            # Reopened tasks may have been dropped from the index while completed
+            if task.status != TaskStatus.COMPLETED:
+                self._index_task(task)
             self._save_tasks()
             return True
         return False
     
+    def update_task_deadline(self, task_id: str, deadline: Optional[datetime]) -> bool:
+        """Change a task's deadline, keeping the deadline index in sync"""
+        if task_id not in self.tasks:
+            return False
+        
+        task = self.tasks[task_id]
+        if task.deadline is not None:
+            entry = (task.deadline, task.id)
+            position = bisect.bisect_left(self._by_deadline, entry)
+            if position < len(self._by_deadline) and self._by_deadline[position] == entry:
+                del self._by_deadline[position]
+        else:
+            self._undated.pop(task.id, None)
+        
+        task.deadline = deadline
+        task.updated_at = datetime.now()
+        self._index_task(task)
+        self._save_tasks()
+        return True
+    
     def complete_task(self, task_id: str) -> bool:
         """Mark task as completed"""
         return self.update_task_status(task_id, TaskStatus.COMPLETED.value)
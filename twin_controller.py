@@ -13,10 +13,13 @@ Key responsibilities:
 """
 
 import asyncio
+import copy
 import json
-from typing import Dict, List, Any, Optional, Callable
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import logging
 from enum import Enum
 
@@ -26,6 +29,10 @@ from memory_system.vector_memory import EnhancedVectorMemory
 from memory_system.memory_retrieval import IntelligentMemoryRetrieval
 from scheduler import TwinScheduler as ActionScheduler
 
+# Plan skeletons kept for repeated requests, and how long one stays reusable
+PLAN_CACHE_SIZE = 256
+PLAN_CACHE_MAX_AGE = timedelta(hours=24)
+
 
 class ActionStatus(Enum):
     """Status of an action execution"""
@@ -106,6 +113,11 @@ class MemoryAwareController:
         # Action learning and optimization
         self.action_patterns = {}  # Cached successful action patterns
         
+        # Plan skeletons for repeated requests (recurring reminders), keyed on
+        # the exact whitespace-normalized request and its context, since step
+        # params (recipients, bodies, numbers) are bound from the request text
+        self.plan_cache: "OrderedDict[Tuple[str, str], Tuple[datetime, ActionPlan]]" = OrderedDict()
+        
         # Setup logging
         self.logger = logging.getLogger(__name__)
         logging.basicConfig(level=logging.INFO)
@@ -137,6 +149,17 @@ class MemoryAwareController:
         - "Check my calendar and summarize tomorrow's meetings"
         """
         
+        # Repeated requests reuse a previously validated plan skeleton
+        cache_key = (" ".join(request.split()), json.dumps(context or {}, sort_keys=True, default=str))
+        skeleton = self._cached_plan_skeleton(cache_key)
+        if skeleton is not None and self._validate_plan(skeleton):
+            plan = self._plan_from_skeleton(skeleton, request, context)
+            self.logger.info(f"Reusing cached plan skeleton for: {request[:50]}")
+            self.active_plans[plan.id] = plan
+            await self._capture_planning_memory(request, plan, None)
+            await self._dispatch_plan(plan)
+            return plan
+        
         # Step 1: Enhanced reasoning with memory system
         situation = Situation(
             context=request,
@@ -167,14 +190,51 @@ class MemoryAwareController:
         # Step 4: Store plan and capture planning decision
         self.active_plans[plan.id] = plan
         await self._capture_planning_memory(request, plan, brain_response)
+        # Cache a copy taken before execution adds '_context' to step params
+        self._cache_plan_skeleton(cache_key, replace(plan, steps=copy.deepcopy(plan.steps)))
         
         # Step 5: Execute or schedule
+        await self._dispatch_plan(plan)
+        
+        return plan
+    
+    async def _dispatch_plan(self, plan: ActionPlan):
+        """Execute a plan now, or schedule it if it has a future time"""
         if plan.scheduled_time and plan.scheduled_time > datetime.now():
             await self._schedule_plan(plan)
         else:
             await self._execute_plan(plan)
-        
-        return plan
+    
+    def _cached_plan_skeleton(self, cache_key: Tuple[str, str]) -> Optional[ActionPlan]:
+        """Cached plan skeleton for exactly this request and context, if still fresh"""
+        entry = self.plan_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        cached_at, skeleton = entry
+        if datetime.now() - cached_at > PLAN_CACHE_MAX_AGE:
+            del self.plan_cache[cache_key]
+            return None
+        
+        self.plan_cache.move_to_end(cache_key)
+        return skeleton
+    
+    def _cache_plan_skeleton(self, cache_key: Tuple[str, str], skeleton: ActionPlan):
+        """Remember a validated plan skeleton, evicting the least recently used"""
+        self.plan_cache[cache_key] = (datetime.now(), skeleton)
+        self.plan_cache.move_to_end(cache_key)
+        if len(self.plan_cache) > PLAN_CACHE_SIZE:
+            self.plan_cache.popitem(last=False)
+    
+    def _plan_from_skeleton(self, skeleton: ActionPlan, request: str, context: Dict[str, Any] = None) -> ActionPlan:
+        """Copy a cached plan with a fresh id, request, context and scheduled time"""
+        return ActionPlan(
+            id=str(uuid.uuid4()),
+            intent=request,
+            steps=copy.deepcopy(skeleton.steps),
+            context=context or {},
+            scheduled_time=self._parse_time_from_request(request) if skeleton.scheduled_time else None
+        )
     
     async def _create_memory_enhanced_plan(self, request: str, brain_response, context: Dict[str, Any] = None) -> ActionPlan:
         """
@@ -182,7 +242,6 @@ class MemoryAwareController:
         
         This is where we parse intents and structure multi-step actions.
         """
-        import uuid
         
         # Parse the request with memory-enhanced intelligence
         plan_id = str(uuid.uuid4())
@@ -327,7 +386,7 @@ class MemoryAwareController:
         self.scheduler.schedule_action(
             action_id=plan.id,
             delay_seconds=delay,
-            callback=lambda: asyncio.create_task(self._execute_plan(plan))
+            callback=lambda: self._execute_plan(plan)
         )
         
         plan.status = ActionStatus.SCHEDULED
@@ -473,7 +532,7 @@ class MemoryAwareController:
         """Find similar successful action patterns from memory"""
         
         # Use the twin's memory system to find similar requests
-        similar_memories = self.twin.ask_memory(
+        similar_memories = await self.twin.ask_memory(
             f"What happened when I handled requests similar to: {request}?"
         )
         
@@ -499,7 +558,7 @@ class MemoryAwareController:
                 return False
         
         # Memory-based validation: check if similar plans failed before
-        failure_patterns = self.twin.ask_memory(
+        failure_patterns = await self.twin.ask_memory(
             f"Did plans similar to '{plan.intent}' ever fail? What went wrong?"
         )
         
@@ -642,7 +701,7 @@ class MemoryAwareController:
         """Optimize controller behavior based on memory patterns"""
         
         # Ask the twin for insights about action patterns
-        optimization_insights = self.twin.introspect_with_memory(
+        optimization_insights = await self.twin.introspect_with_memory(
             "What patterns do you see in my action planning and execution? What could be improved?"
         )
         
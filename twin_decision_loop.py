@@ -546,7 +546,7 @@ class UnifiedTwinDecisionLoop:
         """Process introspection and self-analysis requests"""
         
         # Use brain's introspection capabilities
-        insights = self.brain.introspect_with_memory(request.content)
+        insights = await self.brain.introspect_with_memory(request.content)
         
         result = TwinResult(
             request_id=request_id,
@@ -728,7 +728,7 @@ class UnifiedTwinDecisionLoop:
     async def ask_memory(self, question: str) -> str:
         """Direct memory query interface"""
         
-        return self.brain.ask_memory(question)
+        return await self.brain.ask_memory(question)
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
@@ -755,13 +755,13 @@ class UnifiedTwinDecisionLoop:
         self.logger.info("🔧 Running system optimization...")
         
         # Optimize brain memory system
-        maintenance_stats = self.brain.maintain_memory_system()
+        maintenance_stats = await self.brain.maintain_memory_system()
         
         # Optimize controller patterns
         controller_insights = await self.controller.optimize_based_on_memory()
         
         # Extract system-wide insights
-        system_insights = self.brain.introspect_with_memory(
+        system_insights = await self.brain.introspect_with_memory(
             "Analyze the overall performance of the digital twin system. "
             "What patterns do you see in request processing, decision making, and action execution? "
             "What improvements would make the system more effective?"
@@ -911,10 +911,7 @@ class UnifiedTwinDecisionLoop:
                             "progress": m.progress_percentage,
                             "days_remaining": m.days_until_deadline
                         }
-                        for m in goal.get_next_milestones(
-                            list(self.goal_manager.milestones.values()), 
-                            limit=3
-                        )
+                        for m in goal.get_next_milestones(self.goal_manager, limit=3)
                     ]
                 }
             else: